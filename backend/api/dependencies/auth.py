@@ -4,94 +4,427 @@ Authentication dependencies.
 FastAPI dependency functions for handling authentication and authorization.
 """
 
-from typing import Optional
+import asyncio
+import hashlib
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
 
-from backend.core.models.auth import UserResponse
-from backend.db import supabase
+from backend.api.dependencies.rate_limit import (
+    failed_auth_counter,
+    get_client_ip,
+    raise_rate_limited,
+)
+from backend.config import settings
+from backend.core.models.auth import UserIdentity, UserResponse
+from backend.db import get_async_supabase_client, redis
+
+logger = logging.getLogger(__name__)
 
 # Simple HTTP bearer security
 security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
+# Profile columns selected to build a UserResponse / UserIdentity
+_PROFILE_COLS = (
+    "id,email,full_name,university_id,university_email,profile_picture_url,is_verified,created_at"
+)
+_PROFILE_MINIMAL_COLS = "id,is_verified"
+
+# Shortest string accepted as a JWT before any cache or network lookup
+_MIN_TOKEN_LENGTH = 20
+
+# Upper bound (seconds) for caching a resolved user; never outlives the token itself
+USER_CACHE_MAX_TTL = 300
+
+# In-process cache in front of Redis for hot tokens: digest -> (user, token expiry)
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+class ProfileLoader:
+    """
+    Coalesces concurrent profile lookups into batched `id IN (...)` queries.
+
+    IDs requested within a short window (2 ms by default) are fetched together,
+    so a burst of N authenticated requests costs ceil(N / max_batch_size)
+    round-trips instead of N.
+    """
+
+    def __init__(self, columns: str, window: float = 0.002, max_batch_size: int = 100) -> None:
+        self.columns = columns
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def load(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a profile row by user ID, batched with other concurrent loads.
+
+        Args:
+            user_id: User ID to fetch
+
+        Returns:
+            Optional[Dict[str, Any]]: Profile row, or None if not found
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(user_id, []).append(future)
+
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+
+        return await future
+
+    async def _flush(self) -> None:
+        """Wait for the batching window, then fetch every pending ID."""
+        await asyncio.sleep(self._window)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+
+        user_ids = list(pending)
+        batches = [
+            user_ids[i : i + self._max_batch_size]
+            for i in range(0, len(user_ids), self._max_batch_size)
+        ]
+
+        try:
+            client = get_async_supabase_client()
+            responses = await asyncio.gather(
+                *(
+                    client.table("profiles").select(self.columns).in_("id", batch).execute()
+                    for batch in batches
+                )
+            )
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        rows = {row["id"]: row for response in responses for row in response.data or []}
+        for user_id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(rows.get(user_id))
+
+
+# One loader per selected column list
+_profile_loaders: Dict[str, ProfileLoader] = {}
+
+
+def _get_profile_loader(columns: str) -> ProfileLoader:
+    """Get the shared ProfileLoader for a column list."""
+    loader = _profile_loaders.get(columns)
+    if loader is None:
+        loader = _profile_loaders[columns] = ProfileLoader(columns)
+    return loader
+
+
+def _is_well_formed_token(token: str) -> bool:
+    """
+    Cheap structural check that a token could be a JWT (header.payload.signature).
+
+    Rejects empty, truncated or garbage bearer values before any I/O.
+    """
+    return len(token) >= _MIN_TOKEN_LENGTH and token.count(".") == 2
+
+
+def _token_digest(token: str) -> bytes:
+    """Hash a token so raw tokens are never used as cache keys."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _user_cache_key(digest: bytes) -> str:
+    """Build the Redis key for a token digest."""
+    return "auth:" + digest.hex()
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the `exp` claim of an already verified token."""
+    return jwt.get_unverified_claims(token).get("exp")
+
+
+async def _get_cached_user(token: str) -> Optional[UserResponse]:
+    """
+    Look up a previously resolved user for this token.
+
+    Checks the in-process cache first, then Redis. Cache failures are treated
+    as misses so auth keeps working without Redis.
+    """
+    digest = _token_digest(token)
+
+    entry = _user_cache.get(digest)
+    if entry and entry[1] > time.time():
+        return entry[0]
+
+    if redis is None:
+        return None
+
+    try:
+        cached = await redis.get(_user_cache_key(digest))
+        if not cached:
+            return None
+
+        user = UserResponse.model_validate_json(cached)
+        _user_cache[digest] = (user, _token_expiry(token))
+        return user
+    except Exception as e:
+        logger.warning("Auth cache read error: %s", e)
+        return None
+
+
+async def _cache_user(token: str, user: UserResponse) -> None:
+    """
+    Cache a resolved user for this token in-process and in Redis.
+
+    The TTL is bounded by the token's `exp` claim so an expired token is never
+    served from cache. Only called after the token has been verified.
+    """
+    try:
+        exp = _token_expiry(token)
+        if exp is None:
+            return
+
+        ttl = min(USER_CACHE_MAX_TTL, int(exp - time.time()))
+        if ttl <= 0:
+            return
+
+        digest = _token_digest(token)
+        _user_cache[digest] = (user, exp)
+
+        if redis is not None:
+            await redis.setex(_user_cache_key(digest), ttl, user.model_dump_json())
+    except Exception as e:
+        logger.warning("Auth cache write error: %s", e)
+
+
+def _decode_token(token: str) -> Optional[str]:
+    """
+    Verify an access token locally and return the authenticated user's ID.
+
+    Args:
+        token: JWT access token
+
+    Returns:
+        Optional[str]: User ID (`sub` claim), or None if the token is invalid
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            settings.SUPABASE_JWT_SECRET,
+            algorithms=["HS256"],
+            audience="authenticated",
+            options={"require_exp": True, "require_sub": True},
+        )
+    except JWTError:
+        return None
+    return payload["sub"]
+
+
+async def _fetch_profile(token: str, columns: str) -> Optional[Dict[str, Any]]:
+    """
+    Verify an access token and fetch the caller's profile row.
+
+    When SUPABASE_JWT_SECRET is configured the token is validated locally and the
+    profile is loaded by ID through a batching ProfileLoader. Otherwise the
+    `get_me()` RPC is called with the user's token: PostgREST verifies it and
+    the function resolves `auth.uid()`, so authentication and profile lookup
+    take a single round-trip.
+
+    Args:
+        token: JWT access token
+        columns: Profile columns to select
+
+    Returns:
+        Optional[Dict[str, Any]]: Profile row, or None if the token is invalid
+        or the user has no profile
+    """
+    if settings.SUPABASE_JWT_SECRET:
+        user_id = _decode_token(token)
+        if not user_id:
+            return None
+
+        return await _get_profile_loader(columns).load(user_id)
+
+    query = get_async_supabase_client().rpc("get_me", {}).select(columns)
+    # Per-request header: authenticate as the user, not the service role
+    query.request.headers["Authorization"] = f"Bearer {token}"
+    response = await query.execute()
+
+    if not response.data:
+        return None
+
+    return response.data[0]
+
+
+async def invalidate_cached_user(token: str) -> None:
+    """
+    Remove the cached user for this token (e.g. on logout).
+
+    Args:
+        token: JWT access token whose cache entry should be dropped
+    """
+    digest = _token_digest(token)
+    _user_cache.pop(digest, None)
+
+    if redis is None:
+        return
+
+    try:
+        await redis.delete(_user_cache_key(digest))
+    except Exception as e:
+        logger.warning("Auth cache delete error: %s", e)
+
+
+async def _resolve_user(token: str) -> Optional[UserResponse]:
+    """
+    Resolve an access token to the authenticated user.
+
+    Shared by all auth dependencies so token verification, profile lookup and
+    caching live in one place.
+
+    Args:
+        token: JWT access token
+
+    Returns:
+        Optional[UserResponse]: Authenticated user, or None if the token is
+        invalid or the user has no profile
+    """
+    if not _is_well_formed_token(token):
+        return None
+
+    try:
+        cached_user = await _get_cached_user(token)
+        if cached_user:
+            return cached_user
+
+        profile = await _fetch_profile(token, _PROFILE_COLS)
+
+        if profile is None:
+            return None
+
+        # Trusted DB row with known types: skip validation on this hot path
+        current_user = UserResponse.model_construct(
+            id=UUID(profile["id"]),
+            email=profile["email"],
+            full_name=profile["full_name"],
+            university_id=UUID(profile["university_id"]) if profile.get("university_id") else None,
+            university_email=profile["university_email"],
+            profile_picture_url=profile.get("profile_picture_url"),
+            is_verified=profile.get("is_verified", False),
+            created_at=datetime.fromisoformat(profile["created_at"]),
+        )
+
+        await _cache_user(token, current_user)
+        return current_user
+
+    except Exception as e:
+        logger.warning("Auth error: %s", e)
+        return None
+
+
+async def _reject_credentials(request: Request) -> None:
+    """
+    Record a failed authentication for the client and raise 401, or 429 once
+    the client exceeded the failed-authentication limit.
+
+    The counter is only touched on failure, so valid tokens never pay for the
+    Redis round trip and are never throttled by someone else's failures.
+    """
+    if await failed_auth_counter.hit(get_client_ip(request)) > settings.AUTH_FAILURE_LIMIT:
+        raise_rate_limited(failed_auth_counter.window)
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> UserResponse:
     """
     Get current authenticated user from JWT token.
 
-    This dependency verifies the JWT token with Supabase and returns
+    This dependency verifies the JWT token and returns
     the authenticated user. Raises 401 if token is invalid or expired.
+    Resolved users are cached in-process and in Redis (when configured).
 
     Args:
+        request: Incoming request (used to throttle failed attempts by IP)
         credentials: HTTP Authorization header containing the token
 
     Returns:
         UserResponse: Authenticated user information
 
     Raises:
-        HTTPException: 401 if token is invalid or user not found
+        HTTPException: 401 if token is invalid or user not found,
+            429 instead once the client exceeded the failed-authentication limit
 
     Example:
         >>> @app.get("/me")
         >>> async def get_me(current_user: UserResponse = Depends(get_current_user)):
         >>>     return current_user
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    current_user = await _resolve_user(credentials.credentials)
 
-    try:
-        # Get the token from the Bearer credentials
-        token = credentials.credentials
+    if current_user is None:
+        await _reject_credentials(request)
 
-        # Verify token with Supabase
-        user_response = supabase.auth.get_user(token)
+    return current_user
 
-        if not user_response or not user_response.user:
-            raise credentials_exception
 
-        user = user_response.user
+async def get_current_user_minimal(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> UserIdentity:
+    """
+    Get the ID and verification status of the authenticated user.
 
-        # Fetch user profile from profiles table
-        profile_response = (
-            supabase.table("profiles")
-            .select(
-                "id, email, full_name, university_id, university_email, "
-                "profile_picture_url, is_verified, created_at"
-            )
-            .eq("id", str(user.id))
-            .execute()
-        )
+    Lighter alternative to get_current_user for endpoints that only need to
+    know who the caller is: on a cache miss it selects two profile columns
+    instead of the full profile.
 
-        if not profile_response.data or len(profile_response.data) == 0:
-            raise credentials_exception
+    Args:
+        request: Incoming request (used to throttle failed attempts by IP)
+        credentials: HTTP Authorization header containing the token
 
-        profile = profile_response.data[0]
+    Returns:
+        UserIdentity: Authenticated user's ID and verification status
 
-        # Return UserResponse model
-        return UserResponse(
-            id=UUID(profile["id"]),
-            email=profile["email"],
-            full_name=profile["full_name"],
-            university_id=UUID(profile["university_id"]) if profile.get("university_id") else None,
-            university_email=profile["university_email"],
-            profile_picture_url=profile.get("profile_picture_url"),
-            is_verified=profile.get("is_verified", False),
-            created_at=profile["created_at"],
-        )
+    Raises:
+        HTTPException: 401 if token is invalid or user not found,
+            429 instead once the client exceeded the failed-authentication limit
+    """
+    token = credentials.credentials
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Auth error: {str(e)}")
-        raise credentials_exception
+    if _is_well_formed_token(token):
+        try:
+            cached_user = await _get_cached_user(token)
+            if cached_user:
+                return UserIdentity.model_construct(
+                    id=cached_user.id, is_verified=cached_user.is_verified
+                )
+
+            profile = await _fetch_profile(token, _PROFILE_MINIMAL_COLS)
+            if profile is not None:
+                return UserIdentity.model_construct(
+                    id=UUID(profile["id"]), is_verified=profile.get("is_verified", False)
+                )
+        except Exception as e:
+            logger.warning("Auth error: %s", e)
+
+    await _reject_credentials(request)
 
 
 async def get_current_active_user(
@@ -101,7 +434,10 @@ async def get_current_active_user(
     Get current active user (verified email).
 
     This dependency extends get_current_user and ensures the user
-    has verified their email address.
+    has verified their email address. FastAPI caches get_current_user per
+    request, so a route depending on both still resolves the user once;
+    keep referencing the same function object (no aliases or wrappers) and
+    the default use_cache=True to preserve that.
 
     Args:
         current_user: Current authenticated user
@@ -147,46 +483,4 @@ async def get_optional_current_user(
     if not credentials:
         return None
 
-    try:
-        # Extract token from credentials
-        token = credentials.credentials
-
-        # Verify token with Supabase
-        user_response = supabase.auth.get_user(token)
-
-        if not user_response or not user_response.user:
-            return None
-
-        user = user_response.user
-
-        # Fetch user profile from profiles table
-        profile_response = (
-            supabase.table("profiles")
-            .select(
-                "id, email, full_name, university_id, university_email, "
-                "profile_picture_url, is_verified, created_at"
-            )
-            .eq("id", str(user.id))
-            .execute()
-        )
-
-        if not profile_response.data or len(profile_response.data) == 0:
-            return None
-
-        profile = profile_response.data[0]
-
-        # Return UserResponse model
-        return UserResponse(
-            id=UUID(profile["id"]),
-            email=profile["email"],
-            full_name=profile["full_name"],
-            university_id=UUID(profile["university_id"]) if profile.get("university_id") else None,
-            university_email=profile["university_email"],
-            profile_picture_url=profile.get("profile_picture_url"),
-            is_verified=profile.get("is_verified", False),
-            created_at=profile["created_at"],
-        )
-
-    except Exception as e:
-        print(f"Optional auth error: {str(e)}")
-        return None
+    return await _resolve_user(credentials.credentials)
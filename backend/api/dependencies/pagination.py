@@ -0,0 +1,49 @@
+"""
+Pagination dependencies.
+
+Page-numbered list routes share these instead of repeating the page and
+page_size query parameters. They are async for the same reason as the
+service providers: FastAPI would run a class or plain ``def`` dependency in
+the threadpool.
+"""
+
+from dataclasses import dataclass
+
+from fastapi import Query
+
+# Largest page_size any list route accepts
+MAX_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class Pagination:
+    """Page number (1-indexed) and page size of a list request."""
+
+    page: int
+    page_size: int
+
+
+async def listing_pagination(
+    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
+    page_size: int = Query(20, ge=1, le=MAX_PAGE_SIZE, description="Items per page (max 100)"),
+) -> Pagination:
+    """
+    Read page and page_size for listing pages (20 per page by default).
+
+    Returns:
+        Pagination: The requested page
+    """
+    return Pagination(page=page, page_size=page_size)
+
+
+async def likes_pagination(
+    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
+    page_size: int = Query(50, ge=1, le=MAX_PAGE_SIZE, description="Likes per page (max 100)"),
+) -> Pagination:
+    """
+    Read page and page_size for likes pages (50 per page by default).
+
+    Returns:
+        Pagination: The requested page
+    """
+    return Pagination(page=page, page_size=page_size)
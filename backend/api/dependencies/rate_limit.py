@@ -0,0 +1,147 @@
+"""
+Rate limiting dependencies.
+
+Fixed-window counters keyed by client IP. Counters live in Redis when
+REDIS_URL is configured (shared across workers) and in process memory
+otherwise.
+"""
+
+import logging
+import time
+from ipaddress import ip_address
+from typing import Tuple
+
+from cachetools import TTLCache
+from fastapi import HTTPException, Request, status
+
+from backend.config import settings
+from backend.db import redis
+
+logger = logging.getLogger(__name__)
+
+
+def _is_trusted_proxy(host: str) -> bool:
+    """Check whether an address belongs to a configured trusted proxy range."""
+    try:
+        address = ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in settings.trusted_proxy_networks)
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Return the client IP address of a request.
+
+    X-Forwarded-For is only read when the peer is a trusted proxy
+    (TRUSTED_PROXIES), and then walked from the nearest hop: the first address
+    that is not itself a trusted proxy is the client. Anything further left
+    was written by the client and is ignored.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(peer):
+        return peer
+
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if not forwarded_for:
+        return peer
+
+    for hop in reversed(forwarded_for.split(",")):
+        hop = hop.strip()
+        if hop and not _is_trusted_proxy(hop):
+            return hop
+    return peer
+
+
+class FixedWindowCounter:
+    """
+    Counts events per key within fixed time windows.
+
+    Uses Redis `INCR` + `EXPIRE NX` in one transaction when available, so a
+    counter can never be left without a TTL, and falls back to an in-process
+    TTLCache, so a Redis outage degrades to per-worker limits rather than
+    failing requests.
+    """
+
+    def __init__(self, scope: str, window: int = 60, maxsize: int = 100_000) -> None:
+        self.scope = scope
+        self.window = window
+        # key -> (window start, count)
+        self._local: TTLCache = TTLCache(maxsize=maxsize, ttl=window)
+
+    def _key(self, key: str) -> str:
+        return f"ratelimit:{self.scope}:{key}"
+
+    def _local_entry(self, key: str) -> Tuple[float, int]:
+        entry = self._local.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.window:
+            return time.monotonic(), 0
+        return entry
+
+    async def hit(self, key: str) -> int:
+        """
+        Record an event and return the count in the current window.
+
+        Args:
+            key: Counter key (e.g. client IP)
+
+        Returns:
+            int: Number of events recorded in the current window
+        """
+        if redis is not None:
+            try:
+                redis_key = self._key(key)
+                async with redis.pipeline(transaction=True) as pipe:
+                    pipe.incr(redis_key)
+                    pipe.expire(redis_key, self.window, nx=True)
+                    count, _ = await pipe.execute()
+                return count
+            except Exception as e:
+                logger.warning("Rate limit counter error: %s", e)
+
+        started_at, count = self._local_entry(key)
+        self._local[key] = (started_at, count + 1)
+        return count + 1
+
+
+def raise_rate_limited(retry_after: int) -> None:
+    """Raise a 429 response with a Retry-After header."""
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests. Please try again later.",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+class RateLimiter:
+    """
+    Dependency that limits requests per client IP.
+
+    Example:
+        >>> @router.post("/login", dependencies=[Depends(auth_rate_limit)])
+    """
+
+    def __init__(self, scope: str, limit: int, window: int = 60) -> None:
+        self.limit = limit
+        self.counter = FixedWindowCounter(scope, window)
+
+    async def __call__(self, request: Request) -> None:
+        if await self.counter.hit(get_client_ip(request)) > self.limit:
+            raise_rate_limited(self.counter.window)
+
+
+# Shared limiter for unauthenticated auth endpoints (login/register/verify-email)
+auth_rate_limit = RateLimiter("auth", settings.AUTH_RATE_LIMIT)
+
+# Failed token authentications per client IP
+failed_auth_counter = FixedWindowCounter("auth-failure")
+
+
+__all__ = [
+    "FixedWindowCounter",
+    "RateLimiter",
+    "auth_rate_limit",
+    "failed_auth_counter",
+    "get_client_ip",
+    "raise_rate_limited",
+]
@@ -0,0 +1,63 @@
+"""
+Service dependencies.
+
+FastAPI runs plain ``def`` dependencies in the threadpool. The service
+getters are synchronous (startup code calls them too), so routes depend on
+these async wrappers instead and resolve the shared instance inline.
+"""
+
+from backend.core.services.chat import ChatService, get_chat_service
+from backend.core.services.feed import FeedService, get_feed_service
+from backend.core.services.housing import HousingService, get_housing_service
+from backend.core.services.olive import OliveService, get_olive_service
+from backend.core.services.profile import ProfileService, get_profile_service
+
+
+async def provide_chat_service() -> ChatService:
+    """
+    Return the shared ChatService without a threadpool hop.
+
+    Returns:
+        ChatService: The global service instance
+    """
+    return get_chat_service()
+
+
+async def provide_feed_service() -> FeedService:
+    """
+    Return the shared FeedService without a threadpool hop.
+
+    Returns:
+        FeedService: The global service instance
+    """
+    return get_feed_service()
+
+
+async def provide_housing_service() -> HousingService:
+    """
+    Return the shared HousingService without a threadpool hop.
+
+    Returns:
+        HousingService: The global service instance
+    """
+    return get_housing_service()
+
+
+async def provide_olive_service() -> OliveService:
+    """
+    Return the shared OliveService without a threadpool hop.
+
+    Returns:
+        OliveService: The global service instance
+    """
+    return get_olive_service()
+
+
+async def provide_profile_service() -> ProfileService:
+    """
+    Return the shared ProfileService without a threadpool hop.
+
+    Returns:
+        ProfileService: The global service instance
+    """
+    return get_profile_service()
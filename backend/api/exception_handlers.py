@@ -0,0 +1,94 @@
+"""
+Application-wide exception handlers.
+
+Maps service-layer exceptions to HTTP responses in one place so routes can
+call services directly instead of wrapping every call in try/except.
+"""
+
+import logging
+from typing import Dict, Type
+
+from fastapi import FastAPI, Request, status
+
+from backend.api.responses import ORJSONResponse
+from backend.core.services.chat import (
+    ConversationNotFoundError,
+    InvalidParticipantError,
+    UnauthorizedError,
+)
+from backend.core.services.feed import PostNotFoundError
+from backend.core.services.feed import UnauthorizedError as FeedUnauthorizedError
+from backend.core.services.feed import ValidationError as FeedValidationError
+from backend.core.services.housing import ListingNotFoundError
+from backend.core.services.housing import UnauthorizedError as HousingUnauthorizedError
+from backend.core.services.housing import ValidationError as HousingValidationError
+from backend.core.services.olive import ConversationNotFoundError as OliveNotFoundError
+from backend.core.services.olive import GroqAPIError, RateLimitError
+from backend.core.services.olive import UnauthorizedError as OliveUnauthorizedError
+from backend.core.services.profile import ProfileNotFoundError
+from backend.core.services.profile import ValidationError as ProfileValidationError
+from backend.core.utils import InvalidCursorError
+
+logger = logging.getLogger(__name__)
+
+# Service exception -> HTTP status; the exception message becomes the detail
+EXCEPTION_STATUS_CODES: Dict[Type[Exception], int] = {
+    ConversationNotFoundError: status.HTTP_404_NOT_FOUND,
+    UnauthorizedError: status.HTTP_403_FORBIDDEN,
+    InvalidParticipantError: status.HTTP_400_BAD_REQUEST,
+    PostNotFoundError: status.HTTP_404_NOT_FOUND,
+    FeedUnauthorizedError: status.HTTP_403_FORBIDDEN,
+    FeedValidationError: status.HTTP_400_BAD_REQUEST,
+    ListingNotFoundError: status.HTTP_404_NOT_FOUND,
+    HousingUnauthorizedError: status.HTTP_403_FORBIDDEN,
+    HousingValidationError: status.HTTP_400_BAD_REQUEST,
+    OliveNotFoundError: status.HTTP_404_NOT_FOUND,
+    OliveUnauthorizedError: status.HTTP_403_FORBIDDEN,
+    GroqAPIError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    ProfileNotFoundError: status.HTTP_404_NOT_FOUND,
+    ProfileValidationError: status.HTTP_400_BAD_REQUEST,
+    InvalidCursorError: status.HTTP_400_BAD_REQUEST,
+}
+
+# Fixed details for exceptions whose message is not meant for clients,
+# subclasses before their base classes
+EXCEPTION_DETAILS: Dict[Type[Exception], str] = {
+    RateLimitError: "AI service temporarily unavailable due to high demand.",
+    GroqAPIError: "AI service temporarily unavailable. Please try again in a moment.",
+}
+
+
+async def _service_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Return the mapped status code with the exception message (or fixed detail)."""
+    status_code = next(
+        code for exc_type, code in EXCEPTION_STATUS_CODES.items() if isinstance(exc, exc_type)
+    )
+    detail = next(
+        (text for exc_type, text in EXCEPTION_DETAILS.items() if isinstance(exc, exc_type)),
+        str(exc),
+    )
+    return ORJSONResponse({"detail": detail}, status_code=status_code)
+
+
+async def _unhandled_error_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Log unexpected errors and return a generic 500 without internal details."""
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return ORJSONResponse(
+        {"detail": "Internal server error"},
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Register service exception handlers on the application.
+
+    Args:
+        app: FastAPI application
+    """
+    for exc_type in EXCEPTION_STATUS_CODES:
+        app.add_exception_handler(exc_type, _service_error_handler)
+    app.add_exception_handler(Exception, _unhandled_error_handler)
+
+
+__all__ = ["EXCEPTION_DETAILS", "EXCEPTION_STATUS_CODES", "register_exception_handlers"]
@@ -5,13 +5,107 @@ This module initializes the FastAPI application, configures middleware,
 and sets up all routes and endpoints.
 """
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+
+import anyio
+import httpx
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 
+from backend.api.exception_handlers import register_exception_handlers
+from backend.api.responses import ORJSONResponse
 from backend.api.routes import auth, chat, feed, housing, olive, profile, universities
 from backend.config import settings
+from backend.config.logging_config import configure_logging
+from backend.core.services.feed import get_feed_service
+from backend.core.services.housing import get_housing_service
+from backend.db import init_async_supabase_client, redis
+
+logger = logging.getLogger(__name__)
+
+# Worker threads available to synchronous (blocking) calls
+THREADPOOL_SIZE = 200
+
+# Seconds an idle keep-alive connection stays open; longer than the reverse
+# proxy's idle timeout so it can keep reusing upstream connections
+KEEP_ALIVE_TIMEOUT = 75
+
+# Prefer uvloop's event loop; it is unavailable on Windows
+try:
+    import uvloop  # noqa: F401
+
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Application lifespan handler.
+
+    Creates shared clients when the application starts and closes them on
+    shutdown. A single pooled HTTP/2 client backs the async Supabase client so
+    connections (and their TLS handshakes) are reused across requests, and log
+    records are written by a background queue listener. With Redis, queued
+    likes are written in bulk by a background flusher. The newest housing
+    listings are kept in memory by a background refresher, and counted
+    listing views are written in bulk by another flusher.
+    """
+    log_listener = configure_logging()
+
+    # Room for blocking Supabase calls offloaded with run_in_threadpool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    print(f"🚀 Uniboe API starting in {settings.ENVIRONMENT} mode...")
+    print("📚 API Documentation: http://localhost:8000/docs")
+
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    ) as http_client:
+        app.state.http = http_client
+        await init_async_supabase_client(http_client)
+
+        feed_service = get_feed_service()
+        like_flusher = None
+        if redis is not None:
+            like_flusher = asyncio.create_task(feed_service.run_like_flusher())
+
+        housing_service = get_housing_service()
+        listings_refresher = asyncio.create_task(housing_service.run_newest_listings_refresher())
+        view_flusher = asyncio.create_task(housing_service.run_view_flusher())
+
+        yield
+
+        print("👋 Uniboe API shutting down...")
+        listings_refresher.cancel()
+        view_flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await listings_refresher
+        with suppress(asyncio.CancelledError):
+            await view_flusher
+        try:
+            await housing_service.flush_pending_views()
+        except Exception as e:
+            logger.warning("Final view count flush failed: %s", e)
+        if like_flusher is not None:
+            like_flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await like_flusher
+            try:
+                await feed_service.flush_pending_likes()
+            except Exception as e:
+                logger.warning("Final like flush failed: %s", e)
+        if redis is not None:
+            await redis.aclose()
+        log_listener.stop()
+
 
 # Initialize FastAPI application
 app = FastAPI(
@@ -20,17 +114,28 @@ app = FastAPI(
     description="Backend API for Uniboe - Your All-in-One Student Life Companion",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 
+# Map service exceptions to HTTP responses
+register_exception_handlers(app)
+
+
+# Compress JSON responses (message and feed pages are large and repetitive)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
+
 # Configure CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
+    expose_headers=["Retry-After"],
+    max_age=600,
 )
 
 
@@ -45,62 +150,37 @@ app.include_router(olive.router, prefix="/api", tags=["Olive AI"])
 
 
 @app.get("/", tags=["Root"])
-async def root() -> JSONResponse:
+async def root() -> dict:
     """
     Root endpoint providing basic API information.
 
     Returns:
-        JSONResponse: API name and version
+        dict: API name and version
     """
-    return JSONResponse(
-        content={
-            "message": "Uniboe API",
-            "version": "0.1.0",
-            "docs": "/docs" if settings.DEBUG else "Documentation disabled in production",
-        }
-    )
+    return {
+        "message": "Uniboe API",
+        "version": "0.1.0",
+        "docs": "/docs" if settings.DEBUG else "Documentation disabled in production",
+    }
 
 
 @app.get("/health", tags=["Health"])
-async def health_check() -> JSONResponse:
+async def health_check() -> dict:
     """
     Health check endpoint for monitoring and load balancers.
 
     Returns:
-        JSONResponse: Health status of the API
+        dict: Health status of the API
 
     Example:
         >>> GET /health
         {"status": "healthy", "environment": "development"}
     """
-    return JSONResponse(
-        content={
-            "status": "healthy",
-            "environment": settings.ENVIRONMENT,
-            "debug": settings.DEBUG,
-        }
-    )
-
-
-@app.on_event("startup")
-async def startup_event() -> None:
-    """
-    Application startup event handler.
-
-    Performs initialization tasks when the application starts.
-    """
-    print(f"🚀 Uniboe API starting in {settings.ENVIRONMENT} mode...")
-    print("📚 API Documentation: http://localhost:8000/docs")
-
-
-@app.on_event("shutdown")
-async def shutdown_event() -> None:
-    """
-    Application shutdown event handler.
-
-    Performs cleanup tasks when the application shuts down.
-    """
-    print("👋 Uniboe API shutting down...")
+    return {
+        "status": "healthy",
+        "environment": settings.ENVIRONMENT,
+        "debug": settings.DEBUG,
+    }
 
 
 if __name__ == "__main__":
@@ -111,5 +191,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        loop=EVENT_LOOP,
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
         log_level="debug" if settings.DEBUG else "info",
     )
@@ -4,19 +4,29 @@ Authentication API routes.
 Endpoints for user registration, login, logout, and profile management.
 """
 
-from typing import Union
+import logging
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 
-from backend.api.dependencies.auth import get_current_user
+from backend.api.dependencies.auth import (
+    get_current_user,
+    get_current_user_minimal,
+    invalidate_cached_user,
+    security,
+)
+from backend.api.dependencies.rate_limit import auth_rate_limit
 from backend.core.models.auth import (
     RegistrationConfirmationResponse,
+    RegistrationResponse,
     TokenResponse,
+    UserIdentity,
     UserLoginRequest,
     UserRegistrationRequest,
     UserResponse,
 )
-from backend.core.services.auth import get_auth_service
+from backend.core.services.auth import AuthService, get_auth_service
 from backend.core.services.auth.auth_service import (
     AuthenticationError,
     DuplicateEmailError,
@@ -24,6 +34,8 @@ from backend.core.services.auth.auth_service import (
     InvalidDomainError,
 )
 
+logger = logging.getLogger(__name__)
+
 # Create router
 router = APIRouter(
     prefix="/auth",
@@ -33,12 +45,16 @@ router = APIRouter(
 
 @router.post(
     "/register",
-    response_model=Union[TokenResponse, RegistrationConfirmationResponse],
+    response_model=RegistrationResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Register new user",
+    dependencies=[Depends(auth_rate_limit)],
     description="Register a new user with university email verification.",
 )
-async def register(request: UserRegistrationRequest) -> TokenResponse:
+async def register(
+    request: UserRegistrationRequest,
+    auth_service: AuthService = Depends(get_auth_service),
+) -> RegistrationResponse:
     """
     Register a new user account.
 
@@ -51,6 +67,7 @@ async def register(request: UserRegistrationRequest) -> TokenResponse:
 
     Args:
         request: User registration data
+        auth_service: Auth service dependency
 
     Returns:
         TokenResponse: JWT token and user information
@@ -82,7 +99,6 @@ async def register(request: UserRegistrationRequest) -> TokenResponse:
         }
     """
     try:
-        auth_service = get_auth_service()
         result = await auth_service.register_user(request)
 
         # Check if session exists - Supabase might require email confirmation
@@ -129,9 +145,13 @@ async def register(request: UserRegistrationRequest) -> TokenResponse:
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
     summary="Login user",
+    dependencies=[Depends(auth_rate_limit)],
     description="Authenticate user and create session.",
 )
-async def login(request: UserLoginRequest) -> TokenResponse:
+async def login(
+    request: UserLoginRequest,
+    auth_service: AuthService = Depends(get_auth_service),
+) -> TokenResponse:
     """
     Authenticate user and return access token.
 
@@ -142,6 +162,7 @@ async def login(request: UserLoginRequest) -> TokenResponse:
 
     Args:
         request: User login credentials
+        auth_service: Auth service dependency
 
     Returns:
         TokenResponse: JWT token and user information
@@ -165,7 +186,6 @@ async def login(request: UserLoginRequest) -> TokenResponse:
         }
     """
     try:
-        auth_service = get_auth_service()
         result = await auth_service.login_user(request)
 
         return TokenResponse(
@@ -241,16 +261,21 @@ async def get_me(current_user: UserResponse = Depends(get_current_user)) -> User
     description="Logout the current user and invalidate their session.",
 )
 async def logout(
-    current_user: UserResponse = Depends(get_current_user),
+    current_user: UserIdentity = Depends(get_current_user_minimal),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    auth_service: AuthService = Depends(get_auth_service),
 ) -> dict:
     """
     Logout current user.
 
-    This endpoint invalidates the user's session with Supabase.
-    The client should also delete the JWT token from storage.
+    This endpoint invalidates the user's session with Supabase and drops
+    the cached user for the token. The client should also delete the JWT
+    token from storage.
 
     Args:
         current_user: Authenticated user (from JWT token)
+        credentials: HTTP Authorization header containing the token
+        auth_service: Auth service dependency
 
     Returns:
         dict: Success message
@@ -270,10 +295,11 @@ async def logout(
         }
     """
     try:
-        auth_service = get_auth_service()
-        # Note: We don't have the token here, but Supabase handles logout
+        token = credentials.credentials
+
         # The client should also delete the JWT from local storage
-        await auth_service.logout_user("")
+        await invalidate_cached_user(token)
+        await auth_service.logout_user(token)
 
         return {"message": "Logged out successfully", "user_id": str(current_user.id)}
 
@@ -284,22 +310,39 @@ async def logout(
         )
 
 
+async def _verify_email_in_background(auth_service: AuthService, token: str) -> None:
+    """Run email verification after the response has been sent, logging failures."""
+    try:
+        if not await auth_service.verify_email(token):
+            logger.warning("Email verification rejected an invalid or expired token")
+    except Exception as e:
+        logger.warning("Email verification failed: %s", e)
+
+
 @router.get(
     "/verify-email/{token}",
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Verify email",
-    description="Verify user email with confirmation token.",
+    dependencies=[Depends(auth_rate_limit)],
+    description="Accept an email confirmation token for verification.",
 )
-async def verify_email(token: str) -> dict:
+async def verify_email(
+    token: str,
+    background_tasks: BackgroundTasks,
+    auth_service: AuthService = Depends(get_auth_service),
+) -> dict:
     """
     Verify user's email address.
 
     This endpoint is called when user clicks the verification link
-    sent to their email. Supabase handles the actual verification,
-    this endpoint just confirms success.
+    sent to their email. Supabase handles the actual verification, so the
+    token is processed in a background task and the request is accepted
+    immediately.
 
     Args:
         token: Email verification token from URL
+        background_tasks: FastAPI background task queue
+        auth_service: Auth service dependency
 
     Returns:
         dict: Verification status message
@@ -307,31 +350,14 @@ async def verify_email(token: str) -> dict:
     Example:
         >>> GET /api/auth/verify-email/verification-token-here
 
-        Response (200):
+        Response (202):
         {
-          "message": "Email verified successfully",
-          "verified": true
+          "message": "Verification in progress",
+          "verified": null
         }
     """
-    try:
-        auth_service = get_auth_service()
-        success = await auth_service.verify_email(token)
-
-        if success:
-            return {"message": "Email verified successfully", "verified": True}
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid or expired verification token",
-            )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Email verification failed: {str(e)}",
-        )
+    background_tasks.add_task(_verify_email_in_background, auth_service, token)
+    return {"message": "Verification in progress", "verified": None}
 
 
 @router.get(
@@ -342,7 +368,9 @@ async def verify_email(token: str) -> dict:
     description="Get complete user profile with university information (requires authentication).",
 )
 async def get_user_profile_by_id(
-    user_id: str, current_user: UserResponse = Depends(get_current_user)
+    user_id: str,
+    current_user: UserResponse = Depends(get_current_user),
+    auth_service: AuthService = Depends(get_auth_service),
 ) -> dict:
     """
     Get complete user profile with university information.
@@ -353,6 +381,7 @@ async def get_user_profile_by_id(
     Args:
         user_id: UUID of the user to fetch
         current_user: Authenticated user (from JWT token)
+        auth_service: Auth service dependency
 
     Returns:
         dict: Complete profile with university data
@@ -381,10 +410,6 @@ async def get_user_profile_by_id(
         }
     """
     try:
-        from uuid import UUID
-
-        auth_service = get_auth_service()
-
         profile = await auth_service.get_user_profile(UUID(user_id))
         return profile
 
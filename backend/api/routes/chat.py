@@ -4,14 +4,20 @@ Chat API routes.
 Endpoints for managing conversations and encrypted messages.
 """
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from backend.api.dependencies.auth import get_current_user
+from backend.api.dependencies.services import provide_chat_service
+from backend.api.responses import cached_json_response, stream_json_list
 from backend.core.models.auth import UserResponse
 from backend.core.models.chat import (
+    ChatBootstrapResponse,
     ConversationCreate,
     ConversationListResponse,
     ConversationResponse,
@@ -20,13 +26,16 @@ from backend.core.models.chat import (
     MessageListResponse,
     MessageResponse,
 )
-from backend.core.services.chat import (
-    ChatService,
-    ConversationNotFoundError,
-    InvalidParticipantError,
-    UnauthorizedError,
-    get_chat_service,
-)
+from backend.core.services.chat import ChatService
+from backend.db import get_async_supabase_client
+
+# Shared dependency markers, declared once for every route in this module
+_CurrentUser = Depends(get_current_user)
+_ChatService = Depends(provide_chat_service)
+
+# Batch validators for list responses (one call instead of a model per row)
+_conversation_list_adapter = TypeAdapter(List[ConversationResponse])
+_message_list_adapter = TypeAdapter(List[MessageResponse])
 
 # Create router
 router = APIRouter(
@@ -44,8 +53,8 @@ router = APIRouter(
 )
 async def create_or_get_conversation(
     conversation_data: ConversationCreate,
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
 ) -> ConversationResponse:
     """
     Create a new conversation or get existing one.
@@ -81,19 +90,10 @@ async def create_or_get_conversation(
             detail="Cannot create conversation with yourself",
         )
 
-    try:
-        conversation = await chat_service.get_or_create_conversation(
-            user_id=user_id, participant_id=conversation_data.participant_id
-        )
-        return ConversationResponse(**conversation)
-
-    except InvalidParticipantError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create conversation: {str(e)}",
-        )
+    conversation = await chat_service.get_or_create_conversation(
+        user_id=user_id, participant_id=conversation_data.participant_id
+    )
+    return ConversationResponse.model_validate(conversation)
 
 
 @router.get(
@@ -104,45 +104,102 @@ async def create_or_get_conversation(
     description="Get all conversations for the current user, ordered by most recent message.",
 )
 async def get_conversations(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page (max 100)"),
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
-) -> ConversationListResponse:
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (replaces page)"
+    ),
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
+) -> Response:
     """
     Get all conversations for the current user.
 
     Includes last message preview, unread count, and other participant info.
     Ordered by most recent message first.
 
+    Responses carry an ETag; re-polls with a matching If-None-Match get 304.
+
     Args:
-        page: Page number (default 1).
+        request: Incoming request (for If-None-Match).
+        page: Page number (default 1), ignored when cursor is given.
         page_size: Items per page (default 20, max 100).
+        cursor: Keyset cursor from the previous page.
         current_user: Authenticated user.
         chat_service: Chat service dependency.
 
     Returns:
-        ConversationListResponse: Paginated list of conversations.
+        Response: ConversationListResponse JSON, or 304 Not Modified.
 
     Example:
-        >>> GET /api/chat/conversations?page=1&page_size=20
+        >>> GET /api/chat/conversations?page_size=20
+        >>> GET /api/chat/conversations?page_size=20&cursor=<next_cursor>
     """
-    try:
-        conversations = await chat_service.get_user_conversations(
-            user_id=current_user.id, page=page, page_size=page_size
-        )
-        return ConversationListResponse(
-            conversations=[ConversationResponse(**conv) for conv in conversations["conversations"]],
+    conversations = await chat_service.get_user_conversations(
+        user_id=current_user.id, page=page, page_size=page_size, cursor=cursor
+    )
+    return cached_json_response(
+        request,
+        ConversationListResponse(
+            conversations=_conversation_list_adapter.validate_python(
+                conversations["conversations"]
+            ),
             total=conversations["total"],
             page=conversations["page"],
             page_size=conversations["page_size"],
-        )
+            has_more=conversations["has_more"],
+            next_cursor=conversations["next_cursor"],
+        ),
+    )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch conversations: {str(e)}",
-        )
+
+@router.get(
+    "/bootstrap",
+    response_model=ChatBootstrapResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get chat bootstrap data",
+    description="Get the first page of conversations and the unread count in one request.",
+)
+async def get_chat_bootstrap(
+    page_size: int = Query(20, ge=1, le=100, description="Conversations per page (max 100)"),
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
+) -> ChatBootstrapResponse:
+    """
+    Get everything the chat UI needs on open.
+
+    Replaces separate calls to /conversations and /unread-count; both are
+    fetched concurrently.
+
+    Args:
+        page_size: Conversations per page (default 20, max 100).
+        current_user: Authenticated user.
+        chat_service: Chat service dependency.
+
+    Returns:
+        ChatBootstrapResponse: First conversation page and unread count.
+
+    Example:
+        >>> GET /api/chat/bootstrap?page_size=20
+    """
+    conversations, unread_count = await asyncio.gather(
+        chat_service.get_user_conversations(user_id=current_user.id, page_size=page_size),
+        chat_service.get_unread_count(user_id=current_user.id),
+    )
+    return ChatBootstrapResponse(
+        conversations=ConversationListResponse(
+            conversations=_conversation_list_adapter.validate_python(
+                conversations["conversations"]
+            ),
+            total=conversations["total"],
+            page=conversations["page"],
+            page_size=conversations["page_size"],
+            has_more=conversations["has_more"],
+            next_cursor=conversations["next_cursor"],
+        ),
+        unread_count=unread_count,
+    )
 
 
 @router.get(
@@ -153,22 +210,25 @@ async def get_conversations(
     description="Get a single conversation with full details.",
 )
 async def get_conversation(
+    request: Request,
     conversation_id: UUID,
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
-) -> ConversationResponse:
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
+) -> Response:
     """
     Get a single conversation by ID.
 
-    User must be a participant in the conversation.
+    User must be a participant in the conversation. Responses carry an ETag;
+    re-polls with a matching If-None-Match get 304.
 
     Args:
+        request: Incoming request (for If-None-Match).
         conversation_id: Conversation unique identifier.
         current_user: Authenticated user.
         chat_service: Chat service dependency.
 
     Returns:
-        ConversationResponse: The conversation with full details.
+        Response: ConversationResponse JSON, or 304 Not Modified.
 
     Raises:
         HTTPException 401: Not authenticated.
@@ -179,21 +239,10 @@ async def get_conversation(
     Example:
         >>> GET /api/chat/conversations/123e4567-e89b-12d3-a456-426614174000
     """
-    try:
-        conversation = await chat_service.get_conversation_by_id(
-            conversation_id=conversation_id, user_id=current_user.id
-        )
-        return ConversationResponse(**conversation)
-
-    except ConversationNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch conversation: {str(e)}",
-        )
+    conversation = await chat_service.get_conversation_by_id(
+        conversation_id=conversation_id, user_id=current_user.id
+    )
+    return cached_json_response(request, ConversationResponse.model_validate(conversation))
 
 
 @router.post(
@@ -206,8 +255,8 @@ async def get_conversation(
 async def send_message(
     conversation_id: UUID,
     message_data: MessageCreate,
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
 ) -> MessageResponse:
     """
     Send a message in a conversation.
@@ -237,21 +286,10 @@ async def send_message(
         >>>   "content": "Hey! Is your listing still available?"
         >>> }
     """
-    try:
-        message = await chat_service.send_message(
-            conversation_id=conversation_id, sender_id=current_user.id, message_data=message_data
-        )
-        return MessageResponse(**message)
-
-    except ConversationNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to send message: {str(e)}",
-        )
+    message = await chat_service.send_message(
+        conversation_id=conversation_id, sender_id=current_user.id, message_data=message_data
+    )
+    return MessageResponse.model_validate(message)
 
 
 @router.get(
@@ -265,24 +303,29 @@ async def get_messages(
     conversation_id: UUID,
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(50, ge=1, le=100, description="Messages per page (max 100)"),
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
-) -> MessageListResponse:
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (replaces page)"
+    ),
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
+) -> StreamingResponse:
     """
     Get messages for a conversation.
 
     Messages are ordered newest first (DESC) for infinite scroll.
     All messages are automatically decrypted. User must be a participant.
+    The page is streamed row by row as JSON.
 
     Args:
         conversation_id: Conversation unique identifier.
-        page: Page number (default 1).
+        page: Page number (default 1), ignored when cursor is given.
         page_size: Messages per page (default 50, max 100).
+        cursor: Keyset cursor from the previous page.
         current_user: Authenticated user.
         chat_service: Chat service dependency.
 
     Returns:
-        MessageListResponse: Paginated list of messages with decrypted content.
+        StreamingResponse: MessageListResponse JSON with decrypted content.
 
     Raises:
         HTTPException 401: Not authenticated.
@@ -293,27 +336,23 @@ async def get_messages(
     Example:
         >>> GET /api/chat/conversations/123e4567-e89b-12d3-a456-426614174000/messages?page=1
     """
-    try:
-        messages = await chat_service.get_conversation_messages(
-            conversation_id=conversation_id, user_id=current_user.id, page=page, page_size=page_size
-        )
-        return MessageListResponse(
-            messages=[MessageResponse(**msg) for msg in messages["messages"]],
-            total=messages["total"],
-            page=messages["page"],
-            page_size=messages["page_size"],
-            has_more=messages["has_more"],
-        )
-
-    except ConversationNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch messages: {str(e)}",
-        )
+    messages = await chat_service.get_conversation_messages(
+        conversation_id=conversation_id,
+        user_id=current_user.id,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+    )
+    # Rows come from the service already in MessageResponse shape
+    return stream_json_list(
+        "messages",
+        messages["messages"],
+        total=messages["total"],
+        page=messages["page"],
+        page_size=messages["page_size"],
+        has_more=messages["has_more"],
+        next_cursor=messages["next_cursor"],
+    )
 
 
 @router.post(
@@ -324,8 +363,8 @@ async def get_messages(
 )
 async def mark_messages_read(
     mark_read_data: MarkReadRequest,
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
 ) -> dict:
     """
     Mark multiple messages as read.
@@ -355,20 +394,13 @@ async def mark_messages_read(
           "message": "Successfully marked 2 messages as read"
         }
     """
-    try:
-        count = await chat_service.mark_messages_as_read(
-            user_id=current_user.id, message_ids=mark_read_data.message_ids
-        )
-        return {
-            "count": count,
-            "message": f"Successfully marked {count} message{'s' if count != 1 else ''} as read",
-        }
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to mark messages as read: {str(e)}",
-        )
+    count = await chat_service.mark_messages_as_read(
+        user_id=current_user.id, message_ids=mark_read_data.message_ids
+    )
+    return {
+        "count": count,
+        "message": f"Successfully marked {count} message{'s' if count != 1 else ''} as read",
+    }
 
 
 @router.post(
@@ -379,8 +411,8 @@ async def mark_messages_read(
 )
 async def mark_conversation_read(
     conversation_id: UUID,
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
 ) -> dict:
     """
     Mark all messages in a conversation as read.
@@ -411,24 +443,13 @@ async def mark_conversation_read(
           "message": "Successfully marked 5 messages as read"
         }
     """
-    try:
-        count = await chat_service.mark_conversation_as_read(
-            conversation_id=conversation_id, user_id=current_user.id
-        )
-        return {
-            "count": count,
-            "message": f"Successfully marked {count} message{'s' if count != 1 else ''} as read",
-        }
-
-    except ConversationNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to mark conversation as read: {str(e)}",
-        )
+    count = await chat_service.mark_conversation_as_read(
+        conversation_id=conversation_id, user_id=current_user.id
+    )
+    return {
+        "count": count,
+        "message": f"Successfully marked {count} message{'s' if count != 1 else ''} as read",
+    }
 
 
 @router.get(
@@ -438,20 +459,23 @@ async def mark_conversation_read(
     description="Get total unread message count across all conversations.",
 )
 async def get_unread_count(
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
-) -> dict:
+    request: Request,
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
+) -> Response:
     """
     Get total unread message count across all conversations.
 
-    Only counts messages where the current user is the recipient.
+    Only counts messages where the current user is the recipient. Responses
+    carry an ETag; re-polls with a matching If-None-Match get 304.
 
     Args:
+        request: Incoming request (for If-None-Match).
         current_user: Authenticated user.
         chat_service: Chat service dependency.
 
     Returns:
-        dict: Total unread message count.
+        Response: Total unread message count JSON, or 304 Not Modified.
 
     Example:
         >>> GET /api/chat/unread-count
@@ -461,15 +485,8 @@ async def get_unread_count(
           "unread_count": 12
         }
     """
-    try:
-        unread_count = await chat_service.get_unread_count(user_id=current_user.id)
-        return {"unread_count": unread_count}
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get unread count: {str(e)}",
-        )
+    unread_count = await chat_service.get_unread_count(user_id=current_user.id)
+    return cached_json_response(request, {"unread_count": unread_count})
 
 
 @router.get(
@@ -482,13 +499,13 @@ async def get_unread_count(
 async def search_messages(
     q: str = Query(..., min_length=1, description="Search query"),
     conversation_id: UUID = Query(None, description="Optional conversation ID to search within"),
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
 ) -> List[MessageResponse]:
     """
     Search messages in user's conversations.
 
-    Searches decrypted message content (case-insensitive).
+    Matches whole words of the query (case-insensitive) via the blind index.
     Can search across all conversations or within a specific conversation.
 
     Args:
@@ -504,17 +521,10 @@ async def search_messages(
         >>> GET /api/chat/search?q=apartment
         >>> GET /api/chat/search?q=apartment&conversation_id=123e4567-e89b-12d3-a456-426614174000
     """
-    try:
-        messages = await chat_service.search_messages(
-            user_id=current_user.id, query=q, conversation_id=conversation_id
-        )
-        return [MessageResponse(**msg) for msg in messages]
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to search messages: {str(e)}",
-        )
+    messages = await chat_service.search_messages(
+        user_id=current_user.id, query=q, conversation_id=conversation_id
+    )
+    return _message_list_adapter.validate_python(messages)
 
 
 @router.get(
@@ -528,7 +538,7 @@ async def search_messages(
 async def search_users_for_chat(
     q: str = Query(..., min_length=1, max_length=100, description="Search query (user name)"),
     limit: int = Query(10, ge=1, le=50, description="Max results to return (default 10, max 50)"),
-    current_user: UserResponse = Depends(get_current_user),
+    current_user: UserResponse = _CurrentUser,
 ) -> List[Dict[str, Any]]:
     """
     Quick search for users by name to start conversations.
@@ -563,58 +573,49 @@ async def search_users_for_chat(
           }
         ]
     """
-    try:
-        from backend.db import supabase
-
-        # Search users by name (case-insensitive)
-        # Join profiles with universities table using university_id
-        response = (
-            supabase.table("profiles")
-            .select(
-                """id, full_name, profile_picture_url, university_email, university_id,
-                universities!profiles_university_id_fkey(name)"""
-            )
-            .ilike("full_name", f"%{q}%")
-            .neq("id", str(current_user.id))  # Exclude current user
-            .order("full_name")
-            .limit(limit)
-            .execute()
-        )
+    # Search users by name (case-insensitive) in a single query:
+    # the university name is embedded through the university_id foreign key
+    response = await (
+        get_async_supabase_client()
+        .table("profiles")
+        .select("""id, full_name, profile_picture_url, university_email, university_id,
+            universities!profiles_university_id_fkey(name)""")
+        .ilike("full_name", f"%{q}%")
+        .neq("id", str(current_user.id))  # Exclude current user
+        .order("full_name")
+        .limit(limit)
+        .execute()
+    )
+
+    # Transform results to simple format
+    users = []
+    for profile in response.data:
+        user_data = {
+            "id": profile["id"],
+            "full_name": profile["full_name"],
+            "university_name": (
+                profile["universities"]["name"] if profile.get("universities") else None
+            ),
+            "profile_picture_url": profile.get("profile_picture_url"),
+            "university_email": profile.get("university_email"),
+        }
+        users.append(user_data)
 
-        # Transform results to simple format
-        users = []
-        for profile in response.data:
-            user_data = {
-                "id": profile["id"],
-                "full_name": profile["full_name"],
-                "university_name": (
-                    profile["universities"]["name"] if profile.get("universities") else None
-                ),
-                "profile_picture_url": profile.get("profile_picture_url"),
-                "university_email": profile.get("university_email"),
-            }
-            users.append(user_data)
-
-        return users
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to search users: {str(e)}",
-        )
+    return users
 
 
 @router.delete(
     "/conversations/{conversation_id}",
     status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
     summary="Delete conversation",
     description="Delete a conversation and all its messages.",
 )
 async def delete_conversation(
     conversation_id: UUID,
-    current_user: UserResponse = Depends(get_current_user),
-    chat_service: ChatService = Depends(get_chat_service),
-):
+    current_user: UserResponse = _CurrentUser,
+    chat_service: ChatService = _ChatService,
+) -> Response:
     """
     Delete a conversation and all its messages.
 
@@ -626,6 +627,9 @@ async def delete_conversation(
         current_user: Authenticated user.
         chat_service: Chat service dependency.
 
+    Returns:
+        Response: Empty 204 No Content response.
+
     Raises:
         HTTPException 401: Not authenticated.
         HTTPException 403: User is not a participant in this conversation.
@@ -635,18 +639,5 @@ async def delete_conversation(
     Example:
         >>> DELETE /api/chat/conversations/123e4567-e89b-12d3-a456-426614174000
     """
-    try:
-        await chat_service.delete_conversation(
-            conversation_id=conversation_id, user_id=current_user.id
-        )
-        return None
-
-    except ConversationNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete conversation: {str(e)}",
-        )
+    await chat_service.delete_conversation(conversation_id=conversation_id, user_id=current_user.id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
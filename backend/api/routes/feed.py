@@ -7,9 +7,11 @@ Endpoints for creating, reading, updating, and deleting posts, and managing like
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile, status
 
 from backend.api.dependencies.auth import get_current_user, get_optional_current_user
+from backend.api.dependencies.services import provide_feed_service
+from backend.api.responses import ORJSONResponse, cached_json_response
 from backend.core.models.auth import UserResponse
 from backend.core.models.feed import (
     LikeResponse,
@@ -18,13 +20,11 @@ from backend.core.models.feed import (
     PostResponse,
     PostUpdate,
 )
-from backend.core.services.feed import (
-    FeedService,
-    PostNotFoundError,
-    UnauthorizedError,
-    ValidationError,
-    get_feed_service,
-)
+from backend.core.services.feed import FeedService
+
+# Build response models from trusted service-layer rows without re-validating them
+_mk_post = PostResponse.model_construct
+_mk_like = LikeResponse.model_construct
 
 # Create router
 router = APIRouter(
@@ -43,7 +43,7 @@ router = APIRouter(
 async def upload_media(
     files: List[UploadFile] = File(..., description="Media files (max 5, max 50MB each)"),
     current_user: UserResponse = Depends(get_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
+    feed_service: FeedService = Depends(provide_feed_service),
 ) -> dict:
     """
     Upload media files to Supabase Storage.
@@ -80,25 +80,13 @@ async def upload_media(
           "count": 1
         }
     """
-    try:
-        # Read files and prepare for service layer
-        file_data = []
-        for file in files:
-            content = await file.read()
-            file_data.append((content, file.content_type, file.filename))
+    # Pass the spooled files through; the service streams them to storage
+    file_data = [(file.file, file.content_type, file.filename) for file in files]
 
-        # Delegate to service layer
-        result = await feed_service.upload_media(user_id=current_user.id, files=file_data)
+    # Delegate to service layer
+    result = await feed_service.upload_media(user_id=current_user.id, files=file_data)
 
-        return result
-
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Media upload failed: {str(e)}",
-        )
+    return result
 
 
 @router.delete(
@@ -110,7 +98,7 @@ async def upload_media(
 async def delete_media(
     media_url: str = Query(..., description="Public URL of the media to delete"),
     current_user: UserResponse = Depends(get_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
+    feed_service: FeedService = Depends(provide_feed_service),
 ):
     """
     Delete a media file from Supabase Storage.
@@ -131,22 +119,11 @@ async def delete_media(
     Example:
         >>> DELETE /api/feed/media?media_url=https://.../abc123.jpg
     """
-    try:
-        response = await feed_service.delete_media(user_id=current_user.id, media_url=media_url)
-        if response:
-            return {"message": "Media deleted successfully"}
-        else:
-            return {"message": "Failed to delete media"}
-
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete media: {str(e)}",
-        )
+    response = await feed_service.delete_media(user_id=current_user.id, media_url=media_url)
+    if response:
+        return {"message": "Media deleted successfully"}
+    else:
+        return {"message": "Failed to delete media"}
 
 
 @router.post(
@@ -159,7 +136,7 @@ async def delete_media(
 async def create_post(
     post_data: PostCreate,
     current_user: UserResponse = Depends(get_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
+    feed_service: FeedService = Depends(provide_feed_service),
 ) -> PostResponse:
     """
     Create a new post in the feed.
@@ -187,17 +164,8 @@ async def create_post(
         >>>   "media_types": ["image"]
         >>> }
     """
-    try:
-        post = await feed_service.create_post(user_id=current_user.id, post_data=post_data)
-        return PostResponse(**post)
-
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create post: {str(e)}",
-        )
+    post = await feed_service.create_post(user_id=current_user.id, post_data=post_data)
+    return PostResponse(**post)
 
 
 @router.get(
@@ -208,62 +176,68 @@ async def create_post(
     description="Get paginated feed of posts. Shows personalized feed for authenticated users.",
 )
 async def get_feed(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(20, ge=1, le=100, description="Posts per page (max 100)"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (replaces page)"
+    ),
+    include_total: bool = Query(
+        False, description="Include an estimated total post count (slower)"
+    ),
     exclude_own_posts: bool = Query(False, description="Whether to exclude own posts"),
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
-) -> PostListResponse:
+    feed_service: FeedService = Depends(provide_feed_service),
+) -> Response:
     """
     Get paginated feed of posts.
 
     Authentication is optional. If authenticated, excludes user's own posts
-    and includes like status for each post.
+    and includes like status for each post. The first page is served from a
+    short-lived cache of the serialized response (see X-Cache). Responses
+    carry an ETag; a matching If-None-Match gets 304 Not Modified.
 
     Args:
-        page: Page number (default 1)
+        request: Incoming request (for If-None-Match)
+        page: Page number (default 1), ignored when cursor is given
         page_size: Number of posts per page (default 20, max 100)
+        cursor: Keyset cursor from the previous page
+        include_total: Whether to include an estimated total (default False)
         exclude_own_posts: Whether to exclude own posts (default False)
         current_user: Optional authenticated user
         feed_service: Feed service dependency
 
     Returns:
-        PostListResponse: Paginated list of posts
+        Response: PostListResponse JSON (paginated list of posts), or 304
 
     Example:
-        >>> GET /api/feed?page=1&page_size=20
+        >>> GET /api/feed?page_size=20
+        >>> GET /api/feed?page_size=20&cursor=<next_cursor>
 
         Response:
         {
           "posts": [...],
-          "total": 150,
+          "total": null,
           "page": 1,
           "page_size": 20,
-          "has_more": true
+          "has_more": true,
+          "next_cursor": "eyJ0cyI6..."
         }
     """
-    try:
-        current_user_id = current_user.id if current_user else None
-        feed_data = await feed_service.get_feed(
-            current_user_id=current_user_id,
-            page=page,
-            page_size=page_size,
-            exclude_own_posts=exclude_own_posts,
-        )
-
-        return PostListResponse(
-            posts=[PostResponse(**post) for post in feed_data["posts"]],
-            total=feed_data["total"],
-            page=feed_data["page"],
-            page_size=feed_data["page_size"],
-            has_more=feed_data["has_more"],
-        )
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch feed: {str(e)}",
-        )
+    current_user_id = current_user.id if current_user else None
+    body, cache_hit = await feed_service.get_feed_json(
+        current_user_id=current_user_id,
+        page=page,
+        page_size=page_size,
+        exclude_own_posts=exclude_own_posts,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+    # Pre-serialized PostListResponse JSON: no model or dict walk per request
+    response = cached_json_response(request, body, max_age=0, precompress=True)
+    response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+    return response
 
 
 @router.get(
@@ -274,22 +248,25 @@ async def get_feed(
     description="Get a single post with full details.",
 )
 async def get_post(
+    request: Request,
     post_id: UUID,
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
-) -> PostResponse:
+    feed_service: FeedService = Depends(provide_feed_service),
+) -> Response:
     """
     Get a single post by ID.
 
     Authentication is optional. If authenticated, includes like status.
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
 
     Args:
+        request: Incoming request (for If-None-Match)
         post_id: Post unique identifier
         current_user: Optional authenticated user
         feed_service: Feed service dependency
 
     Returns:
-        PostResponse: Post with full details
+        Response: PostResponse JSON (post with full details), or 304
 
     Raises:
         HTTPException 404: Post not found
@@ -298,18 +275,9 @@ async def get_post(
     Example:
         >>> GET /api/feed/posts/123e4567-e89b-12d3-a456-426614174000
     """
-    try:
-        current_user_id = current_user.id if current_user else None
-        post = await feed_service.get_post_by_id(post_id=post_id, current_user_id=current_user_id)
-        return PostResponse(**post)
-
-    except PostNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch post: {str(e)}",
-        )
+    current_user_id = current_user.id if current_user else None
+    post = await feed_service.get_post_by_id(post_id=post_id, current_user_id=current_user_id)
+    return cached_json_response(request, PostResponse(**post), max_age=0)
 
 
 @router.get(
@@ -323,9 +291,15 @@ async def get_user_posts(
     user_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Posts per page"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (replaces page)"
+    ),
+    include_total: bool = Query(
+        False, description="Include an estimated total post count (slower)"
+    ),
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
-) -> PostListResponse:
+    feed_service: FeedService = Depends(provide_feed_service),
+) -> ORJSONResponse:
     """
     Get all posts by a specific user.
 
@@ -333,36 +307,38 @@ async def get_user_posts(
 
     Args:
         user_id: User's unique identifier
-        page: Page number (default 1)
+        page: Page number (default 1), ignored when cursor is given
         page_size: Posts per page (default 20, max 100)
+        cursor: Keyset cursor from the previous page
+        include_total: Whether to include an estimated total (default False)
         current_user: Optional authenticated user
         feed_service: Feed service dependency
 
     Returns:
-        PostListResponse: Paginated list of user's posts
+        ORJSONResponse: PostListResponse JSON (paginated list of user's posts)
 
     Example:
         >>> GET /api/feed/users/456e7890-e89b-12d3-a456-426614174111/posts?page=1
     """
-    try:
-        current_user_id = current_user.id if current_user else None
-        posts_data = await feed_service.get_user_posts(
-            user_id=user_id, current_user_id=current_user_id, page=page, page_size=page_size
-        )
-
-        return PostListResponse(
-            posts=[PostResponse(**post) for post in posts_data["posts"]],
-            total=posts_data["total"],
-            page=posts_data["page"],
-            page_size=posts_data["page_size"],
-            has_more=posts_data["has_more"],
-        )
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch user posts: {str(e)}",
-        )
+    current_user_id = current_user.id if current_user else None
+    posts_data = await feed_service.get_user_posts(
+        user_id=user_id,
+        current_user_id=current_user_id,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+    posts = PostListResponse.model_construct(
+        posts=[_mk_post(**post) for post in posts_data["posts"]],
+        total=posts_data["total"],
+        page=posts_data["page"],
+        page_size=posts_data["page_size"],
+        has_more=posts_data["has_more"],
+        next_cursor=posts_data["next_cursor"],
+    )
+    return ORJSONResponse(posts.model_dump(warnings=False))
 
 
 @router.put(
@@ -376,7 +352,7 @@ async def update_post(
     post_id: UUID,
     post_data: PostUpdate,
     current_user: UserResponse = Depends(get_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
+    feed_service: FeedService = Depends(provide_feed_service),
 ) -> PostResponse:
     """
     Update an existing post.
@@ -404,23 +380,10 @@ async def update_post(
         >>>   "content": "Updated content!"
         >>> }
     """
-    try:
-        post = await feed_service.update_post(
-            post_id=post_id, user_id=current_user.id, update_data=post_data
-        )
-        return PostResponse(**post)
-
-    except PostNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update post: {str(e)}",
-        )
+    post = await feed_service.update_post(
+        post_id=post_id, user_id=current_user.id, update_data=post_data
+    )
+    return PostResponse(**post)
 
 
 @router.delete(
@@ -432,7 +395,7 @@ async def update_post(
 async def delete_post(
     post_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
+    feed_service: FeedService = Depends(provide_feed_service),
 ):
     """
     Delete a post.
@@ -454,19 +417,8 @@ async def delete_post(
     Example:
         >>> DELETE /api/feed/posts/123e4567-e89b-12d3-a456-426614174000
     """
-    try:
-        await feed_service.delete_post(post_id=post_id, user_id=current_user.id)
-        return None
-
-    except PostNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete post: {str(e)}",
-        )
+    await feed_service.delete_post(post_id=post_id, user_id=current_user.id)
+    return None
 
 
 @router.post(
@@ -479,7 +431,7 @@ async def delete_post(
 async def like_post(
     post_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
+    feed_service: FeedService = Depends(provide_feed_service),
 ) -> LikeResponse:
     """
     Like a post.
@@ -503,17 +455,8 @@ async def like_post(
     Example:
         >>> POST /api/feed/posts/123e4567-e89b-12d3-a456-426614174000/like
     """
-    try:
-        like = await feed_service.like_post(post_id=post_id, user_id=current_user.id)
-        return LikeResponse(**like)
-
-    except PostNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to like post: {str(e)}",
-        )
+    like = await feed_service.like_post(post_id=post_id, user_id=current_user.id)
+    return LikeResponse(**like)
 
 
 @router.delete(
@@ -525,7 +468,7 @@ async def like_post(
 async def unlike_post(
     post_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    feed_service: FeedService = Depends(get_feed_service),
+    feed_service: FeedService = Depends(provide_feed_service),
 ):
     """
     Unlike a post.
@@ -545,15 +488,8 @@ async def unlike_post(
     Example:
         >>> DELETE /api/feed/posts/123e4567-e89b-12d3-a456-426614174000/like
     """
-    try:
-        await feed_service.unlike_post(post_id=post_id, user_id=current_user.id)
-        return None
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to unlike post: {str(e)}",
-        )
+    await feed_service.unlike_post(post_id=post_id, user_id=current_user.id)
+    return None
 
 
 @router.get(
@@ -567,8 +503,8 @@ async def get_post_likes(
     post_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Likes per page"),
-    feed_service: FeedService = Depends(get_feed_service),
-) -> dict:
+    feed_service: FeedService = Depends(provide_feed_service),
+) -> ORJSONResponse:
     """
     Get all users who liked a post.
 
@@ -581,7 +517,7 @@ async def get_post_likes(
         feed_service: Feed service dependency
 
     Returns:
-        dict: Paginated likes with user info
+        ORJSONResponse: Paginated likes with user info
 
     Example:
         >>> GET /api/feed/posts/123e4567-e89b-12d3-a456-426614174000/likes?page=1
@@ -601,22 +537,15 @@ async def get_post_likes(
           "has_more": false
         }
     """
-    try:
-        likes_data = await feed_service.get_post_likes(
-            post_id=post_id, page=page, page_size=page_size
-        )
-
-        # Convert likes to LikeResponse models
-        return {
-            "likes": [LikeResponse(**like) for like in likes_data["likes"]],
+    likes_data = await feed_service.get_post_likes(post_id=post_id, page=page, page_size=page_size)
+
+    # Shape likes as LikeResponse models, then encode once with orjson
+    return ORJSONResponse(
+        {
+            "likes": [_mk_like(**like).model_dump(warnings=False) for like in likes_data["likes"]],
             "total": likes_data["total"],
             "page": likes_data["page"],
             "page_size": likes_data["page_size"],
             "has_more": likes_data["has_more"],
         }
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch post likes: {str(e)}",
-        )
+    )
@@ -8,9 +8,12 @@ managing search and filters, and handling likes.
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile, status
 
 from backend.api.dependencies.auth import get_current_user, get_optional_current_user
+from backend.api.dependencies.pagination import Pagination, likes_pagination, listing_pagination
+from backend.api.dependencies.services import provide_housing_service
+from backend.api.responses import cached_json_response
 from backend.core.models.auth import UserResponse
 from backend.core.models.housing import (
     HousingLikeResponse,
@@ -20,13 +23,7 @@ from backend.core.models.housing import (
     HousingListResponse,
     HousingSearchFilters,
 )
-from backend.core.services.housing import (
-    HousingService,
-    ListingNotFoundError,
-    UnauthorizedError,
-    ValidationError,
-    get_housing_service,
-)
+from backend.core.services.housing import HousingService
 
 # Create router
 router = APIRouter(
@@ -45,7 +42,7 @@ router = APIRouter(
 async def upload_housing_media(
     files: List[UploadFile] = File(..., description="Image files (max 10, max 10MB each)"),
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ) -> dict:
     """
     Upload images for housing listings.
@@ -72,27 +69,13 @@ async def upload_housing_media(
           "count": 1
         }
     """
-    try:
-        # Read files and prepare for service layer
-        file_data = []
-        for file in files:
-            content = await file.read()
-            file_data.append((content, file.content_type, file.filename))
-
-        # Delegate to service layer
-        result = await housing_service.upload_housing_media(
-            user_id=current_user.id, files=file_data
-        )
+    # Hand the spooled upload files to the service layer unread
+    file_data = [(file.file, file.content_type, file.filename) for file in files]
 
-        return result
+    # Delegate to service layer
+    result = await housing_service.upload_housing_media(user_id=current_user.id, files=file_data)
 
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Housing media upload failed: {str(e)}",
-        )
+    return result
 
 
 @router.delete(
@@ -105,7 +88,7 @@ async def upload_housing_media(
 async def delete_housing_media(
     image_url: str = Query(..., description="Public URL of the image to delete"),
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ) -> dict:
     """
     Delete a housing image from storage.
@@ -120,20 +103,9 @@ async def delete_housing_media(
     Returns:
         Success message
     """
-    try:
-        await housing_service.delete_housing_media(user_id=current_user.id, image_url=image_url)
-
-        return {"message": "Housing image deleted successfully", "image_url": image_url}
-
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete housing image: {str(e)}",
-        )
+    await housing_service.delete_housing_media(user_id=current_user.id, image_url=image_url)
+
+    return {"message": "Housing image deleted successfully", "image_url": image_url}
 
 
 @router.post(
@@ -146,7 +118,7 @@ async def delete_housing_media(
 async def create_listing(
     listing_data: HousingListingCreate,
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ) -> HousingListingResponse:
     """
     Create a new housing listing.
@@ -178,19 +150,10 @@ async def create_listing(
         >>>   "contact_email": "john@nyu.edu"
         >>> }
     """
-    try:
-        listing = await housing_service.create_listing(
-            user_id=current_user.id, listing_data=listing_data
-        )
-        return HousingListingResponse(**listing)
-
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create listing: {str(e)}",
-        )
+    listing = await housing_service.create_listing(
+        user_id=current_user.id, listing_data=listing_data
+    )
+    return HousingListingResponse(**listing)
 
 
 @router.get(
@@ -201,8 +164,8 @@ async def create_listing(
     description="Get paginated housing listings with optional filters and sorting.",
 )
 async def get_listings(
-    page: int = Query(1, ge=1, description="Page number (starts at 1)"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page (max 100)"),
+    request: Request,
+    pagination: Pagination = Depends(listing_pagination),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum monthly rent"),
     max_price: Optional[float] = Query(None, ge=0, description="Maximum monthly rent"),
     bedrooms: Optional[int] = Query(None, ge=0, description="Number of bedrooms"),
@@ -217,16 +180,19 @@ async def get_listings(
     ),
     sort_order: str = Query("desc", description="Sort order (asc, desc)"),
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
-) -> HousingListResponse:
+    housing_service: HousingService = Depends(provide_housing_service),
+) -> Response:
     """
     Get paginated housing listings with optional filters.
 
     Authentication is optional. Supports filtering by price, bedrooms, property type, location, etc.
+    Pages are served from a short-lived cache of the serialized response
+    (see X-Cache). Responses carry an ETag; a matching If-None-Match gets
+    304 Not Modified.
 
     Args:
-        page: Page number (default 1).
-        page_size: Items per page (default 20, max 100).
+        request: Incoming request (for If-None-Match).
+        pagination: Page number (default 1) and items per page (default 20, max 100).
         min_price: Minimum monthly rent filter.
         max_price: Maximum monthly rent filter.
         bedrooms: Number of bedrooms filter.
@@ -240,48 +206,42 @@ async def get_listings(
         housing_service: Housing service dependency.
 
     Returns:
-        HousingListResponse: Paginated list of listings.
+        Response: HousingListResponse JSON (paginated list of listings), or 304.
 
     Example:
         >>> GET /api/housing/listings?city=New%20York&min_price=1000&max_price=3000&bedrooms=2
     """
-    try:
-        # Build filters object from query params
-        filters = None
-        if any([min_price, max_price, bedrooms, bathrooms, property_type, city, state]):
-            filters = HousingSearchFilters(
-                min_price=min_price,
-                max_price=max_price,
-                bedrooms=bedrooms,
-                bathrooms=bathrooms,
-                property_type=property_type,
-                city=city,
-                state=state,
-            )
-
-        current_user_id = current_user.id if current_user else None
-        listings_data = await housing_service.get_listings(
-            filters=filters,
-            current_user_id=current_user_id,
-            page=page,
-            page_size=page_size,
-            sort_by=sort_by,
-            sort_order=sort_order,
+    # Build filters object from query params; 0 is a real filter value, so
+    # test for None rather than truthiness
+    filters = None
+    if any(
+        value is not None
+        for value in (min_price, max_price, bedrooms, bathrooms, property_type, city, state)
+    ):
+        filters = HousingSearchFilters(
+            min_price=min_price,
+            max_price=max_price,
+            bedrooms=bedrooms,
+            bathrooms=bathrooms,
+            property_type=property_type,
+            city=city,
+            state=state,
         )
 
-        return HousingListResponse(
-            listings=[HousingListingResponse(**listing) for listing in listings_data["listings"]],
-            total=listings_data["total"],
-            page=listings_data["page"],
-            page_size=listings_data["page_size"],
-            has_more=listings_data["has_more"],
-        )
+    current_user_id = current_user.id if current_user else None
+    body, cache_hit = await housing_service.get_listings_json(
+        filters=filters,
+        current_user_id=current_user_id,
+        page=pagination.page,
+        page_size=pagination.page_size,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch listings: {str(e)}",
-        )
+    # Pre-serialized HousingListResponse JSON, answered with 304 when unchanged
+    response = cached_json_response(request, body, max_age=0)
+    response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+    return response
 
 
 @router.get(
@@ -294,7 +254,7 @@ async def get_listings(
 async def get_listing(
     listing_id: UUID,
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ) -> HousingListingResponse:
     """
     Get a single housing listing by ID.
@@ -317,20 +277,11 @@ async def get_listing(
     Example:
         >>> GET /api/housing/listings/123e4567-e89b-12d3-a456-426614174000
     """
-    try:
-        current_user_id = current_user.id if current_user else None
-        listing = await housing_service.get_listing_by_id(
-            listing_id=listing_id, current_user_id=current_user_id, increment_views=True
-        )
-        return HousingListingResponse(**listing)
-
-    except ListingNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch listing: {str(e)}",
-        )
+    current_user_id = current_user.id if current_user else None
+    listing = await housing_service.get_listing_by_id(
+        listing_id=listing_id, current_user_id=current_user_id, increment_views=True
+    )
+    return HousingListingResponse(**listing)
 
 
 @router.get(
@@ -341,12 +292,12 @@ async def get_listing(
     description="Search housing listings by city, state, or address.",
 )
 async def search_listings(
+    request: Request,
     q: str = Query(..., min_length=2, description="Search query (city, state, or address)"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    pagination: Pagination = Depends(listing_pagination),
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
-) -> HousingListResponse:
+    housing_service: HousingService = Depends(provide_housing_service),
+) -> Response:
     """
     Search housing listings by location.
 
@@ -354,37 +305,30 @@ async def search_listings(
     Authentication is optional.
 
     Args:
+        request: Incoming request (for If-None-Match).
         q: Search query string (minimum 2 characters).
-        page: Page number (default 1).
-        page_size: Items per page (default 20, max 100).
+        pagination: Page number (default 1) and items per page (default 20, max 100).
         current_user: Optional authenticated user.
         housing_service: Housing service dependency.
 
     Returns:
-        HousingListResponse: Paginated list of matching listings.
+        Response: HousingListResponse JSON (paginated matching listings), or 304.
 
     Example:
         >>> GET /api/housing/search?q=Brooklyn&page=1
     """
-    try:
-        current_user_id = current_user.id if current_user else None
-        listings_data = await housing_service.search_by_location(
-            query=q, current_user_id=current_user_id, page=page, page_size=page_size
-        )
-
-        return HousingListResponse(
-            listings=[HousingListingResponse(**listing) for listing in listings_data["listings"]],
-            total=listings_data["total"],
-            page=listings_data["page"],
-            page_size=listings_data["page_size"],
-            has_more=listings_data["has_more"],
-        )
+    current_user_id = current_user.id if current_user else None
+    body, cache_hit = await housing_service.search_by_location_json(
+        query=q,
+        current_user_id=current_user_id,
+        page=pagination.page,
+        page_size=pagination.page_size,
+    )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to search listings: {str(e)}",
-        )
+    # Pre-serialized HousingListResponse JSON, answered with 304 when unchanged
+    response = cached_json_response(request, body, max_age=0)
+    response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+    return response
 
 
 @router.get(
@@ -395,55 +339,46 @@ async def search_listings(
     description="Get all housing listings by a specific user.",
 )
 async def get_user_listings(
+    request: Request,
     user_id: UUID,
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    pagination: Pagination = Depends(listing_pagination),
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
-) -> HousingListResponse:
+    housing_service: HousingService = Depends(provide_housing_service),
+) -> Response:
     """
     Get all listings by a specific user.
 
     Authentication is optional. If viewing own listings, includes inactive listings.
 
     Args:
+        request: Incoming request (for If-None-Match).
         user_id: User's unique identifier.
-        page: Page number (default 1).
-        page_size: Items per page (default 20, max 100).
+        pagination: Page number (default 1) and items per page (default 20, max 100).
         current_user: Optional authenticated user.
         housing_service: Housing service dependency.
 
     Returns:
-        HousingListResponse: Paginated list of user's listings.
+        Response: HousingListResponse JSON (paginated user's listings), or 304.
 
     Example:
         >>> GET /api/housing/users/456e7890-e89b-12d3-a456-426614174111/listings
     """
-    try:
-        current_user_id = current_user.id if current_user else None
-        include_inactive = (current_user_id == user_id) if current_user_id else False
-
-        listings_data = await housing_service.get_user_listings(
-            user_id=user_id,
-            current_user_id=current_user_id,
-            page=page,
-            page_size=page_size,
-            include_inactive=include_inactive,
-        )
+    current_user_id = current_user.id if current_user else None
+    # Owners see their inactive listings too; None never equals a UUID
+    include_inactive = current_user_id == user_id
 
-        return HousingListResponse(
-            listings=[HousingListingResponse(**listing) for listing in listings_data["listings"]],
-            total=listings_data["total"],
-            page=listings_data["page"],
-            page_size=listings_data["page_size"],
-            has_more=listings_data["has_more"],
-        )
+    body, cache_hit = await housing_service.get_user_listings_json(
+        user_id=user_id,
+        current_user_id=current_user_id,
+        page=pagination.page,
+        page_size=pagination.page_size,
+        include_inactive=include_inactive,
+    )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch user listings: {str(e)}",
-        )
+    # Pre-serialized HousingListResponse JSON, answered with 304 when unchanged
+    response = cached_json_response(request, body, max_age=0)
+    response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+    return response
 
 
 @router.put(
@@ -457,7 +392,7 @@ async def update_listing(
     listing_id: UUID,
     listing_data: HousingListingUpdate,
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ) -> HousingListingResponse:
     """
     Update an existing housing listing.
@@ -486,23 +421,10 @@ async def update_listing(
         >>>   "price": 2600.00
         >>> }
     """
-    try:
-        listing = await housing_service.update_listing(
-            listing_id=listing_id, user_id=current_user.id, update_data=listing_data
-        )
-        return HousingListingResponse(**listing)
-
-    except ListingNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update listing: {str(e)}",
-        )
+    listing = await housing_service.update_listing(
+        listing_id=listing_id, user_id=current_user.id, update_data=listing_data
+    )
+    return HousingListingResponse(**listing)
 
 
 @router.delete(
@@ -514,7 +436,7 @@ async def update_listing(
 async def delete_listing(
     listing_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ):
     """
     Soft delete a housing listing (set is_active = False).
@@ -536,19 +458,8 @@ async def delete_listing(
     Example:
         >>> DELETE /api/housing/listings/123e4567-e89b-12d3-a456-426614174000
     """
-    try:
-        await housing_service.delete_listing(listing_id=listing_id, user_id=current_user.id)
-        return None
-
-    except ListingNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete listing: {str(e)}",
-        )
+    await housing_service.delete_listing(listing_id=listing_id, user_id=current_user.id)
+    return None
 
 
 @router.post(
@@ -561,7 +472,7 @@ async def delete_listing(
 async def activate_listing(
     listing_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ) -> HousingListingResponse:
     """
     Activate a deactivated listing (set is_active = True).
@@ -585,21 +496,8 @@ async def activate_listing(
     Example:
         >>> POST /api/housing/listings/123e4567-e89b-12d3-a456-426614174000/activate
     """
-    try:
-        listing = await housing_service.activate_listing(
-            listing_id=listing_id, user_id=current_user.id
-        )
-        return HousingListingResponse(**listing)
-
-    except ListingNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to activate listing: {str(e)}",
-        )
+    listing = await housing_service.activate_listing(listing_id=listing_id, user_id=current_user.id)
+    return HousingListingResponse(**listing)
 
 
 @router.post(
@@ -612,7 +510,7 @@ async def activate_listing(
 async def deactivate_listing(
     listing_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ) -> HousingListingResponse:
     """
     Deactivate a listing (set is_active = False).
@@ -636,23 +534,10 @@ async def deactivate_listing(
     Example:
         >>> POST /api/housing/listings/123e4567-e89b-12d3-a456-426614174000/deactivate
     """
-    try:
-        await housing_service.deactivate_listing(listing_id=listing_id, user_id=current_user.id)
-        # Fetch the deactivated listing to return
-        listing = await housing_service.get_listing_by_id(
-            listing_id=listing_id, current_user_id=current_user.id, increment_views=False
-        )
-        return HousingListingResponse(**listing)
-
-    except ListingNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to deactivate listing: {str(e)}",
-        )
+    listing = await housing_service.deactivate_listing(
+        listing_id=listing_id, user_id=current_user.id
+    )
+    return HousingListingResponse(**listing)
 
 
 @router.post(
@@ -665,7 +550,7 @@ async def deactivate_listing(
 async def like_listing(
     listing_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ) -> HousingLikeResponse:
     """
     Like a housing listing.
@@ -689,17 +574,8 @@ async def like_listing(
     Example:
         >>> POST /api/housing/listings/123e4567-e89b-12d3-a456-426614174000/like
     """
-    try:
-        like = await housing_service.like_listing(listing_id=listing_id, user_id=current_user.id)
-        return HousingLikeResponse(**like)
-
-    except ListingNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to like listing: {str(e)}",
-        )
+    like = await housing_service.like_listing(listing_id=listing_id, user_id=current_user.id)
+    return HousingLikeResponse(**like)
 
 
 @router.delete(
@@ -711,7 +587,7 @@ async def like_listing(
 async def unlike_listing(
     listing_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    housing_service: HousingService = Depends(get_housing_service),
+    housing_service: HousingService = Depends(provide_housing_service),
 ):
     """
     Unlike a housing listing.
@@ -731,15 +607,8 @@ async def unlike_listing(
     Example:
         >>> DELETE /api/housing/listings/123e4567-e89b-12d3-a456-426614174000/like
     """
-    try:
-        await housing_service.unlike_listing(listing_id=listing_id, user_id=current_user.id)
-        return None
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to unlike listing: {str(e)}",
-        )
+    await housing_service.unlike_listing(listing_id=listing_id, user_id=current_user.id)
+    return None
 
 
 @router.get(
@@ -750,24 +619,24 @@ async def unlike_listing(
     description="Get list of users who liked a housing listing with pagination.",
 )
 async def get_listing_likes(
+    request: Request,
     listing_id: UUID,
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(50, ge=1, le=100, description="Likes per page"),
-    housing_service: HousingService = Depends(get_housing_service),
-) -> dict:
+    pagination: Pagination = Depends(likes_pagination),
+    housing_service: HousingService = Depends(provide_housing_service),
+) -> Response:
     """
     Get all users who liked a listing.
 
     Returns paginated list of likes with user information.
 
     Args:
+        request: Incoming request (for If-None-Match).
         listing_id: Listing unique identifier.
-        page: Page number (default 1).
-        page_size: Likes per page (default 50, max 100).
+        pagination: Page number (default 1) and likes per page (default 50, max 100).
         housing_service: Housing service dependency.
 
     Returns:
-        dict: Paginated likes with user info.
+        Response: Paginated likes with user info as JSON, or 304.
 
     Example:
         >>> GET /api/housing/listings/123e4567-e89b-12d3-a456-426614174000/likes?page=1
@@ -787,24 +656,11 @@ async def get_listing_likes(
           "has_more": false
         }
     """
-    try:
-        likes_data = await housing_service.get_listing_likes(
-            listing_id=listing_id, page=page, page_size=page_size
-        )
-
-        # Convert likes to HousingLikeResponse models
-        return {
-            "likes": [HousingLikeResponse(**like) for like in likes_data["likes"]],
-            "total": likes_data["total"],
-            "page": likes_data["page"],
-            "page_size": likes_data["page_size"],
-            "has_more": likes_data["has_more"],
-        }
-
-    except ListingNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch listing likes: {str(e)}",
-        )
+    body, cache_hit = await housing_service.get_listing_likes_json(
+        listing_id=listing_id, page=pagination.page, page_size=pagination.page_size
+    )
+
+    # Pre-serialized likes page, answered with 304 when unchanged
+    response = cached_json_response(request, body, max_age=0)
+    response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+    return response
@@ -6,10 +6,12 @@ Endpoints for chatting with Olive AI assistant and managing conversations.
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from pydantic import BaseModel, Field
 
 from backend.api.dependencies.auth import get_current_user
+from backend.api.dependencies.services import provide_olive_service
+from backend.api.responses import ORJSONResponse, cached_json_response
 from backend.core.models.auth import UserResponse
 from backend.core.models.olive import (
     OliveChatRequest,
@@ -20,13 +22,10 @@ from backend.core.models.olive import (
     OliveConversationResponse,
     OliveMessageResponse,
 )
-from backend.core.services.olive import (
-    ConversationNotFoundError,
-    GroqAPIError,
-    OliveService,
-    UnauthorizedError,
-    get_olive_service,
-)
+from backend.core.services.olive import OliveService
+
+# Build response models from trusted service-layer rows without re-validating them
+_mk_message = OliveMessageResponse.model_construct
 
 # Create router
 router = APIRouter(
@@ -51,7 +50,7 @@ class TitleUpdateRequest(BaseModel):
 async def chat_with_olive(
     chat_request: OliveChatRequest,
     current_user: UserResponse = Depends(get_current_user),
-    olive_service: OliveService = Depends(get_olive_service),
+    olive_service: OliveService = Depends(provide_olive_service),
 ) -> OliveChatResponse:
     """
     Chat with Olive AI assistant.
@@ -87,42 +86,18 @@ async def chat_with_olive(
         >>>   "conversation_id": null
         >>> }
     """
-    try:
-        user_id = current_user.id
-
-        result = await olive_service.chat(
-            user_id=user_id,
-            message=chat_request.message,
-            conversation_id=chat_request.conversation_id,
-            system_prompt=chat_request.system_prompt,
-        )
-
-        return OliveChatResponse(
-            conversation_id=result["conversation_id"],
-            user_message=OliveMessageResponse(**result["user_message"]),
-            assistant_message=OliveMessageResponse(**result["assistant_message"]),
-        )
-
-    except GroqAPIError:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="AI service temporarily unavailable. Please try again in a moment.",
-        )
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        error_msg = str(e).lower()
-        if "rate limit" in error_msg or "api" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="AI service temporarily unavailable due to high demand.",
-            )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to process chat request: {str(e)}",
-        )
+    result = await olive_service.chat(
+        user_id=current_user.id,
+        message=chat_request.message,
+        conversation_id=chat_request.conversation_id,
+        system_prompt=chat_request.system_prompt,
+    )
+
+    return OliveChatResponse(
+        conversation_id=result["conversation_id"],
+        user_message=OliveMessageResponse(**result["user_message"]),
+        assistant_message=OliveMessageResponse(**result["assistant_message"]),
+    )
 
 
 @router.post(
@@ -135,7 +110,7 @@ async def chat_with_olive(
 async def create_conversation(
     conversation_data: OliveConversationCreate,
     current_user: UserResponse = Depends(get_current_user),
-    olive_service: OliveService = Depends(get_olive_service),
+    olive_service: OliveService = Depends(provide_olive_service),
 ) -> OliveConversationResponse:
     """
     Create a new Olive AI conversation.
@@ -161,20 +136,13 @@ async def create_conversation(
         >>>   "title": "Housing Rights Discussion"
         >>> }
     """
-    try:
-        user_id = current_user.id
+    user_id = current_user.id
 
-        conversation = await olive_service.create_conversation(
-            user_id=user_id, title=conversation_data.title
-        )
+    conversation = await olive_service.create_conversation(
+        user_id=user_id, title=conversation_data.title
+    )
 
-        return OliveConversationResponse(**conversation)
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create conversation: {str(e)}",
-        )
+    return OliveConversationResponse(**conversation)
 
 
 @router.get(
@@ -185,25 +153,30 @@ async def create_conversation(
     description="Get all Olive AI conversations for the current user.",
 )
 async def get_conversations(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page (max 100)"),
     current_user: UserResponse = Depends(get_current_user),
-    olive_service: OliveService = Depends(get_olive_service),
-) -> OliveConversationListResponse:
+    olive_service: OliveService = Depends(provide_olive_service),
+) -> Response:
     """
     Get all Olive AI conversations for the current user.
 
     Conversations are ordered by most recent first.
     Includes message count and last message timestamp.
+    Pages are served from a short-lived cache of the serialized response
+    (see X-Cache). Responses carry an ETag; a matching If-None-Match gets
+    304 Not Modified.
 
     Args:
+        request: Incoming request (for If-None-Match).
         page: Page number (default 1).
         page_size: Items per page (default 20, max 100).
         current_user: Authenticated user.
         olive_service: Olive service dependency.
 
     Returns:
-        OliveConversationListResponse: Paginated list of conversations.
+        Response: OliveConversationListResponse JSON (paginated list of conversations), or 304.
 
     Raises:
         HTTPException 401: Not authenticated.
@@ -213,27 +186,14 @@ async def get_conversations(
         >>> GET /api/olive/conversations?page=1&page_size=20
         >>> Authorization: Bearer <token>
     """
-    try:
-        user_id = current_user.id
-
-        conversations = await olive_service.get_user_conversations(
-            user_id=user_id, page=page, page_size=page_size
-        )
+    body, cache_hit = await olive_service.get_user_conversations_json(
+        user_id=current_user.id, page=page, page_size=page_size
+    )
 
-        return OliveConversationListResponse(
-            conversations=[
-                OliveConversationResponse(**conv) for conv in conversations["conversations"]
-            ],
-            total=conversations["total"],
-            page=conversations["page"],
-            page_size=conversations["page_size"],
-        )
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch conversations: {str(e)}",
-        )
+    # Pre-serialized OliveConversationListResponse JSON, answered with 304 when unchanged
+    response = cached_json_response(request, body, max_age=0)
+    response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+    return response
 
 
 @router.get(
@@ -246,8 +206,8 @@ async def get_conversations(
 async def get_conversation(
     conversation_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    olive_service: OliveService = Depends(get_olive_service),
-) -> OliveConversationDetailResponse:
+    olive_service: OliveService = Depends(provide_olive_service),
+) -> ORJSONResponse:
     """
     Get conversation with all messages.
 
@@ -260,7 +220,7 @@ async def get_conversation(
         olive_service: Olive service dependency.
 
     Returns:
-        OliveConversationDetailResponse: Conversation with all messages.
+        ORJSONResponse: OliveConversationDetailResponse JSON (conversation with all messages).
 
     Raises:
         HTTPException 401: Not authenticated.
@@ -272,24 +232,15 @@ async def get_conversation(
         >>> GET /api/olive/conversations/123e4567-e89b-12d3-a456-426614174000
         >>> Authorization: Bearer <token>
     """
-    try:
-        user_id = current_user.id
-
-        conversation = await olive_service.get_conversation(
-            conversation_id=conversation_id, user_id=user_id
-        )
+    user_id = current_user.id
 
-        return OliveConversationDetailResponse(**conversation)
+    conversation = await olive_service.get_conversation(
+        conversation_id=conversation_id, user_id=user_id
+    )
 
-    except ConversationNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch conversation: {str(e)}",
-        )
+    conversation["messages"] = [_mk_message(**msg) for msg in conversation["messages"]]
+    detail = OliveConversationDetailResponse.model_construct(**conversation)
+    return ORJSONResponse(detail.model_dump(warnings=False))
 
 
 @router.put(
@@ -303,7 +254,7 @@ async def update_conversation_title(
     conversation_id: UUID,
     title_data: TitleUpdateRequest,
     current_user: UserResponse = Depends(get_current_user),
-    olive_service: OliveService = Depends(get_olive_service),
+    olive_service: OliveService = Depends(provide_olive_service),
 ) -> OliveConversationResponse:
     """
     Update conversation title.
@@ -333,26 +284,13 @@ async def update_conversation_title(
         >>>   "title": "NYC Housing Rights"
         >>> }
     """
-    try:
-        user_id = current_user.id
-
-        conversation = await olive_service.update_conversation_title(
-            conversation_id=conversation_id, user_id=user_id, title=title_data.title
-        )
+    user_id = current_user.id
 
-        return OliveConversationResponse(**conversation)
+    conversation = await olive_service.update_conversation_title(
+        conversation_id=conversation_id, user_id=user_id, title=title_data.title
+    )
 
-    except ConversationNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update conversation title: {str(e)}",
-        )
+    return OliveConversationResponse(**conversation)
 
 
 @router.delete(
@@ -364,7 +302,7 @@ async def update_conversation_title(
 async def delete_conversation(
     conversation_id: UUID,
     current_user: UserResponse = Depends(get_current_user),
-    olive_service: OliveService = Depends(get_olive_service),
+    olive_service: OliveService = Depends(provide_olive_service),
 ):
     """
     Delete conversation and all its messages.
@@ -387,19 +325,8 @@ async def delete_conversation(
         >>> DELETE /api/olive/conversations/123e4567-e89b-12d3-a456-426614174000
         >>> Authorization: Bearer <token>
     """
-    try:
-        user_id = current_user.id
-
-        await olive_service.delete_conversation(conversation_id=conversation_id, user_id=user_id)
-
-        return None
-
-    except ConversationNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except UnauthorizedError as e:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete conversation: {str(e)}",
-        )
+    user_id = current_user.id
+
+    await olive_service.delete_conversation(conversation_id=conversation_id, user_id=user_id)
+
+    return None
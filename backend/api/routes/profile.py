@@ -4,14 +4,15 @@ Profile API routes.
 Endpoints for viewing, updating, and searching user profiles.
 """
 
-import uuid as uuid_module
-from pathlib import Path
 from typing import Optional, Union
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 
 from backend.api.dependencies.auth import get_current_user, get_optional_current_user
+from backend.api.dependencies.services import provide_profile_service
+from backend.api.responses import cached_json_response
 from backend.core.models.auth import UserResponse
 from backend.core.models.profile import (
     ProfileListResponse,
@@ -22,12 +23,8 @@ from backend.core.models.profile import (
     ProfileUpdate,
     PublicProfileResponse,
 )
-from backend.core.services.profile import (
-    ProfileNotFoundError,
-    ProfileService,
-    ValidationError,
-    get_profile_service,
-)
+from backend.core.services.profile import ProfileService
+from backend.core.utils import open_upload_stream, sniff_image_type, upload_size
 from backend.db import supabase
 
 # Create router
@@ -36,6 +33,15 @@ router = APIRouter(
     tags=["Profile"],
 )
 
+# Image types accepted for profile pictures, and the list quoted back on rejection
+_ALLOWED_IMAGE_CT: frozenset[str] = frozenset({"image/jpeg", "image/png", "image/webp"})
+_ALLOWED_IMAGE_CT_MSG = ", ".join(sorted(_ALLOWED_IMAGE_CT))
+_EXT_BY_CT = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}
+
+# Client/CDN cache lifetime for profile reads, in seconds
+_PROFILE_MAX_AGE = 60
+_PROFILE_STALE_WHILE_REVALIDATE = 30
+
 
 @router.get(
     "/me",
@@ -46,7 +52,7 @@ router = APIRouter(
 )
 async def get_my_profile(
     current_user: UserResponse = Depends(get_current_user),
-    profile_service: ProfileService = Depends(get_profile_service),
+    profile_service: ProfileService = Depends(provide_profile_service),
 ) -> ProfileResponse:
     """
     Get current user's complete profile.
@@ -69,17 +75,8 @@ async def get_my_profile(
         >>> GET /api/profile/me
         >>> Authorization: Bearer <token>
     """
-    try:
-        profile = await profile_service.get_current_user_profile(user_id=current_user.id)
-        return ProfileResponse(**profile)
-
-    except ProfileNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch profile: {str(e)}",
-        )
+    profile = await profile_service.get_current_user_profile(user_id=current_user.id)
+    return ProfileResponse(**profile)
 
 
 @router.put(
@@ -92,7 +89,7 @@ async def get_my_profile(
 async def update_my_profile(
     update_data: ProfileUpdate,
     current_user: UserResponse = Depends(get_current_user),
-    profile_service: ProfileService = Depends(get_profile_service),
+    profile_service: ProfileService = Depends(provide_profile_service),
 ) -> ProfileResponse:
     """
     Update current user's profile.
@@ -123,21 +120,10 @@ async def update_my_profile(
         >>>   "phone_number": "+1-555-0100"
         >>> }
     """
-    try:
-        updated_profile = await profile_service.update_profile(
-            user_id=current_user.id, update_data=update_data
-        )
-        return ProfileResponse(**updated_profile)
-
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except ProfileNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update profile: {str(e)}",
-        )
+    updated_profile = await profile_service.update_profile(
+        user_id=current_user.id, update_data=update_data
+    )
+    return ProfileResponse(**updated_profile)
 
 
 @router.get(
@@ -149,21 +135,25 @@ async def update_my_profile(
     "public profile otherwise.",
 )
 async def get_user_profile(
+    request: Request,
     user_id: UUID,
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    profile_service: ProfileService = Depends(get_profile_service),
-) -> Union[ProfileResponse, PublicProfileResponse]:
+    profile_service: ProfileService = Depends(provide_profile_service),
+) -> Response:
     """
     Get user profile by ID.
     If viewing own profile, returns complete ProfileResponse.
     If viewing another user's profile, returns PublicProfileResponse (no email, no phone).
+    Responses carry an ETag and answer If-None-Match with 304; anonymous
+    views may also be stored by shared caches.
     Args:
+        request: Incoming request (read for If-None-Match).
         user_id: User ID to fetch.
         current_user: Optional authenticated user.
         profile_service: Profile service dependency.
 
     Returns:
-        Union[ProfileResponse, PublicProfileResponse]: Full or public profile.
+        Response: Full (ProfileResponse) or public (PublicProfileResponse) profile JSON.
 
     Raises:
         HTTPException 404: User not found.
@@ -172,25 +162,20 @@ async def get_user_profile(
     Example:
         >>> GET /api/profile/123e4567-e89b-12d3-a456-426614174000
     """
-    try:
-        viewer_id = current_user.id if current_user else None
-        profile = await profile_service.get_profile_by_id(profile_id=user_id, viewer_id=viewer_id)
-
-        # Determine if this is own profile
-        is_own_profile = current_user and current_user.id == user_id
-
-        if is_own_profile:
-            return ProfileResponse(**profile)
-        else:
-            return PublicProfileResponse(**profile)
-
-    except ProfileNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch profile: {str(e)}",
-        )
+    viewer_id = current_user.id if current_user else None
+    profile = await profile_service.get_profile_by_id(profile_id=user_id, viewer_id=viewer_id)
+
+    # Validate once against the model for this viewer; the public model
+    # drops email and phone, and the response skips FastAPI's second pass
+    is_own_profile = current_user and current_user.id == user_id
+    profile_model = ProfileResponse if is_own_profile else PublicProfileResponse
+    return cached_json_response(
+        request,
+        profile_model.model_validate(profile).model_dump_json().encode(),
+        max_age=_PROFILE_MAX_AGE,
+        public=current_user is None,
+        stale_while_revalidate=_PROFILE_STALE_WHILE_REVALIDATE,
+    )
 
 
 @router.get(
@@ -202,7 +187,7 @@ async def get_user_profile(
 )
 async def get_my_stats(
     current_user: UserResponse = Depends(get_current_user),
-    profile_service: ProfileService = Depends(get_profile_service),
+    profile_service: ProfileService = Depends(provide_profile_service),
 ) -> ProfileStatsResponse:
     """
     Get current user's profile statistics.
@@ -229,17 +214,8 @@ async def get_my_stats(
         >>> GET /api/profile/me/stats
         >>> Authorization: Bearer <token>
     """
-    try:
-        stats = await profile_service.get_profile_stats(user_id=current_user.id)
-        return ProfileStatsResponse(**stats)
-
-    except ProfileNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch profile stats: {str(e)}",
-        )
+    stats = await profile_service.get_profile_stats(user_id=current_user.id)
+    return ProfileStatsResponse(**stats)
 
 
 @router.post(
@@ -252,8 +228,8 @@ async def get_my_stats(
 async def search_profiles(
     search_request: ProfileSearchRequest,
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    profile_service: ProfileService = Depends(get_profile_service),
-) -> ProfileListResponse:
+    profile_service: ProfileService = Depends(provide_profile_service),
+) -> Response:
     """
     Search for user profiles.
 
@@ -263,7 +239,9 @@ async def search_profiles(
     - Interests (profiles with at least one matching interest)
     - Graduation year (exact match)
 
-    Results exclude the current user's own profile.
+    Results exclude the current user's own profile. Result pages are cached
+    for a short time (see X-Cache), so profile edits can take that long to
+    show up.
 
     Args:
         search_request: Search criteria and pagination.
@@ -271,7 +249,7 @@ async def search_profiles(
         profile_service: Profile service dependency.
 
     Returns:
-        ProfileListResponse: Paginated list of public profiles.
+        Response: ProfileListResponse JSON (paginated list of public profiles).
 
     Raises:
         HTTPException 400: Invalid search criteria.
@@ -288,20 +266,17 @@ async def search_profiles(
         >>>   "page_size": 20
         >>> }
     """
-    try:
-        viewer_id = current_user.id if current_user else None
-        result = await profile_service.search_profiles(
-            search_request=search_request, viewer_id=viewer_id
-        )
-        return ProfileListResponse(**result)
+    viewer_id = current_user.id if current_user else None
+    body, cache_hit = await profile_service.search_profiles_json(
+        search_request=search_request, viewer_id=viewer_id
+    )
 
-    except ValidationError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to search profiles: {str(e)}",
-        )
+    # Pre-serialized ProfileListResponse JSON
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Cache": "HIT" if cache_hit else "MISS"},
+    )
 
 
 @router.post(
@@ -314,7 +289,7 @@ async def search_profiles(
 async def upload_profile_picture(
     file: UploadFile = File(..., description="Profile picture image file"),
     current_user: UserResponse = Depends(get_current_user),
-    profile_service: ProfileService = Depends(get_profile_service),
+    profile_service: ProfileService = Depends(provide_profile_service),
 ) -> ProfilePictureUploadResponse:
     """
     Upload profile picture.
@@ -345,58 +320,56 @@ async def upload_profile_picture(
         >>> file: <image_file>
     """
     # Validate file type
-    allowed_types = ["image/jpeg", "image/png", "image/webp"]
-    if file.content_type not in allowed_types:
+    if file.content_type not in _ALLOWED_IMAGE_CT:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type '{file.content_type}'. Allowed: {', '.join(allowed_types)}",
+            detail=f"Invalid file type '{file.content_type}'. Allowed: {_ALLOWED_IMAGE_CT_MSG}",
         )
 
-    try:
-        # Read file contents
-        contents = await file.read()
-
-        # Validate file size (2MB)
-        max_size = 20 * 1024 * 1024  # 20MB in bytes
-        if len(contents) > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"File size ({len(contents)} bytes) exceeds 2MB limit",
-            )
-
-        # Generate unique filename
-        extension = Path(file.filename).suffix if file.filename else ".jpg"
-        filename = f"{uuid_module.uuid4()}{extension}"
-
-        # Upload to Supabase Storage
-        user_id = current_user.id
-        storage_path = f"{user_id}/{filename}"
-
-        # Upload file
-        supabase.storage.from_("profile-pictures").upload(
-            path=storage_path, file=contents, file_options={"content-type": file.content_type}
+    # Validate file size (20MB) from the spooled upload, without reading it
+    max_size = 20 * 1024 * 1024  # 20MB in bytes
+    file_size = upload_size(file.file)
+    if file_size > max_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size ({file_size} bytes) exceeds 20MB limit",
         )
 
-        # Get public URL
-        public_url = supabase.storage.from_("profile-pictures").get_public_url(storage_path)
-
-        # Update profile with new picture URL
-        await profile_service.update_profile(
-            user_id=user_id, update_data=ProfileUpdate(profile_picture_url=public_url)
+    # Check the file header matches the declared type before uploading anything
+    if sniff_image_type(file.file) != file.content_type:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File content is not a valid '{file.content_type}' image",
         )
 
-        return ProfilePictureUploadResponse(
-            profile_picture_url=public_url, message="Profile picture uploaded successfully"
-        )
+    # Generate unique filename; the extension follows the verified content type
+    filename = f"{uuid4().hex}{_EXT_BY_CT[file.content_type]}"
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload profile picture: {str(e)}",
+    # Upload to Supabase Storage
+    user_id = current_user.id
+    storage_path = f"{user_id}/{filename}"
+
+    # Upload file, streamed from the spooled upload off the event loop
+    with open_upload_stream(file.file) as stream:
+        await run_in_threadpool(
+            supabase.storage.from_("profile-pictures").upload,
+            path=storage_path,
+            file=stream,
+            file_options={"content-type": file.content_type},
         )
 
+    # Get public URL (built locally, no request)
+    public_url = supabase.storage.from_("profile-pictures").get_public_url(storage_path)
+
+    # Update profile with new picture URL
+    await profile_service.update_profile(
+        user_id=user_id, update_data=ProfileUpdate(profile_picture_url=public_url)
+    )
+
+    return ProfilePictureUploadResponse(
+        profile_picture_url=public_url, message="Profile picture uploaded successfully"
+    )
+
 
 @router.delete(
     "/me/picture",
@@ -406,7 +379,7 @@ async def upload_profile_picture(
 )
 async def delete_profile_picture(
     current_user: UserResponse = Depends(get_current_user),
-    profile_service: ProfileService = Depends(get_profile_service),
+    profile_service: ProfileService = Depends(provide_profile_service),
 ):
     """
     Delete profile picture.
@@ -426,17 +399,8 @@ async def delete_profile_picture(
         >>> DELETE /api/profile/me/picture
         >>> Authorization: Bearer <token>
     """
-    try:
-        await profile_service.delete_profile_picture(user_id=current_user.id)
-        return None
-
-    except ProfileNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete profile picture: {str(e)}",
-        )
+    await profile_service.delete_profile_picture(user_id=current_user.id)
+    return None
 
 
 @router.get(
@@ -447,23 +411,26 @@ async def delete_profile_picture(
     description="Search for a user by email address. Returns public profile if found.",
 )
 async def get_user_by_email(
+    request: Request,
     email: str,
     current_user: Optional[UserResponse] = Depends(get_optional_current_user),
-    profile_service: ProfileService = Depends(get_profile_service),
-) -> PublicProfileResponse:
+    profile_service: ProfileService = Depends(provide_profile_service),
+) -> Response:
     """
     Find user by email address.
 
     Searches by email or university_email. Useful for finding users to start
-    conversations with.
+    conversations with. Responses carry an ETag and answer If-None-Match
+    with 304; anonymous lookups may also be stored by shared caches.
 
     Args:
+        request: Incoming request (read for If-None-Match).
         email: Email address to search for.
         current_user: Optional authenticated user.
         profile_service: Profile service dependency.
 
     Returns:
-        PublicProfileResponse: Public profile of the found user.
+        Response: Public profile (PublicProfileResponse) JSON of the found user.
 
     Raises:
         HTTPException 404: User not found.
@@ -472,20 +439,17 @@ async def get_user_by_email(
     Example:
         >>> GET /api/profile/email/john.doe@nyu.edu
     """
-    try:
-        profile = await profile_service.get_user_by_email(email=email)
-
-        if profile is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail=f"User with email '{email}' not found"
-            )
+    profile = await profile_service.get_user_by_email(email=email)
 
-        return PublicProfileResponse(**profile)
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if profile is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to search user by email: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"User with email '{email}' not found"
         )
+
+    return cached_json_response(
+        request,
+        PublicProfileResponse(**profile),
+        max_age=_PROFILE_MAX_AGE,
+        public=current_user is None,
+        stale_while_revalidate=_PROFILE_STALE_WHILE_REVALIDATE,
+    )
@@ -0,0 +1,39 @@
+"""
+Logging configuration for Uniboe backend.
+
+Log records are handed to a QueueHandler and written by a QueueListener on a
+background thread, so request handlers never block on stream I/O.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from backend.config.settings import settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+def configure_logging() -> QueueListener:
+    """
+    Route the `backend` logger through a queue drained on a background thread.
+
+    Returns:
+        QueueListener: Started listener; call `stop()` on shutdown to flush
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logger = logging.getLogger("backend")
+    logger.handlers = [QueueHandler(log_queue)]
+    logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+    logger.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+__all__ = ["configure_logging"]
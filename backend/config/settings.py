@@ -5,8 +5,10 @@ This module handles all environment variables and application configuration
 using Pydantic Settings for validation and type safety.
 """
 
+from functools import cached_property
+from ipaddress import IPv4Network, IPv6Network, ip_network
 from pathlib import Path
-from typing import List, Literal
+from typing import List, Literal, Union
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -33,6 +35,12 @@ class Settings(BaseSettings):
         ..., description="Supabase service role key (server-side only)"
     )
     SUPABASE_ANON_KEY: str = Field(..., description="Supabase anonymous/public key")
+    SUPABASE_JWT_SECRET: str = Field(
+        default="", description="Supabase JWT secret for local token verification (optional)"
+    )
+    SUPABASE_READ_REPLICA_URL: str = Field(
+        default="", description="Supabase read replica API URL for feed reads (optional)"
+    )
 
     # AI Configuration
     GROQ_API_KEY: str = Field(..., description="Groq API key for AI features")
@@ -53,6 +61,22 @@ class Settings(BaseSettings):
     # Database Configuration (optional direct connection)
     DATABASE_URL: str = Field(default="", description="Direct PostgreSQL connection URL (optional)")
 
+    # Cache Configuration (optional - caching is disabled when unset)
+    REDIS_URL: str = Field(default="", description="Redis connection URL (optional)")
+
+    # Rate Limiting (per client IP, per minute)
+    AUTH_RATE_LIMIT: int = Field(
+        default=30, description="Max requests per minute to login/register/verify-email"
+    )
+    AUTH_FAILURE_LIMIT: int = Field(
+        default=20, description="Max failed token authentications per minute"
+    )
+    TRUSTED_PROXIES: str = Field(
+        default="",
+        description="CIDR ranges of reverse proxies whose X-Forwarded-For is trusted "
+        "(comma-separated)",
+    )
+
     # External API Configuration
     HIPO_API_URL: str = Field(
         default="http://universities.hipolabs.com",
@@ -80,11 +104,20 @@ class Settings(BaseSettings):
     def is_test(self) -> bool:
         return self.ENVIRONMENT == "test"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse ALLOWED_ORIGINS into list[str]."""
+        """Parse ALLOWED_ORIGINS into list[str] (computed once)."""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()]
 
+    @cached_property
+    def trusted_proxy_networks(self) -> List[Union[IPv4Network, IPv6Network]]:
+        """Parse TRUSTED_PROXIES into networks (computed once)."""
+        return [
+            ip_network(cidr.strip(), strict=False)
+            for cidr in self.TRUSTED_PROXIES.split(",")
+            if cidr.strip()
+        ]
+
 
 # Global settings instance
 settings = Settings()
@@ -9,7 +9,9 @@ from backend.core.models.auth import (
     EmailVerificationRequest,
     PasswordChangeRequest,
     RegistrationConfirmationResponse,
+    RegistrationResponse,
     TokenResponse,
+    UserIdentity,
     UserLoginRequest,
     UserRegistrationRequest,
     UserResponse,
@@ -17,6 +19,7 @@ from backend.core.models.auth import (
 
 # Chat models
 from backend.core.models.chat import (
+    ChatBootstrapResponse,
     ChatSearchRequest,
     ConversationCreate,
     ConversationDetailResponse,
@@ -92,10 +95,12 @@ __all__ = [
     "UserRegistrationRequest",
     "UserLoginRequest",
     "UserResponse",
+    "UserIdentity",
     "TokenResponse",
     "PasswordChangeRequest",
     "EmailVerificationRequest",
     "RegistrationConfirmationResponse",
+    "RegistrationResponse",
     # University models
     "UniversityBase",
     "UniversityResponse",
@@ -125,6 +130,7 @@ __all__ = [
     "ConversationListResponse",
     "MessageListResponse",
     "MarkReadRequest",
+    "ChatBootstrapResponse",
     "ChatSearchRequest",
     "EncryptionKey",
     "MessageUpdateResponse",
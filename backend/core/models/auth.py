@@ -6,7 +6,7 @@ Pydantic models for user registration, login, and authentication responses.
 
 import re
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Literal, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
@@ -136,6 +136,18 @@ class UserResponse(BaseModel):
         }
 
 
+class UserIdentity(BaseModel):
+    """
+    Minimal authenticated user model.
+
+    Used by endpoints that only need to know who the caller is, so the
+    auth lookup can skip the full profile.
+    """
+
+    id: UUID = Field(..., description="User unique identifier")
+    is_verified: bool = Field(default=False, description="Email verification status")
+
+
 class TokenResponse(BaseModel):
     """
     Authentication token response model.
@@ -143,6 +155,7 @@ class TokenResponse(BaseModel):
     Returned after successful login or registration.
     """
 
+    type: Literal["token"] = Field(default="token", description="Response discriminator")
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(default="bearer", description="Token type")
     user: UserResponse = Field(..., description="User information")
@@ -152,6 +165,7 @@ class TokenResponse(BaseModel):
 
         json_schema_extra = {
             "example": {
+                "type": "token",
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "token_type": "bearer",
                 "user": {
@@ -204,6 +218,13 @@ class EmailVerificationRequest(BaseModel):
 
 
 class RegistrationConfirmationResponse(BaseModel):
+    type: Literal["confirmation"] = "confirmation"
     message: str
     user: UserResponse
     email_confirmation_required: bool = True
+
+
+# Registration returns tokens, or a confirmation when email verification is pending
+RegistrationResponse = Annotated[
+    Union[TokenResponse, RegistrationConfirmationResponse], Field(discriminator="type")
+]
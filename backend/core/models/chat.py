@@ -150,6 +150,10 @@ class ConversationListResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of conversations")
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, description="Number of conversations per page")
+    has_more: bool = Field(default=False, description="Whether more conversations are available")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (pass as `cursor`)"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -168,6 +172,8 @@ class ConversationListResponse(BaseModel):
                 "total": 15,
                 "page": 1,
                 "page_size": 20,
+                "has_more": False,
+                "next_cursor": None,
             }
         }
 
@@ -180,10 +186,15 @@ class MessageListResponse(BaseModel):
     """
 
     messages: List[MessageResponse] = Field(..., description="List of messages")
-    total: int = Field(..., ge=0, description="Total number of messages")
+    total: Optional[int] = Field(
+        None, ge=0, description="Total number of messages (null on cursor pages)"
+    )
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, description="Number of messages per page")
     has_more: bool = Field(..., description="Whether more messages are available")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (pass as `cursor`)"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -204,6 +215,36 @@ class MessageListResponse(BaseModel):
                 "page": 1,
                 "page_size": 20,
                 "has_more": True,
+                "next_cursor": "eyJ0cyI6IjIwMjQtMDEtMDFUMTI6MDA6MDArMDA6MDAiLCJpZCI6IjEyMyJ9",
+            }
+        }
+
+
+class ChatBootstrapResponse(BaseModel):
+    """
+    Combined payload for opening the chat UI.
+
+    Bundles the first page of conversations and the unread badge count so the
+    client needs a single request.
+    """
+
+    conversations: ConversationListResponse = Field(..., description="First conversation page")
+    unread_count: int = Field(..., ge=0, description="Total unread messages for current user")
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "conversations": {
+                    "conversations": [],
+                    "total": 0,
+                    "page": 1,
+                    "page_size": 20,
+                    "has_more": False,
+                    "next_cursor": None,
+                },
+                "unread_count": 0,
             }
         }
 
@@ -155,10 +155,15 @@ class PostListResponse(BaseModel):
     """
 
     posts: List[PostResponse] = Field(..., description="List of posts")
-    total: int = Field(..., description="Total number of posts")
+    total: Optional[int] = Field(
+        None, description="Estimated total number of posts (only with include_total)"
+    )
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of posts per page")
     has_more: bool = Field(..., description="Whether more posts are available")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (pass as `cursor`)"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -189,6 +194,7 @@ class PostListResponse(BaseModel):
                 "page": 1,
                 "page_size": 20,
                 "has_more": True,
+                "next_cursor": "eyJ0cyI6IjIwMjQtMDEtMDFUMTI6MDA6MDArMDA6MDAiLCJpZCI6IjEyMyJ9",
             }
         }
 
@@ -8,9 +8,11 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+from fastapi.concurrency import run_in_threadpool
+
 from backend.core.models.auth import UserLoginRequest, UserRegistrationRequest, UserResponse
 from backend.core.services.universities import get_university_service
-from backend.db import supabase
+from backend.db import get_async_supabase_client, supabase
 
 
 class AuthenticationError(Exception):
@@ -34,6 +36,8 @@ class AuthService:
     Service for handling user authentication operations.
 
     Uses Supabase Auth for secure authentication and manages user profiles.
+    Calls on the synchronous Supabase client run in the worker thread pool so
+    they never block the event loop.
     """
 
     async def register_user(self, registration_data: UserRegistrationRequest) -> Dict[str, Any]:
@@ -87,11 +91,12 @@ class AuthService:
 
             # Step 2: Create user in Supabase Auth
             try:
-                auth_response = supabase.auth.sign_up(
+                auth_response = await run_in_threadpool(
+                    supabase.auth.sign_up,
                     {
                         "email": registration_data.university_email,
                         "password": registration_data.password,
-                    }
+                    },
                 )
 
                 print(f"✅ DEBUG: Auth response user: {auth_response.user}")
@@ -130,7 +135,9 @@ class AuthService:
                 print(f"✅ DEBUG: Profile data: {profile_data}")
 
                 # Create new profile
-                insert_response = supabase.table("profiles").insert(profile_data).execute()
+                insert_response = await run_in_threadpool(
+                    supabase.table("profiles").insert(profile_data).execute
+                )
 
                 print(f"✅ DEBUG: Insert response: {insert_response.data}")
 
@@ -145,11 +152,8 @@ class AuthService:
 
                 print(f"✅ DEBUG: Updating profile with: {profile_update}")
 
-                update_response = (
-                    supabase.table("profiles")
-                    .update(profile_update)
-                    .eq("id", str(user.id))
-                    .execute()
+                update_response = await run_in_threadpool(
+                    supabase.table("profiles").update(profile_update).eq("id", str(user.id)).execute
                 )
 
                 print(f"✅ DEBUG: Update response data: {update_response.data}")
@@ -167,7 +171,7 @@ class AuthService:
                 # Clean up the auth user if profile creation fails
                 try:
                     print(f"🧹 DEBUG: Attempting to clean up auth user {user.id}...")
-                    supabase.auth.admin.delete_user(str(user.id))
+                    await run_in_threadpool(supabase.auth.admin.delete_user, str(user.id))
                     print(f"✅ DEBUG: Cleaned up auth user {user.id}")
                 except Exception as cleanup_error:
                     print(f"❌ DEBUG: Cleanup failed: {cleanup_error}")
@@ -240,11 +244,12 @@ class AuthService:
         """
         try:
             # Sign in with Supabase
-            auth_response = supabase.auth.sign_in_with_password(
+            auth_response = await run_in_threadpool(
+                supabase.auth.sign_in_with_password,
                 {
                     "email": login_data.email,
                     "password": login_data.password,
-                }
+                },
             )
 
             if not auth_response.user:
@@ -253,14 +258,14 @@ class AuthService:
             user = auth_response.user
 
             # Get user profile
-            profile_response = (
+            profile_response = await run_in_threadpool(
                 supabase.table("profiles")
                 .select(
                     "id, email, full_name, university_id, university_email, "
                     "profile_picture_url, is_verified, created_at"
                 )
                 .eq("id", str(user.id))
-                .execute()
+                .execute
             )
 
             if not profile_response.data or len(profile_response.data) == 0:
@@ -313,9 +318,10 @@ class AuthService:
             >>> print(profile["university_name"])
         """
         try:
-            # Join profiles with universities to get complete data
-            response = (
-                supabase.table("profiles")
+            # Join profiles with universities in one non-blocking round-trip
+            response = await (
+                get_async_supabase_client()
+                .table("profiles")
                 .select("*, universities(name, domain, country, state)")
                 .eq("id", str(user_id))
                 .execute()
@@ -345,7 +351,7 @@ class AuthService:
             AuthenticationError: If logout fails
         """
         try:
-            supabase.auth.sign_out()
+            await run_in_threadpool(supabase.auth.sign_out)
             return True
 
         except Exception as e:
@@ -4,19 +4,34 @@ Chat service layer.
 Handles all conversation and messaging operations with end-to-end encryption.
 """
 
+import asyncio
+import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from backend.core.models.chat import (
-    ConversationListResponse,
-    ConversationResponse,
-    MessageCreate,
-    MessageListResponse,
-    MessageResponse,
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
+
+from backend.core.models.chat import MessageCreate
+from backend.core.utils import (
+    blind_index,
+    decode_cursor,
+    decrypt_messages,
+    encode_cursor,
+    encrypt_message,
+    keyset_filter,
 )
-from backend.core.utils import decrypt_message, encrypt_message
-from backend.db import supabase
+from backend.db import get_async_supabase_client, redis, supabase
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached unread count stays valid (writes also invalidate it)
+UNREAD_COUNT_TTL = 60
+
+# conversation_id -> (participant_1_id, participant_2_id). Participants never
+# change, so entries only go stale when a conversation is deleted.
+_participants_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
 
 
 class ConversationNotFoundError(Exception):
@@ -56,156 +71,178 @@ class ChatService:
             InvalidParticipantError: If trying to create conversation with self.
             Exception: For database errors.
         """
-        try:
-            # Cannot create conversation with self
-            if user_id == participant_id:
-                raise InvalidParticipantError("Cannot create conversation with yourself")
-
-            # Order participants by UUID to maintain database constraint
-            if user_id < participant_id:
-                p1_id, p2_id = user_id, participant_id
-            else:
-                p1_id, p2_id = participant_id, user_id
-
-            # Check if conversation exists
-            existing_response = (
-                supabase.table("conversations")
-                .select(
-                    "*, "
-                    "participant_1:profiles!conversations_participant_1_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    "),"
-                    "participant_2:profiles!conversations_participant_2_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .eq("participant_1_id", str(p1_id))
-                .eq("participant_2_id", str(p2_id))
-                .execute()
-            )
-
-            if existing_response.data:
-                conv = existing_response.data[0]
-                return self._format_conversation_response(conv, user_id)
+        # Cannot create conversation with self
+        if user_id == participant_id:
+            raise InvalidParticipantError("Cannot create conversation with yourself")
 
-            # Create new conversation
-            new_conv_data = {
-                "participant_1_id": str(p1_id),
-                "participant_2_id": str(p2_id),
-            }
-
-            # Create new conversation (INSERT first)
-            new_conv_response = supabase.table("conversations").insert(new_conv_data).execute()
+        # Order participants by UUID to maintain database constraint
+        if user_id < participant_id:
+            p1_id, p2_id = user_id, participant_id
+        else:
+            p1_id, p2_id = participant_id, user_id
+
+        # Check if conversation exists
+        existing_response = (
+            supabase.table("conversations")
+            .select(
+                "*, "
+                "participant_1:profiles!conversations_participant_1_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                "),"
+                "participant_2:profiles!conversations_participant_2_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                ")"
+            )
+            .eq("participant_1_id", str(p1_id))
+            .eq("participant_2_id", str(p2_id))
+            .execute()
+        )
 
-            if not new_conv_response.data:
-                raise Exception("Failed to create conversation")
+        if existing_response.data:
+            conv = existing_response.data[0]
+            return self._format_conversation_response(conv, user_id)
 
-            created_conv = new_conv_response.data[0]
+        # Create new conversation
+        new_conv_data = {
+            "participant_1_id": str(p1_id),
+            "participant_2_id": str(p2_id),
+        }
 
-            # Then SELECT with joins to get full participant info
-            full_conv_response = (
-                supabase.table("conversations")
-                .select(
-                    "*, "
-                    "participant_1:profiles!conversations_participant_1_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    "),"
-                    "participant_2:profiles!conversations_participant_2_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .eq("id", created_conv["id"])
-                .execute()
+        # Create new conversation (INSERT first)
+        new_conv_response = supabase.table("conversations").insert(new_conv_data).execute()
+
+        if not new_conv_response.data:
+            raise Exception("Failed to create conversation")
+
+        created_conv = new_conv_response.data[0]
+
+        # Then SELECT with joins to get full participant info
+        full_conv_response = (
+            supabase.table("conversations")
+            .select(
+                "*, "
+                "participant_1:profiles!conversations_participant_1_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                "),"
+                "participant_2:profiles!conversations_participant_2_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                ")"
             )
+            .eq("id", created_conv["id"])
+            .execute()
+        )
 
-            if not full_conv_response.data:
-                raise Exception("Failed to fetch created conversation")
-
-            return self._format_conversation_response(full_conv_response.data[0], user_id)
+        if not full_conv_response.data:
+            raise Exception("Failed to fetch created conversation")
 
-        except InvalidParticipantError:
-            raise
-        except Exception as e:
-            raise Exception(f"Error getting or creating conversation: {e}")
+        return self._format_conversation_response(full_conv_response.data[0], user_id)
 
     async def get_user_conversations(
-        self, user_id: UUID, page: int = 1, page_size: int = 20
+        self,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get all conversations for a user.
 
+        Pages are selected with a keyset cursor on (last_message_at, id) when
+        `cursor` is given; `page` is the legacy offset-based fallback.
+
         Args:
             user_id: The user's ID.
-            page: Page number (1-indexed).
+            page: Page number (1-indexed), used when no cursor is given.
             page_size: Number of conversations per page.
+            cursor: Opaque cursor from a previous page's `next_cursor`.
 
         Returns:
             A dictionary containing paginated conversations with metadata.
 
         Raises:
+            InvalidCursorError: If the cursor is malformed.
             Exception: For database errors.
         """
-        try:
-            # Get conversations where user is either participant
-            # Using OR logic with two separate queries then combining
-            query1 = (
-                supabase.table("conversations")
-                .select(
-                    "*, "
-                    "participant_1:profiles!conversations_participant_1_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    "),"
-                    "participant_2:profiles!conversations_participant_2_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .eq("participant_1_id", str(user_id))
-                .order("last_message_at", desc=True)
+        after = decode_cursor(cursor) if cursor else None
+
+        # Get conversations where user is either participant
+        # Using OR logic with two separate queries then combining
+        query1 = (
+            supabase.table("conversations")
+            .select(
+                "*, "
+                "participant_1:profiles!conversations_participant_1_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                "),"
+                "participant_2:profiles!conversations_participant_2_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                ")"
             )
+            .eq("participant_1_id", str(user_id))
+            .order("last_message_at", desc=True)
+            .order("id", desc=True)
+        )
 
-            query2 = (
-                supabase.table("conversations")
-                .select(
-                    "*, "
-                    "participant_1:profiles!conversations_participant_1_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    "),"
-                    "participant_2:profiles!conversations_participant_2_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .eq("participant_2_id", str(user_id))
-                .order("last_message_at", desc=True)
+        query2 = (
+            supabase.table("conversations")
+            .select(
+                "*, "
+                "participant_1:profiles!conversations_participant_1_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                "),"
+                "participant_2:profiles!conversations_participant_2_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                ")"
             )
+            .eq("participant_2_id", str(user_id))
+            .order("last_message_at", desc=True)
+            .order("id", desc=True)
+        )
 
-            result1 = query1.execute()
-            result2 = query2.execute()
+        if after:
+            # Keyset page: each side only needs page_size + 1 rows after the cursor
+            query1 = query1.or_(keyset_filter("last_message_at", *after)).limit(page_size + 1)
+            query2 = query2.or_(keyset_filter("last_message_at", *after)).limit(page_size + 1)
 
-            # Combine and sort by last_message_at
-            all_conversations = (result1.data or []) + (result2.data or [])
-            all_conversations.sort(key=lambda x: x.get("last_message_at", ""), reverse=True)
+        result1 = query1.execute()
+        result2 = query2.execute()
 
-            total_count = len(all_conversations)
+        # Combine and sort by (last_message_at, id)
+        all_conversations = (result1.data or []) + (result2.data or [])
+        all_conversations.sort(
+            key=lambda x: (datetime.fromisoformat(x["last_message_at"]), x["id"]),
+            reverse=True,
+        )
 
-            # Apply pagination
+        if after:
+            total_count = self._count_user_conversations(user_id)
+            has_more = len(all_conversations) > page_size
+            paginated_conversations = all_conversations[:page_size]
+        else:
+            total_count = len(all_conversations)
             offset = (page - 1) * page_size
+            has_more = offset + page_size < total_count
             paginated_conversations = all_conversations[offset : offset + page_size]
 
-            # Format conversations
-            formatted_conversations = []
-            for conv in paginated_conversations:
-                formatted_conv = await self._format_conversation_with_last_message(conv, user_id)
-                formatted_conversations.append(formatted_conv)
+        next_cursor = None
+        if has_more and paginated_conversations:
+            last = paginated_conversations[-1]
+            next_cursor = encode_cursor(last["last_message_at"], last["id"])
 
-            return ConversationListResponse(
-                conversations=[ConversationResponse(**conv) for conv in formatted_conversations],
-                total=total_count,
-                page=page,
-                page_size=page_size,
-            ).model_dump()
+        # Format conversations (previews and unread counts in two batched queries)
+        formatted_conversations = await self._format_conversations_with_last_message(
+            paginated_conversations, user_id
+        )
 
-        except Exception as e:
-            raise Exception(f"Error fetching user conversations: {e}")
+        # Plain dict: the route validates the rows once on the way out
+        return {
+            "conversations": formatted_conversations,
+            "total": total_count,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
 
     async def get_conversation_by_id(self, conversation_id: UUID, user_id: UUID) -> Dict[str, Any]:
         """
@@ -223,39 +260,30 @@ class ChatService:
             UnauthorizedError: If user is not a participant.
             Exception: For other database errors.
         """
-        try:
-            response = (
-                supabase.table("conversations")
-                .select(
-                    "*, "
-                    "participant_1:profiles!conversations_participant_1_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    "),"
-                    "participant_2:profiles!conversations_participant_2_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .eq("id", str(conversation_id))
-                .execute()
+        response = (
+            supabase.table("conversations")
+            .select(
+                "*, "
+                "participant_1:profiles!conversations_participant_1_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                "),"
+                "participant_2:profiles!conversations_participant_2_id_fkey("
+                "id, full_name, profile_picture_url, universities(name)"
+                ")"
             )
+            .eq("id", str(conversation_id))
+            .execute()
+        )
 
-            if not response.data:
-                raise ConversationNotFoundError(f"Conversation {conversation_id} not found")
-
-            conv = response.data[0]
+        if not response.data:
+            raise ConversationNotFoundError(f"Conversation {conversation_id} not found")
 
-            # Verify user is a participant
-            if conv["participant_1_id"] != str(user_id) and conv["participant_2_id"] != str(
-                user_id
-            ):
-                raise UnauthorizedError("You are not a participant in this conversation")
+        conv = response.data[0]
 
-            return self._format_conversation_response(conv, user_id)
+        # Verify user is a participant
+        self._assert_participant(conv, user_id)
 
-        except (ConversationNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise Exception(f"Error fetching conversation {conversation_id}: {e}")
+        return self._format_conversation_response(conv, user_id)
 
     async def send_message(
         self, conversation_id: UUID, sender_id: UUID, message_data: MessageCreate
@@ -276,100 +304,89 @@ class ChatService:
             UnauthorizedError: If sender is not a participant.
             Exception: For other errors.
         """
-        try:
-            # Verify sender is participant in conversation
-            conv_response = (
-                supabase.table("conversations")
-                .select("participant_1_id, participant_2_id")
-                .eq("id", str(conversation_id))
-                .execute()
-            )
-
-            if not conv_response.data:
-                raise ConversationNotFoundError(f"Conversation {conversation_id} not found")
-
-            conv = conv_response.data[0]
-            if conv["participant_1_id"] != str(sender_id) and conv["participant_2_id"] != str(
-                sender_id
-            ):
-                raise UnauthorizedError("You are not a participant in this conversation")
-
-            # Encrypt message content
-            encrypted_content = encrypt_message(message_data.content)
-
-            # Insert message
-            message_insert = {
-                "conversation_id": str(conversation_id),
-                "sender_id": str(sender_id),
-                "content_encrypted": encrypted_content,
-            }
+        # Verify sender is participant in conversation
+        conv = await self._get_participants(conversation_id, sender_id)
+
+        # Encrypt message content
+        encrypted_content = encrypt_message(message_data.content)
+
+        # Insert message
+        message_insert = {
+            "conversation_id": str(conversation_id),
+            "sender_id": str(sender_id),
+            "content_encrypted": encrypted_content,
+            "content_tokens": blind_index(message_data.content),
+        }
 
-            message_response = supabase.table("messages").insert(message_insert).execute()
+        message_response = supabase.table("messages").insert(message_insert).execute()
 
-            if not message_response.data:
-                raise Exception("Failed to send message")
+        if not message_response.data:
+            raise Exception("Failed to send message")
 
-            created_message = message_response.data[0]
+        recipient_id = (
+            conv["participant_2_id"]
+            if conv["participant_1_id"] == str(sender_id)
+            else conv["participant_1_id"]
+        )
+        await self._invalidate_unread_counts(recipient_id)
 
-            # Get sender info
-            sender_info = await self._get_user_profile_for_message(sender_id)
+        created_message = message_response.data[0]
 
-            # Return message with decrypted content
-            return {
-                "id": UUID(created_message["id"]),
-                "conversation_id": UUID(created_message["conversation_id"]),
-                "sender_id": UUID(created_message["sender_id"]),
-                "content_encrypted": created_message["content_encrypted"],
-                "content": message_data.content,  # Original content (not decrypted from DB)
-                "is_read": created_message["is_read"],
-                "created_at": datetime.fromisoformat(created_message["created_at"]),
-                "sender": sender_info,
-            }
+        # Get sender info
+        sender_info = await self._get_user_profile_for_message(sender_id)
 
-        except (ConversationNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise Exception(f"Error sending message: {e}")
+        # Return message with decrypted content
+        return {
+            "id": created_message["id"],
+            "conversation_id": created_message["conversation_id"],
+            "sender_id": created_message["sender_id"],
+            "content_encrypted": created_message["content_encrypted"],
+            "content": message_data.content,  # Original content (not decrypted from DB)
+            "is_read": created_message["is_read"],
+            "created_at": datetime.fromisoformat(created_message["created_at"]),
+            "sender": sender_info,
+        }
 
     async def get_conversation_messages(
-        self, conversation_id: UUID, user_id: UUID, page: int = 1, page_size: int = 50
+        self,
+        conversation_id: UUID,
+        user_id: UUID,
+        page: int = 1,
+        page_size: int = 50,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get messages for a conversation.
 
+        Pages are selected with a keyset cursor on (created_at, id) when
+        `cursor` is given; `page` is the legacy offset-based fallback. Cursor
+        pages skip the total count (`total` is None) so they stay
+        O(page_size).
+
         Args:
             conversation_id: The conversation's ID.
             user_id: The requesting user's ID.
-            page: Page number (1-indexed).
+            page: Page number (1-indexed), used when no cursor is given.
             page_size: Number of messages per page.
+            cursor: Opaque cursor from a previous page's `next_cursor`.
 
         Returns:
             A dictionary containing paginated messages.
 
         Raises:
+            InvalidCursorError: If the cursor is malformed.
             ConversationNotFoundError: If conversation not found.
             UnauthorizedError: If user is not a participant.
             Exception: For other errors.
         """
-        try:
-            # Verify user is participant
-            conv_response = (
-                supabase.table("conversations")
-                .select("participant_1_id, participant_2_id")
-                .eq("id", str(conversation_id))
-                .execute()
-            )
-
-            if not conv_response.data:
-                raise ConversationNotFoundError(f"Conversation {conversation_id} not found")
+        after = decode_cursor(cursor) if cursor else None
 
-            conv = conv_response.data[0]
-            if conv["participant_1_id"] != str(user_id) and conv["participant_2_id"] != str(
-                user_id
-            ):
-                raise UnauthorizedError("You are not a participant in this conversation")
+        # Verify user is participant
+        await self._get_participants(conversation_id, user_id)
 
-            # Get total count
+        # Get total count; cursor pages detect has_more from an extra row instead
+        total_count = None
+        if not after:
             count_response = (
                 supabase.table("messages")
                 .select("id", count="exact")
@@ -379,68 +396,94 @@ class ChatService:
 
             total_count = count_response.count if count_response.count else 0
 
-            # Get messages (newest first for infinite scroll)
+        # Get messages (newest first for infinite scroll)
+        messages_query = (
+            supabase.table("messages")
+            .select("*, profiles!messages_sender_id_fkey(id, full_name, profile_picture_url)")
+            .eq("conversation_id", str(conversation_id))
+            .order("created_at", desc=True)
+            .order("id", desc=True)
+        )
+
+        if after:
+            # Fetch one extra row to detect whether another page exists
+            messages_query = messages_query.or_(keyset_filter("created_at", *after))
+            messages_query = messages_query.limit(page_size + 1)
+        else:
             offset = (page - 1) * page_size
-            messages_response = (
-                supabase.table("messages")
-                .select("*, profiles!messages_sender_id_fkey(id, full_name, profile_picture_url)")
-                .eq("conversation_id", str(conversation_id))
-                .order("created_at", desc=True)
-                .range(offset, offset + page_size - 1)
-                .execute()
-            )
+            messages_query = messages_query.range(offset, offset + page_size - 1)
 
-            if not messages_response.data:
-                return MessageListResponse(
-                    messages=[], total=0, page=page, page_size=page_size, has_more=False
-                ).model_dump()
-
-            # Decrypt and format messages
-            formatted_messages = []
-            for msg in messages_response.data:
-                try:
-                    # Decrypt message content
-                    decrypted_content = decrypt_message(msg["content_encrypted"])
-
-                    # Format sender info
-                    sender_profile = msg.pop("profiles")
-                    sender_info = {
-                        "id": UUID(sender_profile["id"]),
-                        "full_name": sender_profile["full_name"],
-                        "profile_picture_url": sender_profile.get("profile_picture_url"),
-                    }
+        messages_response = messages_query.execute()
 
-                    formatted_messages.append(
-                        {
-                            "id": UUID(msg["id"]),
-                            "conversation_id": UUID(msg["conversation_id"]),
-                            "sender_id": UUID(msg["sender_id"]),
-                            "content_encrypted": msg["content_encrypted"],
-                            "content": decrypted_content,
-                            "is_read": msg["is_read"],
-                            "created_at": datetime.fromisoformat(msg["created_at"]),
-                            "sender": sender_info,
-                        }
-                    )
-                except Exception as e:
-                    # If decryption fails, skip this message
-                    print(f"Failed to decrypt message {msg['id']}: {e}")
-                    continue
+        if not messages_response.data:
+            return {
+                "messages": [],
+                "total": total_count,
+                "page": page,
+                "page_size": page_size,
+                "has_more": False,
+                "next_cursor": None,
+            }
 
+        if after:
+            has_more = len(messages_response.data) > page_size
+        else:
             has_more = (page * page_size) < total_count
 
-            return MessageListResponse(
-                messages=[MessageResponse(**msg) for msg in formatted_messages],
-                total=total_count,
-                page=page,
-                page_size=page_size,
-                has_more=has_more,
-            ).model_dump()
+        page_rows = messages_response.data[:page_size]
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(page_rows[-1]["created_at"], page_rows[-1]["id"])
 
-        except (ConversationNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise Exception(f"Error fetching messages: {e}")
+        # Decrypt the whole page in a worker thread so the CPU-bound
+        # crypto never blocks the event loop
+        decrypted_contents = await run_in_threadpool(
+            decrypt_messages, [msg["content_encrypted"] for msg in page_rows]
+        )
+
+        # Format messages. IDs stay as the canonical strings PostgREST
+        # returns; response models parse them only when needed.
+        formatted_messages = []
+        for msg, decrypted_content in zip(page_rows, decrypted_contents):
+            if decrypted_content is None:
+                # If decryption fails, skip this message
+                logger.warning("Failed to decrypt message %s", msg["id"])
+                continue
+
+            try:
+                # Format sender info
+                sender_profile = msg.pop("profiles")
+                sender_info = {
+                    "id": sender_profile["id"],
+                    "full_name": sender_profile["full_name"],
+                    "profile_picture_url": sender_profile.get("profile_picture_url"),
+                }
+
+                formatted_messages.append(
+                    {
+                        "id": msg["id"],
+                        "conversation_id": msg["conversation_id"],
+                        "sender_id": msg["sender_id"],
+                        "content_encrypted": msg["content_encrypted"],
+                        "content": decrypted_content,
+                        "is_read": msg["is_read"],
+                        "created_at": datetime.fromisoformat(msg["created_at"]),
+                        "sender": sender_info,
+                    }
+                )
+            except Exception as e:
+                logger.warning("Failed to format message %s: %s", msg["id"], e)
+                continue
+
+        # Plain dict: the route validates the rows once on the way out
+        return {
+            "messages": formatted_messages,
+            "total": total_count,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
 
     async def mark_messages_as_read(self, user_id: UUID, message_ids: List[UUID]) -> int:
         """
@@ -458,44 +501,25 @@ class ChatService:
         Raises:
             Exception: For database errors.
         """
-        try:
-            if not message_ids:
-                return 0
-
-            # Get message IDs where user is recipient (not sender)
-            # This requires joining with conversations to determine recipient
-            updated_count = 0
-
-            for message_id in message_ids:
-                # Get message and conversation info
-                msg_response = (
-                    supabase.table("messages")
-                    .select("sender_id, conversation_id")
-                    .eq("id", str(message_id))
-                    .execute()
-                )
-
-                if not msg_response.data:
-                    continue
-
-                msg = msg_response.data[0]
+        if not message_ids:
+            return 0
 
-                # Only update if user is not the sender
-                if msg["sender_id"] != str(user_id):
-                    update_response = (
-                        supabase.table("messages")
-                        .update({"is_read": True})
-                        .eq("id", str(message_id))
-                        .execute()
-                    )
-
-                    if update_response.data:
-                        updated_count += 1
+        # Single UPDATE ... WHERE id IN (...): only unread messages the user
+        # received (did not send) are marked. Only the row count comes back.
+        update_response = (
+            supabase.table("messages")
+            .update({"is_read": True}, count="exact", returning="minimal")
+            .in_("id", [str(message_id) for message_id in message_ids])
+            .neq("sender_id", str(user_id))
+            .eq("is_read", False)
+            .execute()
+        )
 
-            return updated_count
+        updated_count = update_response.count or 0
+        if updated_count:
+            await self._invalidate_unread_counts(user_id)
 
-        except Exception as e:
-            raise Exception(f"Error marking messages as read: {e}")
+        return updated_count
 
     async def mark_conversation_as_read(self, conversation_id: UUID, user_id: UUID) -> int:
         """
@@ -515,45 +539,33 @@ class ChatService:
             UnauthorizedError: If user is not a participant.
             Exception: For other errors.
         """
-        try:
-            # Verify user is participant
-            conv_response = (
-                supabase.table("conversations")
-                .select("participant_1_id, participant_2_id")
-                .eq("id", str(conversation_id))
-                .execute()
-            )
-
-            if not conv_response.data:
-                raise ConversationNotFoundError(f"Conversation {conversation_id} not found")
+        # Verify user is participant
+        await self._get_participants(conversation_id, user_id)
 
-            conv = conv_response.data[0]
-            if conv["participant_1_id"] != str(user_id) and conv["participant_2_id"] != str(
-                user_id
-            ):
-                raise UnauthorizedError("You are not a participant in this conversation")
-
-            # Mark all unread messages where user is recipient (not sender)
-            update_response = (
-                supabase.table("messages")
-                .update({"is_read": True})
-                .eq("conversation_id", str(conversation_id))
-                .eq("is_read", False)
-                .neq("sender_id", str(user_id))
-                .execute()
-            )
+        # Mark all unread messages where user is recipient (not sender)
+        update_response = (
+            supabase.table("messages")
+            .update({"is_read": True})
+            .eq("conversation_id", str(conversation_id))
+            .eq("is_read", False)
+            .neq("sender_id", str(user_id))
+            .execute()
+        )
 
-            return len(update_response.data) if update_response.data else 0
+        updated_count = len(update_response.data) if update_response.data else 0
+        if updated_count:
+            await self._invalidate_unread_counts(user_id)
 
-        except (ConversationNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise Exception(f"Error marking conversation as read: {e}")
+        return updated_count
 
     async def get_unread_count(self, user_id: UUID) -> int:
         """
         Get total unread message count across all conversations.
 
+        The count is cached in Redis (when configured) for UNREAD_COUNT_TTL
+        seconds and invalidated by sends, mark-read and deletes. On a miss every
+        conversation is counted by one RPC call rather than a query each.
+
         Args:
             user_id: The user's ID.
 
@@ -563,46 +575,41 @@ class ChatService:
         Raises:
             Exception: For database errors.
         """
-        try:
-            # Get all conversations where user is participant
-            conv1 = (
-                supabase.table("conversations")
-                .select("id")
-                .eq("participant_1_id", str(user_id))
-                .execute()
-            )
-            conv2 = (
-                supabase.table("conversations")
-                .select("id")
-                .eq("participant_2_id", str(user_id))
-                .execute()
-            )
+        cached_count = await self._get_cached_unread_count(user_id)
+        if cached_count is not None:
+            return cached_count
+
+        # Get all conversations where user is participant
+        client = get_async_supabase_client()
+        conv1, conv2 = await asyncio.gather(
+            client.table("conversations")
+            .select("id")
+            .eq("participant_1_id", str(user_id))
+            .execute(),
+            client.table("conversations")
+            .select("id")
+            .eq("participant_2_id", str(user_id))
+            .execute(),
+        )
 
-            conversation_ids = [c["id"] for c in (conv1.data or [])] + [
-                c["id"] for c in (conv2.data or [])
-            ]
+        conversation_ids = [c["id"] for c in (conv1.data or [])] + [
+            c["id"] for c in (conv2.data or [])
+        ]
 
-            if not conversation_ids:
-                return 0
-
-            # Count unread messages in these conversations where user is recipient
-            total_unread = 0
-            for conv_id in conversation_ids:
-                unread_response = (
-                    supabase.table("messages")
-                    .select("id", count="exact")
-                    .eq("conversation_id", conv_id)
-                    .eq("is_read", False)
-                    .neq("sender_id", str(user_id))
-                    .execute()
-                )
+        if not conversation_ids:
+            await self._cache_unread_count(user_id, 0)
+            return 0
 
-                total_unread += unread_response.count if unread_response.count else 0
+        # Count unread messages in all of them in one call (see migration 006)
+        unread_response = await client.rpc(
+            "conversation_unread_counts",
+            {"conversation_ids": conversation_ids, "reader_id": str(user_id)},
+        ).execute()
 
-            return total_unread
+        total_unread = sum(row["unread_count"] for row in unread_response.data or [])
 
-        except Exception as e:
-            raise Exception(f"Error getting unread count: {e}")
+        await self._cache_unread_count(user_id, total_unread)
+        return total_unread
 
     async def search_messages(
         self, user_id: UUID, query: str, conversation_id: Optional[UUID] = None
@@ -610,6 +617,12 @@ class ChatService:
         """
         Search messages in user's conversations.
 
+        Matches whole words through the messages' blind index (see
+        `backend.core.utils.blind_index`); every word of the query must appear.
+        Matching is whole-word only. Messages with NULL content_tokens (stored
+        before migration 005) cannot be found until
+        `python -m backend.db.backfill_blind_index` has run.
+
         Args:
             user_id: The user's ID.
             query: Search query string.
@@ -621,103 +634,85 @@ class ChatService:
         Raises:
             Exception: For database errors.
         """
-        try:
-            # Get conversations to search
-            if conversation_id:
-                # Verify user is participant
-                conv_response = (
-                    supabase.table("conversations")
-                    .select("id, participant_1_id, participant_2_id")
-                    .eq("id", str(conversation_id))
-                    .execute()
-                )
+        # Get conversations to search
+        if conversation_id:
+            # Verify user is participant
+            try:
+                await self._get_participants(conversation_id, user_id)
+            except (ConversationNotFoundError, UnauthorizedError):
+                return []
 
-                if not conv_response.data:
-                    return []
-
-                conv = conv_response.data[0]
-                if conv["participant_1_id"] != str(user_id) and conv["participant_2_id"] != str(
-                    user_id
-                ):
-                    return []
-
-                conversation_ids = [str(conversation_id)]
-            else:
-                # Get all user's conversations
-                conv1 = (
-                    supabase.table("conversations")
-                    .select("id")
-                    .eq("participant_1_id", str(user_id))
-                    .execute()
-                )
-                conv2 = (
-                    supabase.table("conversations")
-                    .select("id")
-                    .eq("participant_2_id", str(user_id))
-                    .execute()
-                )
+            conversation_ids = [str(conversation_id)]
+        else:
+            # Get all user's conversations
+            conv1 = (
+                supabase.table("conversations")
+                .select("id")
+                .eq("participant_1_id", str(user_id))
+                .execute()
+            )
+            conv2 = (
+                supabase.table("conversations")
+                .select("id")
+                .eq("participant_2_id", str(user_id))
+                .execute()
+            )
 
-                conversation_ids = [c["id"] for c in (conv1.data or [])] + [
-                    c["id"] for c in (conv2.data or [])
-                ]
+            conversation_ids = [c["id"] for c in (conv1.data or [])] + [
+                c["id"] for c in (conv2.data or [])
+            ]
 
-            if not conversation_ids:
-                return []
+        if not conversation_ids:
+            return []
 
-            # Get all messages from these conversations
-            matching_messages = []
-            query_lower = query.lower()
-
-            for conv_id in conversation_ids:
-                messages_response = (
-                    supabase.table("messages")
-                    .select(
-                        "*, profiles!messages_sender_id_fkey(id, full_name, profile_picture_url)"
-                    )
-                    .eq("conversation_id", conv_id)
-                    .execute()
-                )
+        query_tokens = blind_index(query)
+        if not query_tokens:
+            return []
 
-                if not messages_response.data:
-                    continue
-
-                # Decrypt and search
-                for msg in messages_response.data:
-                    try:
-                        decrypted_content = decrypt_message(msg["content_encrypted"])
-
-                        # Check if query matches (case-insensitive)
-                        if query_lower in decrypted_content.lower():
-                            sender_profile = msg.pop("profiles")
-                            sender_info = {
-                                "id": UUID(sender_profile["id"]),
-                                "full_name": sender_profile["full_name"],
-                                "profile_picture_url": sender_profile.get("profile_picture_url"),
-                            }
-
-                            matching_messages.append(
-                                {
-                                    "id": UUID(msg["id"]),
-                                    "conversation_id": UUID(msg["conversation_id"]),
-                                    "sender_id": UUID(msg["sender_id"]),
-                                    "content_encrypted": msg["content_encrypted"],
-                                    "content": decrypted_content,
-                                    "is_read": msg["is_read"],
-                                    "created_at": datetime.fromisoformat(msg["created_at"]),
-                                    "sender": sender_info,
-                                }
-                            )
-                    except Exception:
-                        # Skip messages that fail to decrypt
-                        continue
-
-            # Sort by most recent first
-            matching_messages.sort(key=lambda x: x["created_at"], reverse=True)
-
-            return matching_messages
+        # Indexed lookup: messages whose blind index contains every query word
+        response = (
+            supabase.table("messages")
+            .select("*, profiles!messages_sender_id_fkey(id, full_name, profile_picture_url)")
+            .in_("conversation_id", conversation_ids)
+            .cs("content_tokens", query_tokens)
+            .order("created_at", desc=True)
+            .execute()
+        )
 
-        except Exception as e:
-            raise Exception(f"Error searching messages: {e}")
+        candidates = response.data or []
+        decrypted_contents = await run_in_threadpool(
+            decrypt_messages, [msg["content_encrypted"] for msg in candidates]
+        )
+
+        # Most recent first (ordered by the query)
+        matching_messages = []
+        for msg, decrypted_content in zip(candidates, decrypted_contents):
+            # Skip messages that fail to decrypt
+            if decrypted_content is None:
+                continue
+
+            try:
+                sender_profile = msg.pop("profiles")
+                matching_messages.append(
+                    {
+                        "id": msg["id"],
+                        "conversation_id": msg["conversation_id"],
+                        "sender_id": msg["sender_id"],
+                        "content_encrypted": msg["content_encrypted"],
+                        "content": decrypted_content,
+                        "is_read": msg["is_read"],
+                        "created_at": datetime.fromisoformat(msg["created_at"]),
+                        "sender": {
+                            "id": sender_profile["id"],
+                            "full_name": sender_profile["full_name"],
+                            "profile_picture_url": sender_profile.get("profile_picture_url"),
+                        },
+                    }
+                )
+            except Exception:
+                continue
+
+        return matching_messages
 
     async def delete_conversation(self, conversation_id: UUID, user_id: UUID) -> bool:
         """
@@ -735,12 +730,77 @@ class ChatService:
             UnauthorizedError: If user is not a participant.
             Exception: For other errors.
         """
+        # Verify user is participant
+        conv = await self._get_participants(conversation_id, user_id)
+
+        # Delete conversation (CASCADE will delete messages)
+        delete_response = (
+            supabase.table("conversations").delete().eq("id", str(conversation_id)).execute()
+        )
+        _participants_cache.pop(str(conversation_id), None)
+
+        await self._invalidate_unread_counts(conv["participant_1_id"], conv["participant_2_id"])
+
+        return bool(delete_response.data)
+
+    # Helper methods
+
+    @staticmethod
+    def _unread_count_key(user_id: Union[UUID, str]) -> str:
+        """Redis key holding a user's cached unread count."""
+        return f"chat:unread:{user_id}"
+
+    async def _get_cached_unread_count(self, user_id: UUID) -> Optional[int]:
+        """Return the cached unread count, or None on a miss or without Redis."""
+        if redis is None:
+            return None
+
         try:
-            # Verify user is participant
+            value = await redis.get(self._unread_count_key(user_id))
+            return int(value) if value is not None else None
+        except Exception as e:
+            logger.warning("Unread count cache read error: %s", e)
+            return None
+
+    async def _cache_unread_count(self, user_id: UUID, count: int) -> None:
+        """Store a user's unread count for UNREAD_COUNT_TTL seconds."""
+        if redis is None:
+            return
+
+        try:
+            await redis.setex(self._unread_count_key(user_id), UNREAD_COUNT_TTL, count)
+        except Exception as e:
+            logger.warning("Unread count cache write error: %s", e)
+
+    async def _invalidate_unread_counts(self, *user_ids: Union[UUID, str]) -> None:
+        """Drop cached unread counts after messages are sent, read or deleted."""
+        if redis is None:
+            return
+
+        try:
+            await redis.delete(*(self._unread_count_key(user_id) for user_id in user_ids))
+        except Exception as e:
+            logger.warning("Unread count cache delete error: %s", e)
+
+    async def _get_participants(self, conversation_id: UUID, user_id: UUID) -> Dict[str, str]:
+        """
+        Return a conversation's participant IDs after checking `user_id` is one.
+
+        Participant pairs are cached in-process for a few minutes, so hot chat
+        endpoints skip the conversations lookup on repeat calls.
+
+        Raises:
+            ConversationNotFoundError: If conversation not found.
+            UnauthorizedError: If user is not a participant.
+        """
+        key = str(conversation_id)
+        participants = _participants_cache.get(key)
+
+        if participants is None:
             conv_response = (
                 supabase.table("conversations")
                 .select("participant_1_id, participant_2_id")
-                .eq("id", str(conversation_id))
+                .eq("id", key)
                 .execute()
             )
 
@@ -748,24 +808,18 @@ class ChatService:
                 raise ConversationNotFoundError(f"Conversation {conversation_id} not found")
 
             conv = conv_response.data[0]
-            if conv["participant_1_id"] != str(user_id) and conv["participant_2_id"] != str(
-                user_id
-            ):
-                raise UnauthorizedError("You are not a participant in this conversation")
-
-            # Delete conversation (CASCADE will delete messages)
-            delete_response = (
-                supabase.table("conversations").delete().eq("id", str(conversation_id)).execute()
-            )
+            participants = (conv["participant_1_id"], conv["participant_2_id"])
+            _participants_cache[key] = participants
 
-            return bool(delete_response.data)
+        conv = {"participant_1_id": participants[0], "participant_2_id": participants[1]}
+        self._assert_participant(conv, user_id)
+        return conv
 
-        except (ConversationNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise Exception(f"Error deleting conversation: {e}")
-
-    # Helper methods
+    @staticmethod
+    def _assert_participant(conv: Dict[str, Any], user_id: UUID) -> None:
+        """Raise UnauthorizedError unless `user_id` is one of the conversation's participants."""
+        if str(user_id) not in (conv["participant_1_id"], conv["participant_2_id"]):
+            raise UnauthorizedError("You are not a participant in this conversation")
 
     def _format_conversation_response(self, conv: Dict[str, Any], user_id: UUID) -> Dict[str, Any]:
         """Format conversation for API response."""
@@ -783,7 +837,7 @@ class ChatService:
             other_id = conv["participant_1_id"]
 
         other_participant = {
-            "id": UUID(other_id),
+            "id": other_id,
             "full_name": other_profile.get("full_name", "Unknown"),
             "profile_picture_url": other_profile.get("profile_picture_url"),
             "university_name": (
@@ -794,69 +848,93 @@ class ChatService:
         }
 
         return {
-            "id": UUID(conv["id"]),
-            "participant_1_id": UUID(conv["participant_1_id"]),
-            "participant_2_id": UUID(conv["participant_2_id"]),
+            "id": conv["id"],
+            "participant_1_id": conv["participant_1_id"],
+            "participant_2_id": conv["participant_2_id"],
             "last_message_at": datetime.fromisoformat(conv["last_message_at"]),
             "created_at": datetime.fromisoformat(conv["created_at"]),
             "other_participant": other_participant,
             "unread_count": 0,  # Will be calculated separately if needed
         }
 
-    async def _format_conversation_with_last_message(
-        self, conv: Dict[str, Any], user_id: UUID
-    ) -> Dict[str, Any]:
-        """Format conversation with last message and unread count."""
-        formatted = self._format_conversation_response(conv, user_id)
+    async def _format_conversations_with_last_message(
+        self, convs: List[Dict[str, Any]], user_id: UUID
+    ) -> List[Dict[str, Any]]:
+        """
+        Format conversations with their last message and unread count.
 
-        # Get last message
-        last_msg_response = (
-            supabase.table("messages")
+        Previews and unread counts for the whole page are fetched by two
+        concurrent RPC calls (see migration 006) instead of two queries per
+        conversation.
+        """
+        formatted_conversations = [
+            self._format_conversation_response(conv, user_id) for conv in convs
+        ]
+        if not convs:
+            return formatted_conversations
+
+        client = get_async_supabase_client()
+        conversation_ids = [conv["id"] for conv in convs]
+
+        last_msg_response, unread_response = await asyncio.gather(
+            client.rpc("conversation_last_messages", {"conversation_ids": conversation_ids})
             .select("*, profiles!messages_sender_id_fkey(id, full_name, profile_picture_url)")
-            .eq("conversation_id", conv["id"])
-            .order("created_at", desc=True)
-            .limit(1)
-            .execute()
+            .execute(),
+            client.rpc(
+                "conversation_unread_counts",
+                {"conversation_ids": conversation_ids, "reader_id": str(user_id)},
+            ).execute(),
         )
 
-        if last_msg_response.data:
-            msg = last_msg_response.data[0]
-            try:
-                decrypted_content = decrypt_message(msg["content_encrypted"])
-                sender_profile = msg.pop("profiles")
+        last_messages = {msg["conversation_id"]: msg for msg in last_msg_response.data or []}
+        unread_counts = {
+            row["conversation_id"]: row["unread_count"] for row in unread_response.data or []
+        }
 
+        decrypted_contents = await run_in_threadpool(
+            decrypt_messages, [msg["content_encrypted"] for msg in last_messages.values()]
+        )
+
+        for msg, decrypted_content in zip(last_messages.values(), decrypted_contents):
+            msg["content"] = decrypted_content
+
+        for formatted in formatted_conversations:
+            msg = last_messages.get(formatted["id"])
+            formatted["last_message"] = None
+
+            if msg is not None and msg["content"] is not None:
+                sender_profile = msg["profiles"]
                 formatted["last_message"] = {
-                    "id": UUID(msg["id"]),
-                    "conversation_id": UUID(msg["conversation_id"]),
-                    "sender_id": UUID(msg["sender_id"]),
+                    "id": msg["id"],
+                    "conversation_id": msg["conversation_id"],
+                    "sender_id": msg["sender_id"],
                     "content_encrypted": msg["content_encrypted"],
-                    "content": decrypted_content,
+                    "content": msg["content"],
                     "is_read": msg["is_read"],
                     "created_at": datetime.fromisoformat(msg["created_at"]),
                     "sender": {
-                        "id": UUID(sender_profile["id"]),
+                        "id": sender_profile["id"],
                         "full_name": sender_profile["full_name"],
                         "profile_picture_url": sender_profile.get("profile_picture_url"),
                     },
                 }
-            except Exception:
-                formatted["last_message"] = None
-        else:
-            formatted["last_message"] = None
 
-        # Get unread count
-        unread_response = (
-            supabase.table("messages")
-            .select("id", count="exact")
-            .eq("conversation_id", conv["id"])
-            .eq("is_read", False)
-            .neq("sender_id", str(user_id))
-            .execute()
-        )
+            formatted["unread_count"] = unread_counts.get(formatted["id"], 0)
 
-        formatted["unread_count"] = unread_response.count if unread_response.count else 0
+        return formatted_conversations
 
-        return formatted
+    def _count_user_conversations(self, user_id: UUID) -> int:
+        """Count conversations the user participates in without fetching rows."""
+        total = 0
+        for column in ("participant_1_id", "participant_2_id"):
+            response = (
+                supabase.table("conversations")
+                .select("id", count="exact", head=True)
+                .eq(column, str(user_id))
+                .execute()
+            )
+            total += response.count or 0
+        return total
 
     async def _get_user_profile_for_message(self, user_id: UUID) -> Dict[str, Any]:
         """Helper to fetch user profile for message responses."""
@@ -872,7 +950,7 @@ class ChatService:
 
         profile = response.data[0]
         return {
-            "id": UUID(profile["id"]),
+            "id": profile["id"],
             "full_name": profile["full_name"],
             "profile_picture_url": profile.get("profile_picture_url"),
         }
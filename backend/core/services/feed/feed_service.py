@@ -4,11 +4,110 @@ Feed service.
 Handles all post and like operations including CRUD, feed generation, and engagement.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
+import orjson
+from fastapi.concurrency import run_in_threadpool
+from postgrest.exceptions import APIError
+from supabase import Client
+
 from backend.core.models.feed import PostCreate, PostUpdate
-from backend.db import supabase
+from backend.core.utils import (
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    open_upload_stream,
+    upload_size,
+)
+from backend.db import redis, supabase, supabase_read
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached first feed page stays valid (post writes also invalidate it)
+FEED_CACHE_TTL = 45
+
+# Accepted media MIME types and the media_types kind each maps to
+MEDIA_KINDS = {
+    "image/jpeg": "image",
+    "image/jpg": "image",
+    "image/png": "image",
+    "image/gif": "image",
+    "image/webp": "image",
+    "video/mp4": "video",
+    "video/quicktime": "video",
+    "video/x-msvideo": "video",
+    "video/avi": "video",
+}
+
+# Per-post media limits
+MAX_MEDIA_FILES = 5
+MAX_MEDIA_SIZE = 50 * 1024 * 1024  # 50MB
+
+# Storage upload attempts per media file, and the base backoff between them (seconds)
+MEDIA_UPLOAD_ATTEMPTS = 3
+MEDIA_UPLOAD_BACKOFF = 0.25
+
+# Bumped on every post write; cached feed keys embed it so old entries go stale.
+# "feed:ver:{user_id}" is bumped when that user likes or unlikes, so only their
+# own cached pages are rebuilt (with their queued likes overlaid); like counts
+# seen by everyone else may lag by up to FEED_CACHE_TTL.
+FEED_VERSION_KEY = "feed:ver"
+
+# Set for REPLICA_LAG_MS after a write: "feed:wrote" for anyone, "feed:wrote:{user_id}"
+# for the writer. While set, the writer reads from the primary and the feed cache is
+# neither read nor filled, so nobody caches a page the replica has not caught up on.
+RECENT_WRITE_KEY = "feed:wrote"
+REPLICA_LAG_MS = 1000
+
+# Postgres SQLSTATE raised when a like references a missing post
+FOREIGN_KEY_VIOLATION = "23503"
+
+# Likes and unlikes waiting to be written: "{post_id}:{user_id}" -> like row JSON,
+# or an empty value for an unlike. The latest change per pair wins.
+PENDING_LIKES_KEY = "likes:pending"
+
+# Seconds between bulk writes of pending likes
+LIKE_FLUSH_INTERVAL = 1.0
+
+# Atomically queue a like unless one is already pending, replacing a pending
+# unlike, and bump the liker's feed version. KEYS: pending likes hash, liker's
+# version key. ARGV: field, like row JSON, version TTL. Returns the like that
+# will be stored.
+# A like that is already stored is queued too: an unlike drained by an
+# in-flight flush may be about to delete it, and the next flush's idempotent
+# upsert restores it.
+_QUEUE_LIKE_SCRIPT = """
+local pending = redis.call('HGET', KEYS[1], ARGV[1])
+if pending and pending ~= '' then
+    return pending
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return ARGV[2]
+"""
+
+# Select lists for the hot read paths. They are fixed strings so every request
+# sends PostgREST the same query shape (values are always bind parameters),
+# which lets Postgres reuse the prepared statement and its cached plan.
+
+# Profile summary shown next to posts and likes
+PROFILE_COLUMNS = "id, full_name, profile_picture_url, university_id, universities(name)"
+
+# Post columns with the author profile embedded
+POST_COLUMNS = f"*, profiles!posts_user_id_fkey({PROFILE_COLUMNS})"
+
+# Post columns plus the viewer's own like (filtered on post_likes.user_id)
+LIKED_POST_COLUMNS = f"{POST_COLUMNS}, post_likes(id)"
+
+# Like columns with the liking user's profile embedded
+LIKE_COLUMNS = (
+    f"id, post_id, user_id, created_at, profiles!post_likes_user_id_fkey({PROFILE_COLUMNS})"
+)
 
 
 class PostNotFoundError(Exception):
@@ -49,40 +148,39 @@ class FeedService:
             >>> post = await service.create_post(user_id, post_data)
             >>> print(post["content"])
         """
-        try:
-            # Prepare post data for insertion
-            insert_data = {
-                "user_id": str(user_id),
-                "content": post_data.content,
-                "media_urls": post_data.media_urls or [],
-                "media_types": post_data.media_types or [],
-            }
-
-            # Insert post into database
-            response = supabase.table("posts").insert(insert_data).execute()
+        # Prepare post data for insertion
+        insert_data = {
+            "user_id": str(user_id),
+            "content": post_data.content,
+            "media_urls": post_data.media_urls or [],
+            "media_types": post_data.media_types or [],
+        }
 
-            if not response.data or len(response.data) == 0:
-                raise ValidationError("Failed to create post")
+        # Insert post into database
+        response = supabase.table("posts").insert(insert_data).execute()
 
-            created_post = response.data[0]
+        if not response.data or len(response.data) == 0:
+            raise ValidationError("Failed to create post")
 
-            # Fetch the post with user info
-            return await self.get_post_by_id(UUID(created_post["id"]), user_id)
+        created_post = response.data[0]
+        await self._invalidate_feed_cache(user_id)
 
-        except Exception as e:
-            if isinstance(e, (ValidationError, PostNotFoundError)):
-                raise
-            raise ValidationError(f"Failed to create post: {str(e)}")
+        # Fetch the post with user info from the primary (the replica may lag)
+        return await self._fetch_post(supabase, UUID(created_post["id"]), user_id)
 
     async def upload_media(
-        self, user_id: UUID, files: List[Tuple[bytes, str, str]]
+        self, user_id: UUID, files: List[Tuple[BinaryIO, str, str]]
     ) -> Dict[str, Any]:
         """
         Upload media files to Supabase Storage.
 
+        All files are validated first, then streamed from their spooled
+        upload files (rather than read into memory) concurrently. If any
+        upload fails, the ones that succeeded are removed again.
+
         Args:
             user_id: ID of the user uploading files
-            files: List of tuples (file_content, content_type, filename)
+            files: List of tuples (file_object, content_type, filename)
 
         Returns:
             Dict containing media_urls, media_types, and count
@@ -92,95 +190,101 @@ class FeedService:
 
         Example:
             >>> service = FeedService()
-            >>> files = [(content, "image/jpeg", "photo.jpg")]
+            >>> files = [(upload.file, "image/jpeg", "photo.jpg")]
             >>> result = await service.upload_media(user_id, files)
             >>> print(result["media_urls"])
         """
-        try:
-            # Validate file count
-            if len(files) > 5:
-                raise ValidationError("Maximum 5 files allowed per post")
-
-            # Allowed MIME types
-            allowed_images = {
-                "image/jpeg",
-                "image/jpg",
-                "image/png",
-                "image/gif",
-                "image/webp",
-            }
-            allowed_videos = {
-                "video/mp4",
-                "video/quicktime",
-                "video/x-msvideo",
-                "video/avi",
-            }
-            allowed_types = allowed_images | allowed_videos
-
-            media_urls = []
-            media_types = []
-            uploaded_paths = []  # Track paths for cleanup on error
-
-            for file_content, content_type, filename in files:
-                # Validate MIME type
-                if content_type not in allowed_types:
-                    raise ValidationError(
-                        f"File type '{content_type}' not allowed. "
-                        f"Supported: images (jpg, png, gif, webp) and videos (mp4, mov, avi)"
-                    )
+        # Validate file count
+        if len(files) > MAX_MEDIA_FILES:
+            raise ValidationError(f"Maximum {MAX_MEDIA_FILES} files allowed per post")
+
+        bucket = supabase.storage.from_("post-media")
+
+        # One pass: validate every file before uploading any of them, and
+        # record its storage path, public URL and media kind along the way
+        uploads = []
+        media_urls = []
+        media_types = []
+        for file_obj, content_type, filename in files:
+            # Validate MIME type
+            kind = MEDIA_KINDS.get(content_type)
+            if kind is None:
+                raise ValidationError(
+                    f"File type '{content_type}' not allowed. "
+                    f"Supported: images (jpg, png, gif, webp) and videos (mp4, mov, avi)"
+                )
 
-                # Validate file size (50MB max)
-                max_size = 50 * 1024 * 1024  # 50MB
-                if len(file_content) > max_size:
-                    raise ValidationError(f"File '{filename}' exceeds 50MB limit")
+            # Validate file size (50MB max)
+            if upload_size(file_obj) > MAX_MEDIA_SIZE:
+                raise ValidationError(f"File '{filename}' exceeds 50MB limit")
+
+            # Storage path: user_id/<unique filename>
+            file_ext = filename.split(".")[-1] if "." in filename else "jpg"
+            storage_path = f"{user_id}/{uuid4()}.{file_ext}"
+            uploads.append((file_obj, content_type, filename, storage_path))
+            media_urls.append(bucket.get_public_url(storage_path))
+            media_types.append(kind)
+
+        # Upload all files concurrently (at most 5, so no further bound is needed)
+        results = await asyncio.gather(
+            *(
+                self._upload_media_file(file_obj, content_type, storage_path)
+                for file_obj, content_type, _, storage_path in uploads
+            ),
+            return_exceptions=True,
+        )
+
+        failures = [
+            (filename, result)
+            for (_, _, filename, _), result in zip(uploads, results)
+            if isinstance(result, Exception)
+        ]
+        if failures:
+            # Cleanup: delete the files that did upload
+            uploaded_paths = [
+                storage_path
+                for (_, _, _, storage_path), result in zip(uploads, results)
+                if not isinstance(result, Exception)
+            ]
+            if uploaded_paths:
+                try:
+                    await run_in_threadpool(bucket.remove, uploaded_paths)
+                except Exception as e:
+                    logger.warning("Feed media cleanup failed: %s", e)
 
-                # Generate unique filename
-                file_ext = filename.split(".")[-1] if "." in filename else "jpg"
-                unique_filename = f"{uuid4()}.{file_ext}"
+            filename, upload_error = failures[0]
+            raise ValidationError(f"Upload failed for '{filename}': {str(upload_error)}")
 
-                # Storage path: user_id/filename
-                storage_path = f"{user_id}/{unique_filename}"
+        return {
+            "media_urls": media_urls,
+            "media_types": media_types,
+            "count": len(media_urls),
+        }
 
-                try:
-                    # Upload to Supabase Storage
-                    supabase.storage.from_("post-media").upload(
+    async def _upload_media_file(
+        self, file_obj: BinaryIO, content_type: str, storage_path: str
+    ) -> None:
+        """
+        Upload one file to the post-media bucket, retrying transient failures.
+
+        The blocking storage call runs in the threadpool so several files can
+        upload at once. Attempts back off exponentially (0.25s, 0.5s, ...).
+        """
+        for attempt in range(MEDIA_UPLOAD_ATTEMPTS):
+            try:
+                with open_upload_stream(file_obj) as stream:
+                    await run_in_threadpool(
+                        supabase.storage.from_("post-media").upload,
                         path=storage_path,
-                        file=file_content,
+                        file=stream,
                         file_options={"content-type": content_type},
                     )
-
-                    # Get public URL
-                    public_url = supabase.storage.from_("post-media").get_public_url(storage_path)
-
-                    media_urls.append(public_url)
-                    uploaded_paths.append(storage_path)
-
-                    # Determine media type
-                    if content_type in allowed_images:
-                        media_types.append("image")
-                    else:
-                        media_types.append("video")
-
-                except Exception as upload_error:
-                    # Cleanup: delete any already uploaded files
-                    for path in uploaded_paths:
-                        try:
-                            supabase.storage.from_("post-media").remove([path])
-                        except Exception:
-                            pass  # Ignore cleanup errors
-
-                    raise ValidationError(f"Upload failed for '{filename}': {str(upload_error)}")
-
-            return {
-                "media_urls": media_urls,
-                "media_types": media_types,
-                "count": len(media_urls),
-            }
-
-        except ValidationError:
-            raise
-        except Exception as e:
-            raise ValidationError(f"Media upload failed: {str(e)}")
+                return
+            except Exception as e:
+                if attempt == MEDIA_UPLOAD_ATTEMPTS - 1:
+                    raise
+                logger.warning("Retrying upload of %s: %s", storage_path, e)
+                await asyncio.sleep(MEDIA_UPLOAD_BACKOFF * 2**attempt)
 
     async def delete_media(self, user_id: UUID, media_url: str) -> bool:
         """
@@ -201,28 +305,22 @@ class FeedService:
             >>> service = FeedService()
             >>> success = await service.delete_media(user_id, media_url)
         """
-        try:
-            # Extract storage path from URL
-            # URL format: https://.../storage/v1/object/public/post-media/{user_id}/{filename}
-            if f"post-media/{user_id}/" not in media_url:
-                raise UnauthorizedError("You can only delete your own media files")
+        # Extract storage path from URL
+        # URL format: https://.../storage/v1/object/public/post-media/{user_id}/{filename}
+        if f"post-media/{user_id}/" not in media_url:
+            raise UnauthorizedError("You can only delete your own media files")
 
-            # Extract the path after 'post-media/'
-            path_parts = media_url.split("post-media/")
-            if len(path_parts) < 2:
-                raise ValidationError("Invalid media URL")
+        # Extract the path after 'post-media/'
+        path_parts = media_url.split("post-media/")
+        if len(path_parts) < 2:
+            raise ValidationError("Invalid media URL")
 
-            storage_path = path_parts[1].split("?")[0]  # Remove query params if any
+        storage_path = path_parts[1].split("?")[0]  # Remove query params if any
 
-            # Delete from storage
-            supabase.storage.from_("post-media").remove([storage_path])
+        # Delete from storage
+        await run_in_threadpool(supabase.storage.from_("post-media").remove, [storage_path])
 
-            return True
-
-        except (UnauthorizedError, ValidationError):
-            raise
-        except Exception as e:
-            raise ValidationError(f"Failed to delete media: {str(e)}")
+        return True
 
     async def get_feed(
         self,
@@ -230,85 +328,117 @@ class FeedService:
         page: int = 1,
         page_size: int = 20,
         exclude_own_posts: bool = False,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> Dict[str, Any]:
         """
         Get paginated feed of posts.
 
+        Pages are selected with a keyset cursor on (created_at, id) when
+        `cursor` is given; `page` is the legacy offset-based fallback. See
+        `get_feed_json` for the cached, pre-serialized variant.
+
         Args:
             current_user_id: ID of the current user (for like status)
-            page: Page number (starts at 1)
+            page: Page number (starts at 1), used when no cursor is given
             page_size: Number of posts per page
             exclude_own_posts: Whether to exclude current user's posts
+            cursor: Opaque cursor from a previous page's `next_cursor`
+            include_total: Whether to add an estimated total (costs a count query)
 
         Returns:
             Dict containing:
                 - posts: List of post data with user info
-                - total: Total number of posts
+                - total: Estimated total number of posts, or None
                 - page: Current page number
                 - page_size: Posts per page
                 - has_more: Whether more posts are available
+                - next_cursor: Cursor for the next page, if any
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
 
         Example:
             >>> service = FeedService()
             >>> feed = await service.get_feed(user_id, page=1, page_size=20)
             >>> print(f"Loaded {len(feed['posts'])} posts")
         """
-        try:
-            # Build the query with user info join
-            query = supabase.table("posts").select(
-                "*, profiles!posts_user_id_fkey("
-                "id, full_name, profile_picture_url, university_id, universities(name)"
-                ")"
-                ")",
-                count="exact",
-            )
+        after = decode_cursor(cursor) if cursor else None
 
-            # Exclude current user's posts if requested
-            if exclude_own_posts and current_user_id:
-                query = query.neq("user_id", str(current_user_id))
+        # Build the query with user info (and like status) joined
+        client = await self._read_client(current_user_id)
+        query = self._select_posts(client, current_user_id)
+        count_query = client.table("posts").select("id", count="estimated", head=True)
 
-            # Order by creation time (newest first)
-            query = query.order("created_at", desc=True)
+        # Exclude current user's posts if requested
+        if exclude_own_posts and current_user_id:
+            query = query.neq("user_id", str(current_user_id))
+            count_query = count_query.neq("user_id", str(current_user_id))
 
-            # Get total count first (before pagination)
-            count_response = query.execute()
-            total = count_response.count if hasattr(count_response, "count") else 0
+        # Order by creation time (newest first), id breaks ties
+        query = query.order("created_at", desc=True).order("id", desc=True)
 
-            # Apply pagination
-            start = (page - 1) * page_size
-            end = start + page_size - 1
-            query = query.range(start, end)
-
-            # Execute query
-            response = query.execute()
-
-            if not response.data:
-                return {
-                    "posts": [],
-                    "total": 0,
-                    "page": page,
-                    "page_size": page_size,
-                    "has_more": False,
-                }
+        total = None
+        if include_total:
+            total = count_query.execute().count or 0
 
-            # Process posts and check like status
-            posts = []
-            for post_data in response.data:
-                post = await self._format_post_response(post_data, current_user_id)
-                posts.append(post)
+        return await self._paginate_posts(query, current_user_id, page, page_size, after, total)
 
-            has_more = (start + len(posts)) < total
+    async def get_feed_json(
+        self,
+        current_user_id: Optional[UUID] = None,
+        page: int = 1,
+        page_size: int = 20,
+        exclude_own_posts: bool = False,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Tuple[bytes, bool]:
+        """
+        Get a feed page serialized as PostListResponse JSON.
 
-            return {
-                "posts": posts,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "has_more": has_more,
-            }
+        The first page is cached in Redis (when configured) as the serialized
+        body for FEED_CACHE_TTL seconds per viewer, and any post write
+        invalidates it. A cache hit is returned as-is, without decoding.
+        Pages requested with a total are not cached.
 
-        except Exception as e:
-            raise ValidationError(f"Failed to fetch feed: {str(e)}")
+        Args:
+            current_user_id: ID of the current user (for like status)
+            page: Page number (starts at 1), used when no cursor is given
+            page_size: Number of posts per page
+            exclude_own_posts: Whether to exclude current user's posts
+            cursor: Opaque cursor from a previous page's `next_cursor`
+            include_total: Whether to add an estimated total (costs a count query)
+
+        Returns:
+            Tuple of (JSON body, whether it was served from the cache)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
+        Example:
+            >>> service = FeedService()
+            >>> body, cache_hit = await service.get_feed_json(user_id)
+        """
+        cache_key = None
+        if not cursor and page == 1 and not include_total:
+            cache_key = await self._feed_cache_key(current_user_id, page_size, exclude_own_posts)
+            cached = await self._get_cached_feed(cache_key)
+            if cached is not None:
+                return cached, True
+
+        feed = await self.get_feed(
+            current_user_id=current_user_id,
+            page=page,
+            page_size=page_size,
+            exclude_own_posts=exclude_own_posts,
+            cursor=cursor,
+            include_total=include_total,
+        )
+
+        # Rows are already JSON-ready and shaped like PostListResponse
+        body = orjson.dumps(feed)
+        await self._cache_feed(cache_key, body)
+        return body, False
 
     async def get_post_by_id(
         self, post_id: UUID, current_user_id: Optional[UUID] = None
@@ -331,30 +461,22 @@ class FeedService:
             >>> post = await service.get_post_by_id(post_id, user_id)
             >>> print(post["content"])
         """
-        try:
-            # Query post with user info
-            response = (
-                supabase.table("posts")
-                .select(
-                    "*, profiles!posts_user_id_fkey("
-                    "id, full_name, profile_picture_url, university_id, universities(name)"
-                    ")"
-                    ")",
-                )
-                .eq("id", str(post_id))
-                .execute()
-            )
+        client = await self._read_client(current_user_id)
+        return await self._fetch_post(client, post_id, current_user_id)
 
-            if not response.data or len(response.data) == 0:
-                raise PostNotFoundError(f"Post {post_id} not found")
+    async def _fetch_post(
+        self, client: Client, post_id: UUID, current_user_id: Optional[UUID]
+    ) -> Dict[str, Any]:
+        """Fetch and format one post through `client` (primary or read replica)."""
+        # Query post with user info (and like status) joined
+        response = self._select_posts(client, current_user_id).eq("id", str(post_id)).execute()
 
-            post_data = response.data[0]
-            return await self._format_post_response(post_data, current_user_id)
+        if not response.data or len(response.data) == 0:
+            raise PostNotFoundError(f"Post {post_id} not found")
 
-        except PostNotFoundError:
-            raise
-        except Exception as e:
-            raise ValidationError(f"Failed to fetch post: {str(e)}")
+        post = self._format_post_response(response.data[0], current_user_id)
+        await self._apply_pending_likes([post], current_user_id)
+        return post
 
     async def get_user_posts(
         self,
@@ -362,70 +484,57 @@ class FeedService:
         current_user_id: Optional[UUID] = None,
         page: int = 1,
         page_size: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> Dict[str, Any]:
         """
         Get all posts by a specific user.
 
+        Pages are selected with a keyset cursor on (created_at, id) when
+        `cursor` is given; `page` is the legacy offset-based fallback.
+
         Args:
             user_id: ID of the user whose posts to fetch
             current_user_id: ID of current user (for like status)
-            page: Page number
+            page: Page number, used when no cursor is given
             page_size: Posts per page
+            cursor: Opaque cursor from a previous page's `next_cursor`
+            include_total: Whether to add an estimated total (costs a count query)
 
         Returns:
             Dict containing paginated posts by the user
 
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
         Example:
             >>> service = FeedService()
-            >>> user_posts = await service.get_user_posts(user_id)
+            >>> user_posts = await service.get_user_posts(user_id, include_total=True)
             >>> print(f"User has {user_posts['total']} posts")
         """
-        try:
-            # Query user's posts with profile info
-            query = (
-                supabase.table("posts")
-                .select(
-                    "*, profiles!posts_user_id_fkey("
-                    "id, full_name, profile_picture_url, university_id, universities(name)"
-                    ")"
-                    ")",
-                    count="exact",
-                )
+        after = decode_cursor(cursor) if cursor else None
+
+        client = await self._read_client(current_user_id)
+
+        # Query user's posts with profile info (and like status) joined
+        query = (
+            self._select_posts(client, current_user_id)
+            .eq("user_id", str(user_id))
+            .order("created_at", desc=True)
+            .order("id", desc=True)
+        )
+
+        total = None
+        if include_total:
+            count_response = (
+                client.table("posts")
+                .select("id", count="estimated", head=True)
                 .eq("user_id", str(user_id))
-                .order("created_at", desc=True)
+                .execute()
             )
+            total = count_response.count or 0
 
-            # Get total count
-            count_response = query.execute()
-            total = count_response.count if hasattr(count_response, "count") else 0
-
-            # Apply pagination
-            start = (page - 1) * page_size
-            end = start + page_size - 1
-            query = query.range(start, end)
-
-            # Execute query
-            response = query.execute()
-
-            # Process posts
-            posts = []
-            if response.data:
-                for post_data in response.data:
-                    post = await self._format_post_response(post_data, current_user_id)
-                    posts.append(post)
-
-            has_more = (start + len(posts)) < total
-
-            return {
-                "posts": posts,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "has_more": has_more,
-            }
-
-        except Exception as e:
-            raise ValidationError(f"Failed to fetch user posts: {str(e)}")
+        return await self._paginate_posts(query, current_user_id, page, page_size, after, total)
 
     async def update_post(
         self, post_id: UUID, user_id: UUID, update_data: PostUpdate
@@ -450,38 +559,34 @@ class FeedService:
             >>> updated = await service.update_post(post_id, user_id, update_data)
             >>> print(updated["content"])
         """
-        try:
-            # Check if post exists and belongs to user
-            post_check = supabase.table("posts").select("user_id").eq("id", str(post_id)).execute()
+        # Check if post exists and belongs to user
+        post_check = supabase.table("posts").select("user_id").eq("id", str(post_id)).execute()
 
-            if not post_check.data or len(post_check.data) == 0:
-                raise PostNotFoundError(f"Post {post_id} not found")
+        if not post_check.data or len(post_check.data) == 0:
+            raise PostNotFoundError(f"Post {post_id} not found")
 
-            if post_check.data[0]["user_id"] != str(user_id):
-                raise UnauthorizedError("You can only update your own posts")
+        if post_check.data[0]["user_id"] != str(user_id):
+            raise UnauthorizedError("You can only update your own posts")
 
-            # Prepare update data
-            update_dict = {}
-            if update_data.content is not None:
-                update_dict["content"] = update_data.content
+        # Prepare update data
+        update_dict = {}
+        if update_data.content is not None:
+            update_dict["content"] = update_data.content
 
-            if not update_dict:
-                # No updates to make, just return current post
-                return await self.get_post_by_id(post_id, user_id)
+        if not update_dict:
+            # No updates to make, just return current post
+            return await self._fetch_post(supabase, post_id, user_id)
 
-            # Update the post
-            response = supabase.table("posts").update(update_dict).eq("id", str(post_id)).execute()
+        # Update the post
+        response = supabase.table("posts").update(update_dict).eq("id", str(post_id)).execute()
 
-            if not response.data or len(response.data) == 0:
-                raise ValidationError("Failed to update post")
+        if not response.data or len(response.data) == 0:
+            raise ValidationError("Failed to update post")
 
-            # Return updated post with user info
-            return await self.get_post_by_id(post_id, user_id)
+        await self._invalidate_feed_cache(user_id)
 
-        except (PostNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise ValidationError(f"Failed to update post: {str(e)}")
+        # Return updated post with user info from the primary (the replica may lag)
+        return await self._fetch_post(supabase, post_id, user_id)
 
     async def delete_post(self, post_id: UUID, user_id: UUID) -> bool:
         """
@@ -503,30 +608,28 @@ class FeedService:
             >>> success = await service.delete_post(post_id, user_id)
             >>> print(f"Deleted: {success}")
         """
-        try:
-            # Check if post exists and belongs to user
-            post_check = supabase.table("posts").select("user_id").eq("id", str(post_id)).execute()
-
-            if not post_check.data or len(post_check.data) == 0:
-                raise PostNotFoundError(f"Post {post_id} not found")
+        # Check if post exists and belongs to user
+        post_check = supabase.table("posts").select("user_id").eq("id", str(post_id)).execute()
 
-            if post_check.data[0]["user_id"] != str(user_id):
-                raise UnauthorizedError("You can only delete your own posts")
+        if not post_check.data or len(post_check.data) == 0:
+            raise PostNotFoundError(f"Post {post_id} not found")
 
-            # Delete the post (CASCADE will delete likes)
-            supabase.table("posts").delete().eq("id", str(post_id)).execute()
+        if post_check.data[0]["user_id"] != str(user_id):
+            raise UnauthorizedError("You can only delete your own posts")
 
-            return True
+        # Delete the post (CASCADE will delete likes)
+        supabase.table("posts").delete().eq("id", str(post_id)).execute()
+        await self._invalidate_feed_cache(user_id)
 
-        except (PostNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise ValidationError(f"Failed to delete post: {str(e)}")
+        return True
 
     async def like_post(self, post_id: UUID, user_id: UUID) -> Dict[str, Any]:
         """
         Like a post.
 
+        With Redis configured the like is queued and written by the background
+        flusher; the returned row is the one that will be stored.
+
         Args:
             post_id: ID of the post to like
             user_id: ID of the user liking the post
@@ -542,81 +645,93 @@ class FeedService:
             >>> like = await service.like_post(post_id, user_id)
             >>> print(f"Liked at: {like['created_at']}")
         """
-        try:
-            # Check if post exists and get current like count
-            post_check = (
-                supabase.table("posts").select("id, like_count").eq("id", str(post_id)).execute()
+        like_data = None
+        if redis is not None:
+            # Check the post exists and fetch the user's like with it
+            post_check = await run_in_threadpool(
+                supabase.table("posts")
+                .select("id, post_likes(*)")
+                .eq("id", str(post_id))
+                .eq("post_likes.user_id", str(user_id))
+                .execute
             )
 
             if not post_check.data or len(post_check.data) == 0:
                 raise PostNotFoundError(f"Post {post_id} not found")
 
-            # Check if user already liked this post
-            existing_like = (
-                supabase.table("post_likes")
-                .select("*")
-                .eq("post_id", str(post_id))
-                .eq("user_id", str(user_id))
-                .execute()
-            )
-
-            if existing_like.data and len(existing_like.data) > 0:
-                # Already liked, return existing like
-                like_data = existing_like.data[0]
-            else:
-                # Create new like
-                like_insert = {"post_id": str(post_id), "user_id": str(user_id)}
-
-                response = supabase.table("post_likes").insert(like_insert).execute()
+            existing_like = post_check.data[0].get("post_likes") or []
+            existing = existing_like[0] if existing_like else None
+
+            # Queued and written in bulk by the flusher
+            like_data = await self._queue_like(post_id, user_id, existing)
+
+        if like_data is None:
+            like_data = await run_in_threadpool(self._upsert_like, post_id, user_id)
+
+            # posts.like_count is maintained by a trigger on post_likes
+            await self._invalidate_feed_cache(user_id)
+
+        # Get user info for the like
+        user_info = await run_in_threadpool(
+            supabase.table("profiles").select(PROFILE_COLUMNS).eq("id", str(user_id)).execute
+        )
+
+        user_dict = {}
+        if user_info.data and len(user_info.data) > 0:
+            profile = user_info.data[0]
+            user_dict = {
+                "id": profile["id"],
+                "full_name": profile["full_name"],
+                "profile_picture_url": profile.get("profile_picture_url"),
+                "university_name": (
+                    profile["universities"]["name"] if profile.get("universities") else None
+                ),
+            }
 
-                if not response.data or len(response.data) == 0:
-                    raise ValidationError("Failed to create like")
+        return {
+            "id": like_data["id"],
+            "post_id": like_data["post_id"],
+            "user_id": like_data["user_id"],
+            "created_at": like_data["created_at"],
+            "user": user_dict,
+        }
 
-                like_data = response.data[0]
+    def _upsert_like(self, post_id: UUID, user_id: UUID) -> Dict[str, Any]:
+        """
+        Insert a like, or return the existing one, in a single statement.
 
-                # Increment like count in posts table
-                current_count = post_check.data[0].get("like_count", 0)
-                supabase.table("posts").update({"like_count": current_count + 1}).eq(
-                    "id", str(post_id)
-                ).execute()
+        INSERT ... ON CONFLICT (post_id, user_id) DO UPDATE is race-free under
+        concurrent likes and always returns the stored row. The conflict path
+        is an UPDATE, so the like_count insert trigger does not fire twice.
 
-            # Get user info for the like
-            user_info = (
-                supabase.table("profiles")
-                .select("id, full_name, profile_picture_url, university_id, universities(name)")
-                .eq("id", str(user_id))
+        Raises:
+            PostNotFoundError: If the post doesn't exist (foreign key violation)
+            ValidationError: If no row comes back
+        """
+        try:
+            response = (
+                supabase.table("post_likes")
+                .upsert(
+                    {"post_id": str(post_id), "user_id": str(user_id)},
+                    on_conflict="post_id,user_id",
+                )
                 .execute()
             )
-
-            user_dict = {}
-            if user_info.data and len(user_info.data) > 0:
-                profile = user_info.data[0]
-                user_dict = {
-                    "id": profile["id"],
-                    "full_name": profile["full_name"],
-                    "profile_picture_url": profile.get("profile_picture_url"),
-                    "university_name": (
-                        profile["universities"]["name"] if profile.get("universities") else None
-                    ),
-                }
-
-            return {
-                "id": like_data["id"],
-                "post_id": like_data["post_id"],
-                "user_id": like_data["user_id"],
-                "created_at": like_data["created_at"],
-                "user": user_dict,
-            }
-
-        except (PostNotFoundError, ValidationError):
+        except APIError as e:
+            if e.code == FOREIGN_KEY_VIOLATION:
+                raise PostNotFoundError(f"Post {post_id} not found") from e
             raise
-        except Exception as e:
-            raise ValidationError(f"Failed to like post: {str(e)}")
+
+        if not response.data:
+            raise ValidationError("Failed to create like")
+        return response.data[0]
 
     async def unlike_post(self, post_id: UUID, user_id: UUID) -> bool:
         """
         Unlike a post.
 
+        With Redis configured the unlike is queued for the background flusher.
+
         Args:
             post_id: ID of the post to unlike
             user_id: ID of the user unliking the post
@@ -629,40 +744,24 @@ class FeedService:
             >>> success = await service.unlike_post(post_id, user_id)
             >>> print(f"Unliked: {success}")
         """
-        try:
-            # Check if the like exists before deleting
-            existing_like = (
-                supabase.table("post_likes")
-                .select("id")
-                .eq("post_id", str(post_id))
-                .eq("user_id", str(user_id))
-                .execute()
-            )
-
-            # Delete the like
-            supabase.table("post_likes").delete().eq("post_id", str(post_id)).eq(
-                "user_id", str(user_id)
-            ).execute()
-
-            # Only decrement if like existed
-            if existing_like.data and len(existing_like.data) > 0:
-                # Get current like count and decrement
-                post_check = (
-                    supabase.table("posts").select("like_count").eq("id", str(post_id)).execute()
-                )
+        if await self._queue_unlike(post_id, user_id):
+            return True
 
-                if post_check.data and len(post_check.data) > 0:
-                    current_count = post_check.data[0].get("like_count", 0)
-                    new_count = max(0, current_count - 1)  # Ensure it doesn't go below 0
-                    supabase.table("posts").update({"like_count": new_count}).eq(
-                        "id", str(post_id)
-                    ).execute()
+        # Delete the like; posts.like_count is decremented by a trigger
+        deleted = await run_in_threadpool(
+            supabase.table("post_likes")
+            .delete()
+            .eq("post_id", str(post_id))
+            .eq("user_id", str(user_id))
+            .execute
+        )
 
-            # Return True even if like didn't exist (idempotent)
-            return True
+        # Only invalidate if a like was actually removed
+        if deleted.data:
+            await self._invalidate_feed_cache(user_id)
 
-        except Exception as e:
-            raise ValidationError(f"Failed to unlike post: {str(e)}")
+        # Return True even if like didn't exist (idempotent)
+        return True
 
     async def get_post_likes(
         self, post_id: UUID, page: int = 1, page_size: int = 50
@@ -683,78 +782,420 @@ class FeedService:
             >>> likes = await service.get_post_likes(post_id)
             >>> print(f"{likes['total']} users liked this post")
         """
-        try:
-            # Query likes with user info
-            query = (
-                supabase.table("post_likes")
-                .select(
-                    "*, profiles!post_likes_user_id_fkey("
-                    "id, full_name, profile_picture_url, university_id, universities(name))",
-                    count="exact",
+        # One query, no COUNT: the post's trigger-maintained like_count is the
+        # total, and one extra embedded like tells whether another page exists
+        start = (page - 1) * page_size
+        response = (
+            supabase_read.table("posts")
+            .select(f"like_count, post_likes({LIKE_COLUMNS})")
+            .eq("id", str(post_id))
+            .order("created_at", desc=True, foreign_table="post_likes")
+            .range(start, start + page_size, foreign_table="post_likes")
+            .execute()
+        )
+        post = response.data[0] if response.data else {}
+        total = post.get("like_count", 0)
+        rows = post.get("post_likes") or []
+        has_more = len(rows) > page_size
+
+        # Process likes
+        likes = []
+        if rows:
+            for like_data in rows[:page_size]:
+                profile = like_data.get("profiles", {})
+                user_dict = {
+                    "id": profile.get("id"),
+                    "full_name": profile.get("full_name"),
+                    "profile_picture_url": profile.get("profile_picture_url"),
+                    "university_name": (
+                        profile.get("universities", {}).get("name")
+                        if profile.get("universities")
+                        else None
+                    ),
+                }
+
+                likes.append(
+                    {
+                        "id": like_data["id"],
+                        "post_id": like_data["post_id"],
+                        "user_id": like_data["user_id"],
+                        "created_at": like_data["created_at"],
+                        "user": user_dict,
+                    }
                 )
-                .eq("post_id", str(post_id))
-                .order("created_at", desc=True)
-            )
 
-            # Get total count
-            count_response = query.execute()
-            total = count_response.count if hasattr(count_response, "count") else 0
+        return {
+            "likes": likes,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+        }
+
+    async def _paginate_posts(
+        self,
+        query: Any,
+        current_user_id: Optional[UUID],
+        page: int,
+        page_size: int,
+        after: Optional[Tuple[str, str]],
+        total: Optional[int],
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of an ordered posts query and format it.
+
+        Uses the keyset `after` position when given, otherwise the legacy
+        offset for `page`. Either way one extra row is fetched to detect
+        another page, so no count is needed.
 
-            # Apply pagination
+        Returns:
+            Dict formatted for PostListResponse
+        """
+        if after:
+            query = query.or_(keyset_filter("created_at", *after)).limit(page_size + 1)
+        else:
             start = (page - 1) * page_size
-            end = start + page_size - 1
-            query = query.range(start, end)
-
-            # Execute query
-            response = query.execute()
-
-            # Process likes
-            likes = []
-            if response.data:
-                for like_data in response.data:
-                    profile = like_data.get("profiles", {})
-                    user_dict = {
-                        "id": profile.get("id"),
-                        "full_name": profile.get("full_name"),
-                        "profile_picture_url": profile.get("profile_picture_url"),
-                        "university_name": (
-                            profile.get("universities", {}).get("name")
-                            if profile.get("universities")
-                            else None
-                        ),
-                    }
+            query = query.range(start, start + page_size)
 
-                    likes.append(
-                        {
-                            "id": like_data["id"],
-                            "post_id": like_data["post_id"],
-                            "user_id": like_data["user_id"],
-                            "created_at": like_data["created_at"],
-                            "user": user_dict,
-                        }
-                    )
+        rows = query.execute().data or []
 
-            has_more = (start + len(likes)) < total
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
 
-            return {
-                "likes": likes,
-                "total": total,
-                "page": page,
-                "page_size": page_size,
-                "has_more": has_more,
-            }
+        next_cursor = None
+        if has_more and rows:
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+        posts = [self._format_post_response(post_data, current_user_id) for post_data in rows]
+        await self._apply_pending_likes(posts, current_user_id)
+
+        return {
+            "posts": posts,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+
+    async def _feed_cache_key(
+        self, current_user_id: Optional[UUID], page_size: int, exclude_own_posts: bool
+    ) -> Optional[str]:
+        """
+        Build the Redis key for a viewer's first feed page.
+
+        Returns:
+            Optional[str]: Key embedding the global and the viewer's feed
+            versions, or None without Redis
+        """
+        if redis is None:
+            return None
+
+        viewer = current_user_id or "anon"
+        try:
+            version, recent_write, viewer_version = await redis.mget(
+                FEED_VERSION_KEY, RECENT_WRITE_KEY, f"{FEED_VERSION_KEY}:{viewer}"
+            )
+        except Exception as e:
+            logger.warning("Feed cache version read error: %s", e)
+            return None
+
+        # Replicas may not have the latest write yet; don't cache what they return
+        if recent_write:
+            return None
+
+        exclude = int(bool(exclude_own_posts and current_user_id))
+        versions = f"{int(version or 0)}.{int(viewer_version or 0)}"
+        return f"feed:v1:{versions}:{viewer}:{page_size}:{exclude}"
 
+    async def _get_cached_feed(self, cache_key: Optional[str]) -> Optional[bytes]:
+        """Return a cached, serialized feed page, or None on a miss or without Redis."""
+        if cache_key is None:
+            return None
+
+        try:
+            return await redis.get(cache_key)
+        except Exception as e:
+            logger.warning("Feed cache read error: %s", e)
+            return None
+
+    async def _cache_feed(self, cache_key: Optional[str], body: bytes) -> None:
+        """Store a serialized feed page for FEED_CACHE_TTL seconds."""
+        if cache_key is None:
+            return
+
+        try:
+            await redis.setex(cache_key, FEED_CACHE_TTL, body)
         except Exception as e:
-            raise ValidationError(f"Failed to fetch post likes: {str(e)}")
+            logger.warning("Feed cache write error: %s", e)
 
-    async def _format_post_response(
+    async def _invalidate_feed_cache(self, *writer_ids: UUID) -> None:
+        """
+        Drop every cached feed page after a post write (or an unqueued like).
+
+        With a read replica configured, also marks the write as recent (see
+        RECENT_WRITE_KEY) so the writers read their own changes from the primary.
+
+        Args:
+            *writer_ids: IDs of the users whose writes caused the invalidation
+        """
+        if redis is None:
+            return
+
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.incr(FEED_VERSION_KEY)
+                if supabase_read is not supabase:
+                    pipe.set(RECENT_WRITE_KEY, 1, px=REPLICA_LAG_MS)
+                    for writer_id in writer_ids:
+                        pipe.set(f"{RECENT_WRITE_KEY}:{writer_id}", 1, px=REPLICA_LAG_MS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Feed cache invalidation error: %s", e)
+
+    async def _mark_recent_writes(self, *writer_ids: str) -> None:
+        """
+        Mark writers as having just written, without dropping anyone's cached feed.
+
+        Used by the like flusher: like state is overlaid per viewer, so a flush
+        only needs the writers to read their own changes from the primary.
+        """
+        if redis is None or supabase_read is supabase or not writer_ids:
+            return
+
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for writer_id in writer_ids:
+                    pipe.set(f"{RECENT_WRITE_KEY}:{writer_id}", 1, px=REPLICA_LAG_MS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Recent write mark error: %s", e)
+
+    async def _read_client(self, current_user_id: Optional[UUID]) -> Client:
+        """
+        Pick the client for a read: the replica, unless the viewer just wrote.
+
+        Returns:
+            Client: The primary client while the viewer's recent-write marker is
+            set (or Redis cannot be checked), otherwise the read client
+        """
+        if supabase_read is supabase or redis is None or current_user_id is None:
+            return supabase_read
+
+        try:
+            recent_write = await redis.exists(f"{RECENT_WRITE_KEY}:{current_user_id}")
+        except Exception as e:
+            logger.warning("Recent write check error: %s", e)
+            return supabase
+
+        return supabase if recent_write else supabase_read
+
+    async def _queue_like(
+        self, post_id: UUID, user_id: UUID, existing: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Queue a like for the background flusher instead of inserting it now.
+
+        Args:
+            post_id: ID of the post being liked
+            user_id: ID of the user liking the post
+            existing: The user's stored like for the post, if any
+
+        Returns:
+            Optional[Dict[str, Any]]: Like row to return, or None without Redis
+            (or on a Redis error) so the caller writes the like directly
+        """
+        if redis is None:
+            return None
+
+        # New like, or the stored one (re-queued so an in-flight unlike cannot drop it)
+        like = existing or {
+            "id": str(uuid4()),
+            "post_id": str(post_id),
+            "user_id": str(user_id),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        try:
+            # One script, so concurrent likes of the same pair agree on the row
+            queued = await redis.eval(
+                _QUEUE_LIKE_SCRIPT,
+                2,
+                PENDING_LIKES_KEY,
+                f"{FEED_VERSION_KEY}:{user_id}",
+                f"{post_id}:{user_id}",
+                orjson.dumps(like),
+                FEED_CACHE_TTL,
+            )
+            return orjson.loads(queued)
+        except Exception as e:
+            logger.warning("Like queue write error: %s", e)
+            return None
+
+    async def _queue_unlike(self, post_id: UUID, user_id: UUID) -> bool:
+        """
+        Queue an unlike for the background flusher.
+
+        Returns:
+            bool: True if queued, False without Redis (or on a Redis error)
+        """
+        if redis is None:
+            return False
+
+        try:
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.hset(PENDING_LIKES_KEY, f"{post_id}:{user_id}", b"")
+                pipe.incr(f"{FEED_VERSION_KEY}:{user_id}")
+                pipe.expire(f"{FEED_VERSION_KEY}:{user_id}", FEED_CACHE_TTL)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning("Like queue write error: %s", e)
+            return False
+
+    async def _apply_pending_likes(
+        self, posts: List[Dict[str, Any]], current_user_id: Optional[UUID]
+    ) -> None:
+        """
+        Overlay the viewer's queued likes and unlikes onto formatted posts.
+
+        Keeps is_liked_by_current_user and like_count consistent for the user
+        who just liked or unliked, until the flusher writes the change.
+        """
+        if redis is None or not current_user_id or not posts:
+            return
+
+        fields = [f"{post['id']}:{current_user_id}" for post in posts]
+        try:
+            values = await redis.hmget(PENDING_LIKES_KEY, fields)
+        except Exception as e:
+            logger.warning("Like queue read error: %s", e)
+            return
+
+        for post, value in zip(posts, values):
+            if value is None:
+                continue
+            liked = bool(value)
+            if liked != post["is_liked_by_current_user"]:
+                post["like_count"] = max(0, post["like_count"] + (1 if liked else -1))
+                post["is_liked_by_current_user"] = liked
+
+    async def flush_pending_likes(self) -> int:
+        """
+        Write queued likes and unlikes to the database in bulk.
+
+        The queue is drained atomically, so several workers can flush
+        concurrently. If the write fails the changes are requeued unless a
+        newer change for the same pair has been queued meanwhile.
+
+        Returns:
+            int: Number of queued changes written
+        """
+        if redis is None:
+            return 0
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(PENDING_LIKES_KEY)
+            pipe.delete(PENDING_LIKES_KEY)
+            pending, _ = await pipe.execute()
+
+        if not pending:
+            return 0
+
+        likes = []
+        unlikes: Dict[str, List[str]] = {}
+        for field, value in pending.items():
+            if value:
+                likes.append(orjson.loads(value))
+            else:
+                post_id, user_id = field.decode().split(":")
+                unlikes.setdefault(user_id, []).append(post_id)
+
+        try:
+            await run_in_threadpool(self._write_like_changes, likes, unlikes)
+        except Exception:
+            async with redis.pipeline(transaction=False) as pipe:
+                for field, value in pending.items():
+                    pipe.hsetnx(PENDING_LIKES_KEY, field, value)
+                await pipe.execute()
+            raise
+
+        writer_ids = {field.decode().split(":")[1] for field in pending}
+        await self._mark_recent_writes(*writer_ids)
+        return len(pending)
+
+    def _write_like_changes(
+        self, likes: List[Dict[str, Any]], unlikes: Dict[str, List[str]]
+    ) -> None:
+        """
+        Insert likes and delete unlikes in as few statements as possible.
+
+        Likes on posts deleted since they were queued are dropped, so one
+        stale entry cannot fail the whole batch.
+
+        Args:
+            likes: Like rows to insert (duplicates of stored likes are ignored)
+            unlikes: Post IDs to unlike, keyed by user ID
+        """
+        if likes:
+            post_ids = list({like["post_id"] for like in likes})
+            live = supabase.table("posts").select("id").in_("id", post_ids).execute()
+            live_ids = {row["id"] for row in live.data or []}
+            likes = [like for like in likes if like["post_id"] in live_ids]
+
+        if likes:
+            supabase.table("post_likes").upsert(
+                likes,
+                on_conflict="post_id,user_id",
+                ignore_duplicates=True,
+                returning="minimal",
+            ).execute()
+
+        for user_id, post_ids in unlikes.items():
+            supabase.table("post_likes").delete(returning="minimal").eq("user_id", user_id).in_(
+                "post_id", post_ids
+            ).execute()
+
+    async def run_like_flusher(self, interval: float = LIKE_FLUSH_INTERVAL) -> None:
+        """Flush queued likes every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush_pending_likes()
+            except Exception as e:
+                logger.warning("Like flush failed: %s", e)
+
+    def _select_posts(self, client: Client, current_user_id: Optional[UUID] = None) -> Any:
+        """
+        Start a posts query with the author profile embedded.
+
+        For a signed-in user the user's own like is embedded as well, so like
+        status comes back with the posts instead of one query per post.
+
+        Args:
+            client: Supabase client to query (primary or read replica)
+            current_user_id: ID of current user (for like status)
+
+        Returns:
+            Query builder to add filters and ordering to
+        """
+        if not current_user_id:
+            return client.table("posts").select(POST_COLUMNS)
+
+        # The filter applies to the embedded likes only, not to the posts
+        return (
+            client.table("posts")
+            .select(LIKED_POST_COLUMNS)
+            .eq("post_likes.user_id", str(current_user_id))
+        )
+
+    def _format_post_response(
         self, post_data: Dict[str, Any], current_user_id: Optional[UUID] = None
     ) -> Dict[str, Any]:
         """
         Format post data for response.
 
         Args:
-            post_data: Raw post data from database
+            post_data: Raw post data from `_select_posts`
             current_user_id: ID of current user (for like status)
 
         Returns:
@@ -771,17 +1212,10 @@ class FeedService:
             ),
         }
 
-        # Check if current user liked this post
+        # Embedded likes are already filtered to the current user
         is_liked = None
         if current_user_id:
-            like_check = (
-                supabase.table("post_likes")
-                .select("id")
-                .eq("post_id", post_data["id"])
-                .eq("user_id", str(current_user_id))
-                .execute()
-            )
-            is_liked = bool(like_check.data and len(like_check.data) > 0)
+            is_liked = bool(post_data.get("post_likes"))
 
         return {
             "id": post_data["id"],
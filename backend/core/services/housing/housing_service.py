@@ -5,19 +5,84 @@ Handles all housing listing operations, including creation, retrieval,
 updating, deletion, search, and likes.
 """
 
+import asyncio
+import hashlib
+import logging
+import re
+from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
+import orjson
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+
 from backend.core.models.housing import (
     HousingLikeResponse,
     HousingListingCreate,
     HousingListingResponse,
     HousingListingUpdate,
-    HousingListResponse,
     HousingSearchFilters,
 )
-from backend.db import supabase
+from backend.core.utils import open_upload_stream, upload_size
+from backend.db import redis, supabase
+
+logger = logging.getLogger(__name__)
+
+# Accepted image MIME types and per-listing image limits
+ALLOWED_IMAGE_TYPES = frozenset({"image/jpeg", "image/jpg", "image/png", "image/gif", "image/webp"})
+MAX_LISTING_IMAGES = 10
+MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
+
+# Seconds a cached listing page stays valid (listing and like writes also invalidate it)
+LISTINGS_CACHE_TTL = 30
+
+# Redis counter bumped on every listing or like write; cache keys embed it
+LISTINGS_VERSION_KEY = "housing:version"
+
+# Newest active listings kept in memory for the default listings view, and
+# the seconds between refreshes of that snapshot
+NEWEST_LISTINGS_LIMIT = 1000
+NEWEST_LISTINGS_REFRESH = 30.0
+
+# Seconds between bulk writes of counted listing views
+VIEW_FLUSH_INTERVAL = 5.0
+
+# Listing columns with the owner's profile embedded
+LISTING_COLUMNS = (
+    "*, profiles!housing_listings_user_id_fkey("
+    "id, full_name, profile_picture_url, universities(name)"
+    ")"
+)
+
+# Like columns with the liking user's profile embedded
+HOUSING_LIKE_COLUMNS = (
+    "id, listing_id, user_id, created_at, profiles!housing_likes_user_id_fkey("
+    "id, full_name, profile_picture_url, universities(name)"
+    ")"
+)
+
+# Batch validator for listing pages (one call instead of a model per row)
+_listing_list_adapter = TypeAdapter(List[HousingListingResponse])
+
+# Active listing rows (owner profile embedded) by listing ID. Writes in this
+# process evict their listing; other workers may serve it for up to the TTL.
+_listing_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Serialized user-listings pages by owner ID, then by (viewer is owner, page,
+# page_size, include_inactive). Only anonymous and owner views are kept. The
+# owner's listing writes and any like or unlike of their listings evict the
+# owner, since pages carry like counts and the owner's own like status.
+_user_listings_cache: TTLCache = TTLCache(maxsize=50_000, ttl=60)
+
+# Listing views counted since the last flush, by listing ID
+_pending_views: Counter = Counter()
+
+# Snapshot of the newest active listings ({"listings": [...], "total": n}),
+# built by HousingService.refresh_newest_listings; None until the first refresh
+_newest_listings: Optional[Dict[str, Any]] = None
 
 
 class ListingNotFoundError(Exception):
@@ -38,14 +103,17 @@ class HousingService:
     """
 
     async def upload_housing_media(
-        self, user_id: UUID, files: List[Tuple[bytes, str, str]]
+        self, user_id: UUID, files: List[Tuple[BinaryIO, str, str]]
     ) -> Dict[str, Any]:
         """
         Upload image files for housing listings to Supabase Storage.
 
+        Files are streamed from the upload's spooled temporary file rather
+        than read into memory, and each storage call runs in the threadpool.
+
         Args:
             user_id: ID of the user uploading files
-            files: List of tuples (file_content, content_type, filename)
+            files: List of tuples (file_obj, content_type, filename)
 
         Returns:
             Dict containing image_urls and count
@@ -55,32 +123,23 @@ class HousingService:
         """
         try:
             # Validate file count (max 10 images for housing)
-            if len(files) > 10:
-                raise ValidationError("Maximum 10 images allowed per listing")
-
-            # Allowed MIME types (images only)
-            allowed_types = {
-                "image/jpeg",
-                "image/jpg",
-                "image/png",
-                "image/gif",
-                "image/webp",
-            }
+            if len(files) > MAX_LISTING_IMAGES:
+                raise ValidationError(f"Maximum {MAX_LISTING_IMAGES} images allowed per listing")
 
-            image_urls = []
-            uploaded_paths = []
+            bucket = supabase.storage.from_("housing-images")
 
-            for file_content, content_type, filename in files:
+            # Validate every file before uploading any of them
+            uploads = []
+            for file_obj, content_type, filename in files:
                 # Validate MIME type
-                if content_type not in allowed_types:
+                if content_type not in ALLOWED_IMAGE_TYPES:
                     raise ValidationError(
                         f"File type '{content_type}' not allowed. "
                         f"Supported: images (jpg, png, gif, webp)"
                     )
 
                 # Validate file size (10MB max)
-                max_size = 10 * 1024 * 1024  # 10MB
-                if len(file_content) > max_size:
+                if upload_size(file_obj) > MAX_IMAGE_SIZE:
                     raise ValidationError(f"File '{filename}' exceeds 10MB limit")
 
                 # Generate unique filename
@@ -89,33 +148,39 @@ class HousingService:
 
                 # Storage path: user_id/filename
                 storage_path = f"{user_id}/{unique_filename}"
+                uploads.append((file_obj, content_type, filename, storage_path))
 
-                try:
-                    # Upload to Supabase Storage
-                    supabase.storage.from_("housing-images").upload(
-                        path=storage_path,
-                        file=file_content,
-                        file_options={"content-type": content_type},
-                    )
-
-                    # Get public URL
-                    public_url = supabase.storage.from_("housing-images").get_public_url(
-                        storage_path
-                    )
-
-                    image_urls.append(public_url)
-                    uploaded_paths.append(storage_path)
-
-                except Exception as upload_error:
-                    # Cleanup: delete any already uploaded files
-                    for path in uploaded_paths:
-                        try:
-                            supabase.storage.from_("housing-images").remove([path])
-                        except Exception:
-                            pass
-
-                    raise ValidationError(f"Upload failed for '{filename}': {str(upload_error)}")
+            # Upload all files concurrently (at most 10, so no further bound is needed)
+            results = await asyncio.gather(
+                *(
+                    self._upload_image(bucket, file_obj, content_type, storage_path)
+                    for file_obj, content_type, _, storage_path in uploads
+                ),
+                return_exceptions=True,
+            )
 
+            failures = [
+                (filename, result)
+                for (_, _, filename, _), result in zip(uploads, results)
+                if isinstance(result, Exception)
+            ]
+            if failures:
+                # Cleanup: delete the files that did upload
+                uploaded_paths = [
+                    storage_path
+                    for (_, _, _, storage_path), result in zip(uploads, results)
+                    if not isinstance(result, Exception)
+                ]
+                if uploaded_paths:
+                    try:
+                        await run_in_threadpool(bucket.remove, uploaded_paths)
+                    except Exception as e:
+                        logger.warning("Housing media cleanup failed: %s", e)
+
+                filename, upload_error = failures[0]
+                raise ValidationError(f"Upload failed for '{filename}': {str(upload_error)}")
+
+            image_urls = [bucket.get_public_url(storage_path) for _, _, _, storage_path in uploads]
             return {
                 "image_urls": image_urls,
                 "count": len(image_urls),
@@ -126,6 +191,18 @@ class HousingService:
         except Exception as e:
             raise ValidationError(f"Housing media upload failed: {str(e)}")
 
+    async def _upload_image(
+        self, bucket: Any, file_obj: BinaryIO, content_type: str, storage_path: str
+    ) -> None:
+        """Stream one file to the housing-images bucket from the threadpool."""
+        with open_upload_stream(file_obj) as stream:
+            await run_in_threadpool(
+                bucket.upload,
+                path=storage_path,
+                file=stream,
+                file_options={"content-type": content_type},
+            )
+
     async def delete_housing_media(self, user_id: UUID, image_url: str) -> bool:
         """
         Delete a housing image file from Supabase Storage.
@@ -153,7 +230,7 @@ class HousingService:
             storage_path = path_parts[1].split("?")[0]
 
             # Delete from storage
-            supabase.storage.from_("housing-images").remove([storage_path])
+            await run_in_threadpool(supabase.storage.from_("housing-images").remove, [storage_path])
 
             return True
 
@@ -215,6 +292,8 @@ class HousingService:
 
             created_listing = response.data[0]
 
+            await self._invalidate_listings_cache(owner_id=user_id)
+
             # Fetch user info for the response
             user_info = await self._get_user_profile_for_listing(user_id)
 
@@ -251,94 +330,58 @@ class HousingService:
         Raises:
             Exception: For database errors.
         """
-        try:
-            # Base query for active listings with user and university info
-            query = (
-                supabase.table("housing_listings")
-                .select(
-                    "*, profiles!housing_listings_user_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .eq("is_active", True)
-            )
-
-            # Apply filters
-            if filters:
-                if filters.min_price is not None:
-                    query = query.gte("price", filters.min_price)
-                if filters.max_price is not None:
-                    query = query.lte("price", filters.max_price)
-                if filters.bedrooms is not None:
-                    query = query.eq("bedrooms", filters.bedrooms)
-                if filters.bathrooms is not None:
-                    query = query.eq("bathrooms", filters.bathrooms)
-                if filters.property_type:
-                    query = query.eq("property_type", filters.property_type)
-                if filters.city:
-                    query = query.ilike("city", f"%{filters.city}%")
-                if filters.state:
-                    query = query.ilike("state", f"%{filters.state}%")
-                if filters.amenities and len(filters.amenities) > 0:
-                    # Check if listing has all specified amenities
-                    query = query.contains("amenities", filters.amenities)
-                if filters.available_from:
-                    # Listing should be available from this date or later
-                    query = query.gte("available_from", filters.available_from.isoformat())
-
-            # Get total count for pagination
-            count_query = query
-            count_response = count_query.execute()
-            total_count = len(count_response.data) if count_response.data else 0
-
-            # Apply sorting
-            desc = sort_order.lower() == "desc"
-            query = query.order(sort_by, desc=desc)
-
-            # Apply pagination
-            offset = (page - 1) * page_size
-            query = query.range(offset, offset + page_size - 1)
-
-            listings_response = query.execute()
-
-            if not listings_response.data:
-                return HousingListResponse(
-                    listings=[], total=0, page=page, page_size=page_size, has_more=False
-                ).model_dump()
-
-            # Format listings
-            listings_list = []
-            for listing_data in listings_response.data:
-                user_info = self._format_user_profile_for_listing(listing_data.pop("profiles"))
-
-                # Check if current user liked this listing
-                is_liked = False
-                if current_user_id:
-                    like_check = (
-                        supabase.table("housing_likes")
-                        .select("id")
-                        .eq("listing_id", listing_data["id"])
-                        .eq("user_id", str(current_user_id))
-                        .execute()
-                    )
-                    is_liked = bool(like_check.data)
-
-                listings_list.append(
-                    self._format_listing_response(listing_data, user_info, is_liked)
-                )
-
-            has_more = (page * page_size) < total_count
-
-            return HousingListResponse(
-                listings=[HousingListingResponse(**listing) for listing in listings_list],
-                total=total_count,
-                page=page,
-                page_size=page_size,
-                has_more=has_more,
-            ).model_dump()
+        newest_page = self._newest_listings_page(
+            filters, sort_by, sort_order, current_user_id, page, page_size
+        )
+        if newest_page is not None:
+            return newest_page
+
+        # Base query for active listings with user and university info;
+        # the total comes back with the page instead of a second query
+        query = (
+            supabase.table("housing_listings")
+            .select(LISTING_COLUMNS, count="exact")
+            .eq("is_active", True)
+        )
 
-        except Exception as e:
-            raise Exception(f"Error fetching listings: {e}")
+        # Apply filters
+        if filters:
+            if filters.min_price is not None:
+                query = query.gte("price", filters.min_price)
+            if filters.max_price is not None:
+                query = query.lte("price", filters.max_price)
+            if filters.bedrooms is not None:
+                query = query.eq("bedrooms", filters.bedrooms)
+            if filters.bathrooms is not None:
+                query = query.eq("bathrooms", filters.bathrooms)
+            if filters.property_type:
+                query = query.eq("property_type", filters.property_type)
+            if filters.city:
+                query = query.ilike("city", f"%{filters.city}%")
+            if filters.state:
+                query = query.ilike("state", f"%{filters.state}%")
+            if filters.amenities and len(filters.amenities) > 0:
+                # Check if listing has all specified amenities
+                query = query.contains("amenities", filters.amenities)
+            if filters.available_from:
+                # Listing should be available from this date or later
+                query = query.gte("available_from", filters.available_from.isoformat())
+
+        # Apply sorting
+        desc = sort_order.lower() == "desc"
+        query = query.order(sort_by, desc=desc)
+
+        # Apply pagination
+        offset = (page - 1) * page_size
+        query = query.range(offset, offset + page_size - 1)
+
+        listings_response = query.execute()
+        total_count = listings_response.count or 0
+
+        listings_list = self._format_listings(listings_response.data or [], current_user_id)
+        has_more = (page * page_size) < total_count
+
+        return self._listing_page(listings_list, total_count, page, page_size, has_more)
 
     async def get_listing_by_id(
         self, listing_id: UUID, current_user_id: Optional[UUID] = None, increment_views: bool = True
@@ -346,6 +389,10 @@ class HousingService:
         """
         Get a single listing by its ID.
 
+        Active listing rows are cached in memory for a minute. Views are
+        counted in memory and written in bulk by flush_pending_views; the
+        returned view_count includes views not flushed yet.
+
         Args:
             listing_id: The ID of the listing to retrieve.
             current_user_id: The ID of the current authenticated user (optional).
@@ -358,14 +405,11 @@ class HousingService:
             ListingNotFoundError: If the listing is not found or not active.
             Exception: For other database errors.
         """
-        try:
+        cached = _listing_cache.get(str(listing_id))
+        if cached is None:
             response = (
                 supabase.table("housing_listings")
-                .select(
-                    "*, profiles!housing_listings_user_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
+                .select(LISTING_COLUMNS)
                 .eq("id", str(listing_id))
                 .eq("is_active", True)
                 .execute()
@@ -374,35 +418,31 @@ class HousingService:
             if not response.data:
                 raise ListingNotFoundError(f"Listing with ID {listing_id} not found or not active.")
 
-            listing_data = response.data[0]
-
-            # Increment view count if requested
-            if increment_views:
-                supabase.table("housing_listings").update(
-                    {"view_count": listing_data["view_count"] + 1}
-                ).eq("id", str(listing_id)).execute()
-                listing_data["view_count"] += 1
-
-            user_info = self._format_user_profile_for_listing(listing_data.pop("profiles"))
-
-            # Check if current user liked this listing
-            is_liked = False
-            if current_user_id:
-                like_check = (
-                    supabase.table("housing_likes")
-                    .select("id")
-                    .eq("listing_id", listing_data["id"])
-                    .eq("user_id", str(current_user_id))
-                    .execute()
-                )
-                is_liked = bool(like_check.data)
+            cached = _listing_cache[str(listing_id)] = response.data[0]
 
-            return self._format_listing_response(listing_data, user_info, is_liked)
+        # Formatting pops the profile, so work on a copy of the cached row
+        listing_data = dict(cached)
 
-        except ListingNotFoundError:
-            raise
-        except Exception as e:
-            raise Exception(f"Error fetching listing {listing_id}: {e}")
+        # Count the view; it reaches the database with the next flush
+        if increment_views:
+            _pending_views[str(listing_id)] += 1
+        listing_data["view_count"] += _pending_views.get(str(listing_id), 0)
+
+        user_info = self._format_user_profile_for_listing(listing_data.pop("profiles"))
+
+        # Check if current user liked this listing
+        is_liked = False
+        if current_user_id:
+            like_check = (
+                supabase.table("housing_likes")
+                .select("id")
+                .eq("listing_id", listing_data["id"])
+                .eq("user_id", str(current_user_id))
+                .execute()
+            )
+            is_liked = bool(like_check.data)
+
+        return self._format_listing_response(listing_data, user_info, is_liked)
 
     async def get_user_listings(
         self,
@@ -428,71 +468,30 @@ class HousingService:
         Raises:
             Exception: For database errors.
         """
-        try:
-            # Base query for user's listings with user and university info
-            query = (
-                supabase.table("housing_listings")
-                .select(
-                    "*, profiles!housing_listings_user_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .eq("user_id", str(user_id))
-            )
+        # Base query for user's listings with user and university info;
+        # the total comes back with the page instead of a second query
+        query = (
+            supabase.table("housing_listings")
+            .select(LISTING_COLUMNS, count="exact")
+            .eq("user_id", str(user_id))
+        )
 
-            # Only show inactive listings if user is viewing their own
-            if not include_inactive or (current_user_id and current_user_id != user_id):
-                query = query.eq("is_active", True)
-
-            # Get total count
-            count_response = query.execute()
-            total_count = len(count_response.data) if count_response.data else 0
-
-            # Apply sorting and pagination
-            query = query.order("created_at", desc=True)
-            offset = (page - 1) * page_size
-            query = query.range(offset, offset + page_size - 1)
-
-            listings_response = query.execute()
-
-            if not listings_response.data:
-                return HousingListResponse(
-                    listings=[], total=0, page=page, page_size=page_size, has_more=False
-                ).model_dump()
-
-            # Format listings
-            listings_list = []
-            for listing_data in listings_response.data:
-                user_info = self._format_user_profile_for_listing(listing_data.pop("profiles"))
-
-                # Check if current user liked this listing
-                is_liked = False
-                if current_user_id:
-                    like_check = (
-                        supabase.table("housing_likes")
-                        .select("id")
-                        .eq("listing_id", listing_data["id"])
-                        .eq("user_id", str(current_user_id))
-                        .execute()
-                    )
-                    is_liked = bool(like_check.data)
+        # Only show inactive listings if user is viewing their own
+        if not (include_inactive and current_user_id == user_id):
+            query = query.eq("is_active", True)
 
-                listings_list.append(
-                    self._format_listing_response(listing_data, user_info, is_liked)
-                )
+        # Apply sorting and pagination
+        query = query.order("created_at", desc=True)
+        offset = (page - 1) * page_size
+        query = query.range(offset, offset + page_size - 1)
 
-            has_more = (page * page_size) < total_count
+        listings_response = query.execute()
+        total_count = listings_response.count or 0
 
-            return HousingListResponse(
-                listings=[HousingListingResponse(**listing) for listing in listings_list],
-                total=total_count,
-                page=page,
-                page_size=page_size,
-                has_more=has_more,
-            ).model_dump()
+        listings_list = self._format_listings(listings_response.data or [], current_user_id)
+        has_more = (page * page_size) < total_count
 
-        except Exception as e:
-            raise Exception(f"Error fetching listings for user {user_id}: {e}")
+        return self._listing_page(listings_list, total_count, page, page_size, has_more)
 
     async def update_listing(
         self, listing_id: UUID, user_id: UUID, update_data: HousingListingUpdate
@@ -514,66 +513,58 @@ class HousingService:
             ValidationError: If update data is invalid.
             Exception: For other database errors.
         """
-        try:
-            # Check if listing exists and belongs to user
-            existing_listing_response = (
-                supabase.table("housing_listings")
-                .select("user_id")
-                .eq("id", str(listing_id))
-                .execute()
-            )
-
-            if not existing_listing_response.data:
-                raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
+        # Check if listing exists and belongs to user
+        existing_listing_response = (
+            supabase.table("housing_listings").select("user_id").eq("id", str(listing_id)).execute()
+        )
 
-            if existing_listing_response.data[0]["user_id"] != str(user_id):
-                raise UnauthorizedError("You are not authorized to update this listing.")
+        if not existing_listing_response.data:
+            raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
 
-            # Prepare update payload, excluding None values
-            update_payload = {}
-            for field, value in update_data.model_dump(exclude_unset=True).items():
-                if value is not None:
-                    # Convert date objects to ISO format strings
-                    if field in ["available_from", "available_until"] and value:
-                        update_payload[field] = value.isoformat()
-                    else:
-                        update_payload[field] = value
+        if existing_listing_response.data[0]["user_id"] != str(user_id):
+            raise UnauthorizedError("You are not authorized to update this listing.")
 
-            if not update_payload:
-                raise ValidationError("No valid fields provided for update.")
+        # Prepare update payload, excluding None values
+        update_payload = {}
+        for field, value in update_data.model_dump(exclude_unset=True).items():
+            if value is not None:
+                # Convert date objects to ISO format strings
+                if field in ["available_from", "available_until"] and value:
+                    update_payload[field] = value.isoformat()
+                else:
+                    update_payload[field] = value
 
-            response = (
-                supabase.table("housing_listings")
-                .update(update_payload)
-                .eq("id", str(listing_id))
-                .execute()
-            )
+        if not update_payload:
+            raise ValidationError("No valid fields provided for update.")
 
-            if not response.data:
-                raise ValidationError("Failed to update listing: No data returned.")
+        response = (
+            supabase.table("housing_listings")
+            .update(update_payload)
+            .eq("id", str(listing_id))
+            .execute()
+        )
 
-            updated_listing = response.data[0]
+        if not response.data:
+            raise ValidationError("Failed to update listing: No data returned.")
 
-            # Fetch user info for the response
-            user_info = await self._get_user_profile_for_listing(user_id)
+        updated_listing = response.data[0]
 
-            # Check like status
-            is_liked = False
-            like_check = (
-                supabase.table("housing_likes")
-                .select("id")
-                .eq("listing_id", updated_listing["id"])
-                .eq("user_id", str(user_id))
-                .execute()
-            )
-            is_liked = bool(like_check.data)
+        # Fetch user info for the response
+        user_info = await self._get_user_profile_for_listing(user_id)
 
-            return self._format_listing_response(updated_listing, user_info, is_liked)
+        # Check like status
+        is_liked = False
+        like_check = (
+            supabase.table("housing_likes")
+            .select("id")
+            .eq("listing_id", updated_listing["id"])
+            .eq("user_id", str(user_id))
+            .execute()
+        )
+        is_liked = bool(like_check.data)
 
-        except (ListingNotFoundError, UnauthorizedError, ValidationError):
-            raise
-        except Exception as e:
-            raise Exception(f"Error updating listing {listing_id}: {e}")
+        await self._invalidate_listings_cache(listing_id, owner_id=user_id)
+        return self._format_listing_response(updated_listing, user_info, is_liked)
 
     async def delete_listing(self, listing_id: UUID, user_id: UUID) -> bool:
         """
@@ -591,38 +582,9 @@ class HousingService:
             UnauthorizedError: If the user does not own the listing.
             Exception: For other database errors.
         """
-        try:
-            # Check if listing exists and belongs to user
-            existing_listing_response = (
-                supabase.table("housing_listings")
-                .select("user_id")
-                .eq("id", str(listing_id))
-                .execute()
-            )
-
-            if not existing_listing_response.data:
-                raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
-
-            if existing_listing_response.data[0]["user_id"] != str(user_id):
-                raise UnauthorizedError("You are not authorized to delete this listing.")
-
-            # Soft delete: set is_active = False
-            response = (
-                supabase.table("housing_listings")
-                .update({"is_active": False})
-                .eq("id", str(listing_id))
-                .execute()
-            )
-
-            if not response.data:
-                raise Exception("Failed to delete listing: No data returned.")
-
-            return True
-
-        except (ListingNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise Exception(f"Error deleting listing {listing_id}: {e}")
+        # Soft delete: set is_active = False
+        await self._set_listing_active(listing_id, user_id, False, "delete")
+        return True
 
     async def activate_listing(self, listing_id: UUID, user_id: UUID) -> Dict[str, Any]:
         """
@@ -640,46 +602,9 @@ class HousingService:
             UnauthorizedError: If the user does not own the listing.
             Exception: For other database errors.
         """
-        try:
-            # Check if listing exists and belongs to user
-            existing_listing_response = (
-                supabase.table("housing_listings")
-                .select("user_id")
-                .eq("id", str(listing_id))
-                .execute()
-            )
-
-            if not existing_listing_response.data:
-                raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
-
-            if existing_listing_response.data[0]["user_id"] != str(user_id):
-                raise UnauthorizedError("You are not authorized to activate this listing.")
-
-            # Set is_active = True
-            response = (
-                supabase.table("housing_listings")
-                .update({"is_active": True})
-                .eq("id", str(listing_id))
-                .select(
-                    "*, profiles!housing_listings_user_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .execute()
-            )
-
-            if not response.data:
-                raise Exception("Failed to activate listing: No data returned.")
-
-            updated_listing = response.data[0]
-            user_info = self._format_user_profile_for_listing(updated_listing.pop("profiles"))
-
-            return self._format_listing_response(updated_listing, user_info, False)
-
-        except (ListingNotFoundError, UnauthorizedError):
-            raise
-        except Exception as e:
-            raise Exception(f"Error activating listing {listing_id}: {e}")
+        updated_listing = await self._set_listing_active(listing_id, user_id, True, "activate")
+        user_info = self._format_user_profile_for_listing(updated_listing.pop("profiles"))
+        return self._format_listing_response(updated_listing, user_info, False)
 
     async def deactivate_listing(self, listing_id: UUID, user_id: UUID) -> Dict[str, Any]:
         """
@@ -697,7 +622,9 @@ class HousingService:
             UnauthorizedError: If the user does not own the listing.
             Exception: For other database errors.
         """
-        return await self.delete_listing(listing_id, user_id)
+        updated_listing = await self._set_listing_active(listing_id, user_id, False, "deactivate")
+        user_info = self._format_user_profile_for_listing(updated_listing.pop("profiles"))
+        return self._format_listing_response(updated_listing, user_info, False)
 
     async def like_listing(self, listing_id: UUID, user_id: UUID) -> Dict[str, Any]:
         """
@@ -714,80 +641,65 @@ class HousingService:
             ListingNotFoundError: If the listing does not exist or is not active.
             Exception: For other database errors.
         """
-        try:
-            # Check if listing exists and is active
-            listing_check = (
-                supabase.table("housing_listings")
-                .select("id, is_active")
-                .eq("id", str(listing_id))
-                .execute()
-            )
-
-            if not listing_check.data:
-                raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
-
-            if not listing_check.data[0]["is_active"]:
-                raise ListingNotFoundError(f"Listing with ID {listing_id} is not active.")
-
-            # Check if already liked
-            existing_like_response = (
-                supabase.table("housing_likes")
-                .select("*")
-                .eq("listing_id", str(listing_id))
-                .eq("user_id", str(user_id))
-                .execute()
-            )
-
-            if existing_like_response.data:
-                # Return existing like
-                existing_like = existing_like_response.data[0]
-                user_info = await self._get_user_profile_for_like(user_id)
-                return HousingLikeResponse(
-                    id=UUID(existing_like["id"]),
-                    listing_id=UUID(existing_like["listing_id"]),
-                    user_id=UUID(existing_like["user_id"]),
-                    created_at=datetime.fromisoformat(existing_like["created_at"]),
-                    user=user_info,
-                ).model_dump()
+        # Check if listing exists and is active
+        listing_check = (
+            supabase.table("housing_listings")
+            .select("id, user_id, is_active")
+            .eq("id", str(listing_id))
+            .execute()
+        )
 
-            # Insert new like
-            like_to_insert = {
-                "listing_id": str(listing_id),
-                "user_id": str(user_id),
-            }
-            response = supabase.table("housing_likes").insert(like_to_insert).execute()
+        if not listing_check.data:
+            raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
 
-            if not response.data:
-                raise Exception("Failed to like listing: No data returned.")
+        if not listing_check.data[0]["is_active"]:
+            raise ListingNotFoundError(f"Listing with ID {listing_id} is not active.")
 
-            # Get current like count and increment it
-            current_listing = (
-                supabase.table("housing_listings")
-                .select("like_count")
-                .eq("id", str(listing_id))
-                .execute()
-            )
-            if current_listing.data:
-                current_count = current_listing.data[0].get("like_count", 0)
-                supabase.table("housing_listings").update({"like_count": current_count + 1}).eq(
-                    "id", str(listing_id)
-                ).execute()
+        # Check if already liked
+        existing_like_response = (
+            supabase.table("housing_likes")
+            .select("*")
+            .eq("listing_id", str(listing_id))
+            .eq("user_id", str(user_id))
+            .execute()
+        )
 
-            created_like = response.data[0]
+        if existing_like_response.data:
+            # Return existing like
+            existing_like = existing_like_response.data[0]
             user_info = await self._get_user_profile_for_like(user_id)
-
             return HousingLikeResponse(
-                id=UUID(created_like["id"]),
-                listing_id=UUID(created_like["listing_id"]),
-                user_id=UUID(created_like["user_id"]),
-                created_at=datetime.fromisoformat(created_like["created_at"]),
+                id=UUID(existing_like["id"]),
+                listing_id=UUID(existing_like["listing_id"]),
+                user_id=UUID(existing_like["user_id"]),
+                created_at=datetime.fromisoformat(existing_like["created_at"]),
                 user=user_info,
             ).model_dump()
 
-        except ListingNotFoundError:
-            raise
-        except Exception as e:
-            raise Exception(f"Error liking listing {listing_id}: {e}")
+        # Insert new like; housing_listings.like_count is maintained by a trigger
+        like_to_insert = {
+            "listing_id": str(listing_id),
+            "user_id": str(user_id),
+        }
+        response = supabase.table("housing_likes").insert(like_to_insert).execute()
+
+        if not response.data:
+            raise Exception("Failed to like listing: No data returned.")
+
+        await self._invalidate_listings_cache(
+            listing_id, owner_id=UUID(listing_check.data[0]["user_id"]), likes_only=True
+        )
+
+        created_like = response.data[0]
+        user_info = await self._get_user_profile_for_like(user_id)
+
+        return HousingLikeResponse(
+            id=UUID(created_like["id"]),
+            listing_id=UUID(created_like["listing_id"]),
+            user_id=UUID(created_like["user_id"]),
+            created_at=datetime.fromisoformat(created_like["created_at"]),
+            user=user_info,
+        ).model_dump()
 
     async def unlike_listing(self, listing_id: UUID, user_id: UUID) -> bool:
         """
@@ -803,34 +715,32 @@ class HousingService:
         Raises:
             Exception: For database errors.
         """
-        try:
-            # Delete the like entry
-            (
-                supabase.table("housing_likes")
-                .delete()
-                .eq("listing_id", str(listing_id))
-                .eq("user_id", str(user_id))
-                .execute()
-            )
+        # Delete the like; housing_listings.like_count is decremented by a trigger
+        deleted = (
+            supabase.table("housing_likes")
+            .delete()
+            .eq("listing_id", str(listing_id))
+            .eq("user_id", str(user_id))
+            .execute()
+        )
 
-            # Get current like count and decrement it (ensure it doesn't go below 0)
-            current_listing = (
-                supabase.table("housing_listings")
-                .select("like_count")
-                .eq("id", str(listing_id))
-                .execute()
+        # Only invalidate if a like was actually removed
+        if deleted.data:
+            await self._invalidate_listings_cache(
+                listing_id, owner_id=self._listing_owner_id(listing_id), likes_only=True
             )
-            if current_listing.data:
-                current_count = current_listing.data[0].get("like_count", 0)
-                new_count = max(0, current_count - 1)  # Ensure it doesn't go negative
-                supabase.table("housing_listings").update({"like_count": new_count}).eq(
-                    "id", str(listing_id)
-                ).execute()
+        return True
 
-            return True
+    def _listing_owner_id(self, listing_id: UUID) -> Optional[UUID]:
+        """Return a listing's owner ID, from the listing cache when it is there."""
+        cached = _listing_cache.get(str(listing_id))
+        if cached is not None:
+            return UUID(cached["user_id"])
 
-        except Exception as e:
-            raise Exception(f"Error unliking listing {listing_id}: {e}")
+        response = (
+            supabase.table("housing_listings").select("user_id").eq("id", str(listing_id)).execute()
+        )
+        return UUID(response.data[0]["user_id"]) if response.data else None
 
     async def get_listing_likes(
         self, listing_id: UUID, page: int = 1, page_size: int = 50
@@ -851,84 +761,56 @@ class HousingService:
             ListingNotFoundError: If the listing does not exist.
             Exception: For other database errors.
         """
-        try:
-            # Check if listing exists
-            listing_check = (
-                supabase.table("housing_listings").select("id").eq("id", str(listing_id)).execute()
-            )
-
-            if not listing_check.data:
-                raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
+        # One query, no COUNT: the listing's trigger-maintained like_count is
+        # the total, and one extra embedded like tells whether another page exists
+        offset = (page - 1) * page_size
+        response = (
+            supabase.table("housing_listings")
+            .select(f"like_count, housing_likes({HOUSING_LIKE_COLUMNS})")
+            .eq("id", str(listing_id))
+            .order("created_at", desc=True, foreign_table="housing_likes")
+            .range(offset, offset + page_size, foreign_table="housing_likes")
+            .execute()
+        )
 
-            # Query likes with user profile information
-            likes_query = (
-                supabase.table("housing_likes")
-                .select(
-                    "*, profiles!housing_likes_user_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
+        if not response.data:
+            raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
+
+        total_count = response.data[0].get("like_count") or 0
+        rows = response.data[0].get("housing_likes") or []
+        has_more = len(rows) > page_size
+
+        # Format likes
+        likes_list = []
+        for like_data in rows[:page_size]:
+            profile_data = like_data.pop("profiles")
+            user_info = {
+                "id": UUID(profile_data["id"]),
+                "full_name": profile_data["full_name"],
+                "profile_picture_url": profile_data["profile_picture_url"],
+                "university_name": (
+                    profile_data["universities"]["name"]
+                    if profile_data.get("universities")
+                    else None
+                ),
+            }
+            likes_list.append(
+                HousingLikeResponse(
+                    id=UUID(like_data["id"]),
+                    listing_id=UUID(like_data["listing_id"]),
+                    user_id=UUID(like_data["user_id"]),
+                    created_at=datetime.fromisoformat(like_data["created_at"]),
+                    user=user_info,
                 )
-                .eq("listing_id", str(listing_id))
-                .order("created_at", desc=True)
             )
 
-            # Get total count
-            count_response = likes_query.execute()
-            total_count = len(count_response.data) if count_response.data else 0
-
-            # Apply pagination
-            offset = (page - 1) * page_size
-            likes_query = likes_query.range(offset, offset + page_size - 1)
-
-            likes_response = likes_query.execute()
-
-            if not likes_response.data:
-                return {
-                    "likes": [],
-                    "total": 0,
-                    "page": page,
-                    "page_size": page_size,
-                    "has_more": False,
-                }
-
-            # Format likes
-            likes_list = []
-            for like_data in likes_response.data:
-                profile_data = like_data.pop("profiles")
-                user_info = {
-                    "id": UUID(profile_data["id"]),
-                    "full_name": profile_data["full_name"],
-                    "profile_picture_url": profile_data["profile_picture_url"],
-                    "university_name": (
-                        profile_data["universities"]["name"]
-                        if profile_data.get("universities")
-                        else None
-                    ),
-                }
-                likes_list.append(
-                    HousingLikeResponse(
-                        id=UUID(like_data["id"]),
-                        listing_id=UUID(like_data["listing_id"]),
-                        user_id=UUID(like_data["user_id"]),
-                        created_at=datetime.fromisoformat(like_data["created_at"]),
-                        user=user_info,
-                    )
-                )
-
-            has_more = (page * page_size) < total_count
-
-            return {
-                "likes": [like.model_dump() for like in likes_list],
-                "total": total_count,
-                "page": page,
-                "page_size": page_size,
-                "has_more": has_more,
-            }
-
-        except ListingNotFoundError:
-            raise
-        except Exception as e:
-            raise Exception(f"Error fetching likes for listing {listing_id}: {e}")
+        return {
+            "likes": [like.model_dump() for like in likes_list],
+            "total": total_count,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+        }
 
     async def search_by_location(
         self, query: str, current_user_id: Optional[UUID] = None, page: int = 1, page_size: int = 20
@@ -948,81 +830,481 @@ class HousingService:
         Raises:
             Exception: For database errors.
         """
+        # Match city, state or address as a substring (case-insensitive) in the
+        # database; location_search is indexed for this (migration 013)
+        pattern = re.sub(r"([\\%_])", r"\\\1", query.lower())
+        offset = (page - 1) * page_size
+        listings_response = (
+            supabase.table("housing_listings")
+            .select(LISTING_COLUMNS, count="exact")
+            .eq("is_active", True)
+            .ilike("location_search", f"%{pattern}%")
+            .order("created_at", desc=True)
+            .range(offset, offset + page_size - 1)
+            .execute()
+        )
+        total_count = listings_response.count or 0
+
+        listings_list = self._format_listings(listings_response.data or [], current_user_id)
+        has_more = (page * page_size) < total_count
+
+        return self._listing_page(listings_list, total_count, page, page_size, has_more)
+
+    async def get_listings_json(
+        self,
+        filters: Optional[HousingSearchFilters] = None,
+        current_user_id: Optional[UUID] = None,
+        page: int = 1,
+        page_size: int = 20,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+    ) -> Tuple[bytes, bool]:
+        """
+        Get a page of listings serialized as HousingListResponse JSON, cached in Redis.
+
+        See get_listings for the arguments.
+
+        Returns:
+            Tuple of (JSON body, whether it was served from the cache)
+        """
+        # The default view is answered from memory, ahead of Redis
+        newest_page = self._newest_listings_page(
+            filters, sort_by, sort_order, current_user_id, page, page_size
+        )
+        if newest_page is not None:
+            return orjson.dumps(newest_page), True
+
+        params = (
+            filters.model_dump_json() if filters else None,
+            current_user_id,
+            page,
+            page_size,
+            sort_by,
+            sort_order,
+        )
+        return await self._cached_json(
+            "listings",
+            params,
+            lambda: self.get_listings(
+                filters=filters,
+                current_user_id=current_user_id,
+                page=page,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            ),
+        )
+
+    async def search_by_location_json(
+        self, query: str, current_user_id: Optional[UUID] = None, page: int = 1, page_size: int = 20
+    ) -> Tuple[bytes, bool]:
+        """
+        Search listings by location, serialized as HousingListResponse JSON and cached in Redis.
+
+        See search_by_location for the arguments.
+
+        Returns:
+            Tuple of (JSON body, whether it was served from the cache)
+        """
+        return await self._cached_json(
+            "search",
+            (query.lower(), current_user_id, page, page_size),
+            lambda: self.search_by_location(
+                query=query, current_user_id=current_user_id, page=page, page_size=page_size
+            ),
+        )
+
+    async def get_user_listings_json(
+        self,
+        user_id: UUID,
+        current_user_id: Optional[UUID] = None,
+        page: int = 1,
+        page_size: int = 20,
+        include_inactive: bool = False,
+    ) -> Tuple[bytes, bool]:
+        """
+        Get a user's listings serialized as HousingListResponse JSON, cached in Redis.
+
+        Pages seen anonymously or by the owner are also kept in memory for a
+        minute, ahead of Redis.
+
+        See get_user_listings for the arguments.
+
+        Returns:
+            Tuple of (JSON body, whether it was served from the cache)
+        """
+        local_key = None
+        if current_user_id is None or current_user_id == user_id:
+            local_key = (current_user_id is not None, page, page_size, include_inactive)
+            owner_pages = _user_listings_cache.get(str(user_id))
+            if owner_pages is not None and local_key in owner_pages:
+                return owner_pages[local_key], True
+
+        body, cache_hit = await self._cached_json(
+            "user",
+            (user_id, current_user_id, page, page_size, include_inactive),
+            lambda: self.get_user_listings(
+                user_id=user_id,
+                current_user_id=current_user_id,
+                page=page,
+                page_size=page_size,
+                include_inactive=include_inactive,
+            ),
+        )
+
+        if local_key is not None:
+            _user_listings_cache.setdefault(str(user_id), {})[local_key] = body
+        return body, cache_hit
+
+    async def get_listing_likes_json(
+        self, listing_id: UUID, page: int = 1, page_size: int = 50
+    ) -> Tuple[bytes, bool]:
+        """
+        Get a page of a listing's likes serialized as JSON, cached in Redis.
+
+        See get_listing_likes for the arguments.
+
+        Returns:
+            Tuple of (JSON body, whether it was served from the cache)
+
+        Raises:
+            ListingNotFoundError: If the listing doesn't exist
+        """
+        return await self._cached_json(
+            "likes",
+            (listing_id, page, page_size),
+            lambda: self.get_listing_likes(listing_id=listing_id, page=page, page_size=page_size),
+        )
+
+    async def refresh_newest_listings(self) -> None:
+        """
+        Rebuild the in-memory snapshot of the newest NEWEST_LISTINGS_LIMIT active listings.
+
+        The snapshot holds listings formatted for an anonymous viewer plus the
+        total active count; get_listings serves the default view from it.
+        """
+        global _newest_listings
+
+        response = await run_in_threadpool(
+            supabase.table("housing_listings")
+            .select(LISTING_COLUMNS, count="exact")
+            .eq("is_active", True)
+            .order("created_at", desc=True)
+            .range(0, NEWEST_LISTINGS_LIMIT - 1)
+            .execute
+        )
+        listings = self._format_listings(response.data or [])
+        _newest_listings = {
+            "listings": _listing_list_adapter.dump_python(
+                _listing_list_adapter.validate_python(listings)
+            ),
+            "total": response.count or 0,
+        }
+
+    async def run_newest_listings_refresher(
+        self, interval: float = NEWEST_LISTINGS_REFRESH
+    ) -> None:
+        """Refresh the newest-listings snapshot every `interval` seconds until cancelled."""
+        while True:
+            try:
+                await self.refresh_newest_listings()
+            except Exception as e:
+                logger.warning("Newest listings refresh failed: %s", e)
+            await asyncio.sleep(interval)
+
+    async def flush_pending_views(self) -> int:
+        """
+        Write the views counted since the last flush in one database call.
+
+        The counter is swapped out before the write; if the write fails, the
+        counts are merged back so the next flush retries them.
+
+        Returns:
+            int: Number of listings whose view count was updated
+        """
+        global _pending_views
+        if not _pending_views:
+            return 0
+
+        pending, _pending_views = _pending_views, Counter()
         try:
-            # Search in city, state, and address fields (case-insensitive)
-            f"%{query}%"
+            await run_in_threadpool(
+                supabase.rpc(
+                    "increment_listing_views",
+                    {"listing_ids": list(pending), "deltas": list(pending.values())},
+                ).execute
+            )
+        except Exception:
+            _pending_views.update(pending)
+            raise
 
-            # We need to use OR logic, so we'll fetch all active listings first
-            # and then filter in Python (Supabase doesn't support OR in select)
-            listings_response = (
-                supabase.table("housing_listings")
-                .select(
-                    "*, profiles!housing_listings_user_id_fkey("
-                    "id, full_name, profile_picture_url, universities(name)"
-                    ")"
-                )
-                .eq("is_active", True)
-                .execute()
+        # Move the flushed views into the cached rows, which hold the old count
+        for listing_id, delta in pending.items():
+            cached = _listing_cache.get(listing_id)
+            if cached is not None:
+                cached["view_count"] += delta
+
+        return len(pending)
+
+    async def run_view_flusher(self, interval: float = VIEW_FLUSH_INTERVAL) -> None:
+        """Flush counted views every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush_pending_views()
+            except Exception as e:
+                logger.warning("View count flush failed: %s", e)
+
+    # Helper methods
+
+    async def _set_listing_active(
+        self, listing_id: UUID, user_id: UUID, is_active: bool, action: str
+    ) -> Dict[str, Any]:
+        """
+        Set is_active on a listing the user owns and return the updated row.
+
+        Ownership is part of the UPDATE filter, so a successful call is one
+        round trip. The listing is looked up again only when nothing was
+        updated, to tell a missing listing from someone else's.
+
+        Args:
+            listing_id: The ID of the listing to update.
+            user_id: The ID of the user making the change.
+            is_active: The new active status.
+            action: Verb used in the authorization error (activate, deactivate, delete).
+
+        Returns:
+            The updated listing row with the owner profile embedded.
+
+        Raises:
+            ListingNotFoundError: If the listing is not found.
+            UnauthorizedError: If the user does not own the listing.
+        """
+        response = (
+            supabase.table("housing_listings")
+            .update({"is_active": is_active})
+            .eq("id", str(listing_id))
+            .eq("user_id", str(user_id))
+            .select(LISTING_COLUMNS)
+            .execute()
+        )
+
+        if not response.data:
+            existing = (
+                supabase.table("housing_listings").select("id").eq("id", str(listing_id)).execute()
             )
+            if not existing.data:
+                raise ListingNotFoundError(f"Listing with ID {listing_id} not found.")
+            raise UnauthorizedError(f"You are not authorized to {action} this listing.")
 
-            if not listings_response.data:
-                return HousingListResponse(
-                    listings=[], total=0, page=page, page_size=page_size, has_more=False
-                ).model_dump()
-
-            # Filter by location in Python
-            query_lower = query.lower()
-            filtered_listings = [
-                listing
-                for listing in listings_response.data
-                if (
-                    query_lower in listing["city"].lower()
-                    or query_lower in listing["state"].lower()
-                    or query_lower in listing["address"].lower()
-                )
+        await self._invalidate_listings_cache(listing_id, owner_id=user_id)
+        return response.data[0]
+
+    def _newest_listings_page(
+        self,
+        filters: Optional[HousingSearchFilters],
+        sort_by: str,
+        sort_order: str,
+        current_user_id: Optional[UUID],
+        page: int,
+        page_size: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Slice a default-view page (no filters, newest first) from the snapshot.
+
+        Returns:
+            Dict in the HousingListResponse shape, or None when the request is
+            not the default view, the page lies past the snapshot, or there is
+            no snapshot yet
+        """
+        snapshot = _newest_listings
+        if (
+            snapshot is None
+            or filters is not None
+            or sort_by != "created_at"
+            or sort_order.lower() != "desc"
+            or page * page_size > NEWEST_LISTINGS_LIMIT
+        ):
+            return None
+
+        offset = (page - 1) * page_size
+        listings = snapshot["listings"][offset : offset + page_size]
+
+        if current_user_id and listings:
+            liked_ids = self._liked_listing_ids(
+                [str(listing["id"]) for listing in listings], current_user_id
+            )
+            listings = [
+                {**listing, "is_liked_by_current_user": str(listing["id"]) in liked_ids}
+                for listing in listings
             ]
 
-            total_count = len(filtered_listings)
-
-            # Apply pagination
-            offset = (page - 1) * page_size
-            paginated_listings = filtered_listings[offset : offset + page_size]
-
-            # Format listings
-            listings_list = []
-            for listing_data in paginated_listings:
-                user_info = self._format_user_profile_for_listing(listing_data.pop("profiles"))
-
-                # Check if current user liked this listing
-                is_liked = False
-                if current_user_id:
-                    like_check = (
-                        supabase.table("housing_likes")
-                        .select("id")
-                        .eq("listing_id", listing_data["id"])
-                        .eq("user_id", str(current_user_id))
-                        .execute()
-                    )
-                    is_liked = bool(like_check.data)
+        total = snapshot["total"]
+        return {
+            "listings": listings,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": (page * page_size) < total,
+        }
 
-                listings_list.append(
-                    self._format_listing_response(listing_data, user_info, is_liked)
-                )
+    async def _cached_json(
+        self, scope: str, params: Tuple[Any, ...], fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Tuple[bytes, bool]:
+        """
+        Serve a read from the Redis cache, or run it and cache the serialized result.
 
-            has_more = (page * page_size) < total_count
+        The key hashes the scope, its parameters and the current listings
+        version, so any listing or like write makes every cached page stale.
+        Without Redis (or on a Redis error) the read always runs.
 
-            return HousingListResponse(
-                listings=[HousingListingResponse(**listing) for listing in listings_list],
-                total=total_count,
-                page=page,
-                page_size=page_size,
-                has_more=has_more,
-            ).model_dump()
+        Args:
+            scope: Name of the read (listings, search, user, likes)
+            params: Everything the result depends on, including the viewer
+            fetch: Runs the uncached read
+
+        Returns:
+            Tuple of (JSON body, whether it was served from the cache)
+        """
+        cache_key = None
+        if redis is not None:
+            try:
+                version = await redis.get(LISTINGS_VERSION_KEY)
+                digest = hashlib.blake2b(
+                    orjson.dumps(params, default=str), digest_size=16
+                ).hexdigest()
+                cache_key = f"housing:v1:{int(version or 0)}:{scope}:{digest}"
+                cached = await redis.get(cache_key)
+                if cached is not None:
+                    return cached, True
+            except Exception as e:
+                logger.warning("Listings cache read error: %s", e)
+
+        # Results are already JSON-ready dicts
+        body = orjson.dumps(await fetch())
+
+        if cache_key is not None:
+            try:
+                await redis.setex(cache_key, LISTINGS_CACHE_TTL, body)
+            except Exception as e:
+                logger.warning("Listings cache write error: %s", e)
+
+        return body, False
+
+    async def _invalidate_listings_cache(
+        self,
+        listing_id: Optional[UUID] = None,
+        owner_id: Optional[UUID] = None,
+        likes_only: bool = False,
+    ) -> None:
+        """
+        Drop every cached listing page after a listing or like write.
+
+        Listing writes also drop this process's newest-listings snapshot until
+        the next refresh. Like writes keep it: like status is looked up per
+        viewer, and like counts may lag by up to NEWEST_LISTINGS_REFRESH.
 
+        Args:
+            listing_id: ID of the listing written, evicted from the listing cache
+            owner_id: ID of the listing owner (or of the liked listing's owner),
+                evicted from the user-listings cache
+            likes_only: Whether only likes changed
+        """
+        global _newest_listings
+        if listing_id is not None:
+            _listing_cache.pop(str(listing_id), None)
+        if owner_id is not None:
+            _user_listings_cache.pop(str(owner_id), None)
+        if not likes_only:
+            _newest_listings = None
+
+        if redis is None:
+            return
+
+        try:
+            await redis.incr(LISTINGS_VERSION_KEY)
         except Exception as e:
-            raise Exception(f"Error searching listings by location: {e}")
+            logger.warning("Listings cache invalidation error: %s", e)
 
-    # Helper methods
+    def _liked_listing_ids(self, listing_ids: List[str], current_user_id: UUID) -> Set[str]:
+        """
+        Return which of the given listings the user has liked, in one query.
+
+        Args:
+            listing_ids: Listing IDs on the current page
+            current_user_id: ID of the viewing user
+
+        Returns:
+            Set of liked listing IDs
+        """
+        if not listing_ids:
+            return set()
+
+        response = (
+            supabase.table("housing_likes")
+            .select("listing_id")
+            .eq("user_id", str(current_user_id))
+            .in_("listing_id", listing_ids)
+            .execute()
+        )
+        return {like["listing_id"] for like in response.data or []}
+
+    def _listing_page(
+        self,
+        listings: List[Dict[str, Any]],
+        total: int,
+        page: int,
+        page_size: int,
+        has_more: bool,
+    ) -> Dict[str, Any]:
+        """
+        Validate a page of formatted listings and dump it as a HousingListResponse dict.
+
+        Args:
+            listings: Formatted listings for the page
+            total: Total number of matching listings
+            page: Current page number
+            page_size: Number of listings per page
+            has_more: Whether more listings are available
+
+        Returns:
+            Dict in the HousingListResponse shape
+        """
+        return {
+            "listings": _listing_list_adapter.dump_python(
+                _listing_list_adapter.validate_python(listings)
+            ),
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": has_more,
+        }
+
+    def _format_listings(
+        self, rows: List[Dict[str, Any]], current_user_id: Optional[UUID] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Format a page of listing rows, looking up like status for the whole page at once.
+
+        Args:
+            rows: Listing rows with the owner profile embedded
+            current_user_id: ID of the viewing user (for like status)
+
+        Returns:
+            List of formatted listings
+        """
+        liked_ids = set()
+        if current_user_id:
+            liked_ids = self._liked_listing_ids([row["id"] for row in rows], current_user_id)
+
+        return [
+            self._format_listing_response(
+                row,
+                self._format_user_profile_for_listing(row.pop("profiles")),
+                row["id"] in liked_ids,
+            )
+            for row in rows
+        ]
 
     async def _get_user_profile_for_listing(self, user_id: UUID) -> Dict[str, Any]:
         """Helper to fetch user profile for listing responses."""
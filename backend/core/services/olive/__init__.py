@@ -8,6 +8,7 @@ from backend.core.services.olive.olive_service import (
     ConversationNotFoundError,
     GroqAPIError,
     OliveService,
+    RateLimitError,
     UnauthorizedError,
     get_olive_service,
 )
@@ -18,4 +19,5 @@ __all__ = [
     "ConversationNotFoundError",
     "UnauthorizedError",
     "GroqAPIError",
+    "RateLimitError",
 ]
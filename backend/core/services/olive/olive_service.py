@@ -4,14 +4,22 @@ Olive AI service layer.
 Handles conversations with Groq LLM for the Olive AI assistant.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import orjson
 from groq import Groq
+from groq import RateLimitError as GroqRateLimitError
 
 from backend.config import settings
-from backend.db import supabase
+from backend.db import get_async_supabase_client, redis
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached conversations page stays valid (conversation writes also drop it)
+CONVERSATIONS_CACHE_TTL = 60
 
 
 class ConversationNotFoundError(Exception):
@@ -26,6 +34,10 @@ class GroqAPIError(Exception):
     """Raised when Groq API call fails."""
 
 
+class RateLimitError(GroqAPIError):
+    """Raised when Groq API rejects a call for exceeding its rate limit."""
+
+
 class OliveService:
     """
     Service for managing Olive AI conversations and interactions.
@@ -63,8 +75,9 @@ class OliveService:
         Send message to Olive AI and get response.
 
         Creates new conversation if conversation_id is None.
-        Saves both user and assistant messages to database.
-        Retrieves conversation history for context.
+        Retrieves the last 10 messages for context.
+        Saves the user message and the reply together once the reply arrives,
+        so a failed AI call leaves no unanswered message behind.
 
         Args:
             user_id: The user's ID.
@@ -82,99 +95,86 @@ class OliveService:
             Exception: For other errors.
         """
         try:
-            # Step 1: Get or create conversation
+            # Step 1: Get or create conversation, with the recent history in
+            # the same round trip for an existing one
             if conversation_id is None:
-                # Create new conversation
-                conv_response = (
-                    supabase.table("olive_conversations")
-                    .insert({"user_id": str(user_id)})
+                # Create new conversation, titled from its first message
+                title = await self._generate_title_from_message(message)
+                conv_response = await (
+                    get_async_supabase_client()
+                    .table("olive_conversations")
+                    .insert({"user_id": str(user_id), "title": title})
                     .execute()
                 )
 
                 if not conv_response.data:
                     raise Exception("Failed to create conversation")
 
-                conversation = conv_response.data[0]
-                conversation_id = UUID(conversation["id"])
-                is_new_conversation = True
+                conversation_id = UUID(conv_response.data[0]["id"])
+                history = []
             else:
-                # Verify conversation exists and belongs to user
-                conv_check = (
-                    supabase.table("olive_conversations")
-                    .select("*")
+                # Verify conversation exists and belongs to user, embedding the
+                # last 10 messages for context
+                conv_check = await (
+                    get_async_supabase_client()
+                    .table("olive_conversations")
+                    .select("id, olive_messages(role, content, created_at)")
                     .eq("id", str(conversation_id))
                     .eq("user_id", str(user_id))
+                    .order("created_at", desc=True, foreign_table="olive_messages")
+                    .limit(10, foreign_table="olive_messages")
                     .execute()
                 )
 
                 if not conv_check.data:
                     raise UnauthorizedError("Conversation not found or unauthorized")
 
-                is_new_conversation = False
-
-            # Step 2: Save user message
-            user_msg_response = (
-                supabase.table("olive_messages")
-                .insert(
-                    {"conversation_id": str(conversation_id), "role": "user", "content": message}
-                )
-                .execute()
-            )
-
-            if not user_msg_response.data:
-                raise Exception("Failed to save user message")
+                history = conv_check.data[0]["olive_messages"][::-1]
 
-            user_message = user_msg_response.data[0]
-
-            # Step 3: Get conversation history (last 10 messages for context)
-            history_response = (
-                supabase.table("olive_messages")
-                .select("role, content")
-                .eq("conversation_id", str(conversation_id))
-                .order("created_at", desc=False)
-                .limit(10)
-                .execute()
-            )
-
-            # Step 4: Build messages for Groq
+            # Step 2: Build messages for Groq
             messages = [{"role": "system", "content": system_prompt or self.default_system_prompt}]
-
-            # Add history (excluding the just-added user message to avoid duplication)
-            for msg in history_response.data[:-1]:  # Exclude last message (just added)
+            for msg in history:
                 messages.append({"role": msg["role"], "content": msg["content"]})
 
             # Add the current message
+            user_sent_at = datetime.now(timezone.utc)
             messages.append({"role": "user", "content": message})
 
-            # Step 5: Call Groq API
+            # Step 3: Call Groq API
             assistant_response = await self._call_groq_api(messages)
 
-            # Step 6: Save assistant message
-            assistant_msg_response = (
-                supabase.table("olive_messages")
+            # Step 4: Save both messages in one insert; explicit timestamps keep
+            # the user message ordered before the reply
+            messages_response = await (
+                get_async_supabase_client()
+                .table("olive_messages")
                 .insert(
-                    {
-                        "conversation_id": str(conversation_id),
-                        "role": "assistant",
-                        "content": assistant_response,
-                    }
+                    [
+                        {
+                            "conversation_id": str(conversation_id),
+                            "role": "user",
+                            "content": message,
+                            "created_at": user_sent_at.isoformat(),
+                        },
+                        {
+                            "conversation_id": str(conversation_id),
+                            "role": "assistant",
+                            "content": assistant_response,
+                            "created_at": datetime.now(timezone.utc).isoformat(),
+                        },
+                    ]
                 )
                 .execute()
             )
 
-            if not assistant_msg_response.data:
-                raise Exception("Failed to save assistant message")
+            saved = {row["role"]: row for row in messages_response.data or []}
+            if len(saved) != 2:
+                raise Exception("Failed to save chat messages")
 
-            assistant_message = assistant_msg_response.data[0]
+            user_message = saved["user"]
+            assistant_message = saved["assistant"]
 
-            # Step 7: Generate and save title for new conversations
-            if is_new_conversation:
-                title = await self._generate_title_from_message(message)
-                supabase.table("olive_conversations").update({"title": title}).eq(
-                    "id", str(conversation_id)
-                ).execute()
-
-            # Step 8: Return both messages
+            # Step 5: Return both messages
             return {
                 "conversation_id": conversation_id,
                 "user_message": user_message,
@@ -185,6 +185,9 @@ class OliveService:
             raise
         except Exception as e:
             raise Exception(f"Chat error: {str(e)}")
+        finally:
+            # A new conversation is listed even when the reply fails
+            await self._invalidate_conversations_cache(user_id)
 
     async def create_conversation(
         self, user_id: UUID, title: Optional[str] = None
@@ -207,12 +210,15 @@ class OliveService:
             if title:
                 conv_data["title"] = title
 
-            response = supabase.table("olive_conversations").insert(conv_data).execute()
+            response = await (
+                get_async_supabase_client().table("olive_conversations").insert(conv_data).execute()
+            )
 
             if not response.data:
                 raise Exception("Failed to create conversation")
 
             conversation = response.data[0]
+            await self._invalidate_conversations_cache(user_id)
 
             return {
                 "id": UUID(conversation["id"]),
@@ -244,8 +250,9 @@ class OliveService:
         """
         try:
             # Get conversation
-            conv_response = (
-                supabase.table("olive_conversations")
+            conv_response = await (
+                get_async_supabase_client()
+                .table("olive_conversations")
                 .select("*")
                 .eq("id", str(conversation_id))
                 .execute()
@@ -261,8 +268,9 @@ class OliveService:
                 raise UnauthorizedError("You don't have access to this conversation")
 
             # Get messages (ordered by created_at ASC - oldest first)
-            messages_response = (
-                supabase.table("olive_messages")
+            messages_response = await (
+                get_async_supabase_client()
+                .table("olive_messages")
                 .select("*")
                 .eq("conversation_id", str(conversation_id))
                 .order("created_at", desc=False)
@@ -314,28 +322,26 @@ class OliveService:
         try:
             offset = (page - 1) * page_size
 
-            # Get conversations
-            conv_query = (
-                supabase.table("olive_conversations")
-                .select("*")
+            # Get the page of conversations; the total comes back with it
+            conv_response = await (
+                get_async_supabase_client()
+                .table("olive_conversations")
+                .select("*", count="exact")
                 .eq("user_id", str(user_id))
                 .order("created_at", desc=True)
+                .range(offset, offset + page_size - 1)
+                .execute()
             )
-
-            # Get total count
-            count_response = conv_query.execute()
-            total_count = len(count_response.data) if count_response.data else 0
-
-            # Apply pagination
-            conv_response = conv_query.range(offset, offset + page_size - 1).execute()
+            total_count = conv_response.count or 0
 
             conversations = []
             for conv in conv_response.data:
                 conv_id = conv["id"]
 
                 # Get message count for this conversation
-                msg_count_response = (
-                    supabase.table("olive_messages")
+                msg_count_response = await (
+                    get_async_supabase_client()
+                    .table("olive_messages")
                     .select("id", count="exact")
                     .eq("conversation_id", conv_id)
                     .execute()
@@ -344,8 +350,9 @@ class OliveService:
                 message_count = msg_count_response.count if msg_count_response.count else 0
 
                 # Get last message timestamp
-                last_msg_response = (
-                    supabase.table("olive_messages")
+                last_msg_response = await (
+                    get_async_supabase_client()
+                    .table("olive_messages")
                     .select("created_at")
                     .eq("conversation_id", conv_id)
                     .order("created_at", desc=True)
@@ -380,6 +387,45 @@ class OliveService:
         except Exception as e:
             raise Exception(f"Error fetching conversations: {str(e)}")
 
+    async def get_user_conversations_json(
+        self, user_id: UUID, page: int = 1, page_size: int = 20
+    ) -> Tuple[bytes, bool]:
+        """
+        Get a user's conversations as OliveConversationListResponse JSON, cached in Redis.
+
+        Pages are kept in one Redis hash per user, so any conversation write
+        drops them all with a single DEL. Without Redis (or on a Redis error)
+        the read always runs.
+
+        See get_user_conversations for the arguments.
+
+        Returns:
+            Tuple of (JSON body, whether it was served from the cache)
+        """
+        cache_key = self._conversations_cache_key(user_id)
+        field = f"{page}:{page_size}"
+        if redis is not None:
+            try:
+                cached = await redis.hget(cache_key, field)
+                if cached is not None:
+                    return cached, True
+            except Exception as e:
+                logger.warning("Conversations cache read error: %s", e)
+
+        # Rows are already typed (UUIDs, datetimes), which orjson serializes natively
+        body = orjson.dumps(await self.get_user_conversations(user_id, page, page_size))
+
+        if redis is not None:
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    pipe.hset(cache_key, field, body)
+                    pipe.expire(cache_key, CONVERSATIONS_CACHE_TTL)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning("Conversations cache write error: %s", e)
+
+        return body, False
+
     async def update_conversation_title(
         self, conversation_id: UUID, user_id: UUID, title: str
     ) -> Dict[str, Any]:
@@ -401,8 +447,9 @@ class OliveService:
         """
         try:
             # Verify conversation exists and belongs to user
-            conv_response = (
-                supabase.table("olive_conversations")
+            conv_response = await (
+                get_async_supabase_client()
+                .table("olive_conversations")
                 .select("*")
                 .eq("id", str(conversation_id))
                 .eq("user_id", str(user_id))
@@ -415,16 +462,18 @@ class OliveService:
                 )
 
             # Update title
-            _ = (
-                supabase.table("olive_conversations")
+            _ = await (
+                get_async_supabase_client()
+                .table("olive_conversations")
                 .update({"title": title})
                 .eq("id", str(conversation_id))
                 .execute()
             )
 
             # Fetch the updated conversation to ensure we have the latest data
-            conv_response = (
-                supabase.table("olive_conversations")
+            conv_response = await (
+                get_async_supabase_client()
+                .table("olive_conversations")
                 .select("*")
                 .eq("id", str(conversation_id))
                 .execute()
@@ -436,8 +485,9 @@ class OliveService:
             conversation = conv_response.data[0]
 
             # Get message count
-            msg_count_response = (
-                supabase.table("olive_messages")
+            msg_count_response = await (
+                get_async_supabase_client()
+                .table("olive_messages")
                 .select("id", count="exact")
                 .eq("conversation_id", str(conversation_id))
                 .execute()
@@ -446,8 +496,9 @@ class OliveService:
             message_count = msg_count_response.count if msg_count_response.count else 0
 
             # Get last message timestamp
-            last_msg_response = (
-                supabase.table("olive_messages")
+            last_msg_response = await (
+                get_async_supabase_client()
+                .table("olive_messages")
                 .select("created_at")
                 .eq("conversation_id", str(conversation_id))
                 .order("created_at", desc=True)
@@ -459,6 +510,8 @@ class OliveService:
             if last_msg_response.data:
                 last_message_at = datetime.fromisoformat(last_msg_response.data[0]["created_at"])
 
+            await self._invalidate_conversations_cache(user_id)
+
             return {
                 "id": UUID(conversation["id"]),
                 "user_id": UUID(conversation["user_id"]),
@@ -493,8 +546,9 @@ class OliveService:
         """
         try:
             # Verify conversation exists and belongs to user
-            conv_response = (
-                supabase.table("olive_conversations")
+            conv_response = await (
+                get_async_supabase_client()
+                .table("olive_conversations")
                 .select("*")
                 .eq("id", str(conversation_id))
                 .eq("user_id", str(user_id))
@@ -507,8 +561,9 @@ class OliveService:
                 )
 
             # Delete conversation (messages will be deleted by CASCADE)
-            delete_response = (
-                supabase.table("olive_conversations")
+            delete_response = await (
+                get_async_supabase_client()
+                .table("olive_conversations")
                 .delete()
                 .eq("id", str(conversation_id))
                 .execute()
@@ -517,6 +572,7 @@ class OliveService:
             if not delete_response.data:
                 raise Exception("Failed to delete conversation")
 
+            await self._invalidate_conversations_cache(user_id)
             return True
 
         except (ConversationNotFoundError, UnauthorizedError):
@@ -524,6 +580,21 @@ class OliveService:
         except Exception as e:
             raise Exception(f"Error deleting conversation: {str(e)}")
 
+    @staticmethod
+    def _conversations_cache_key(user_id: UUID) -> str:
+        """Redis hash holding a user's cached conversations pages."""
+        return f"olive:conversations:{user_id}"
+
+    async def _invalidate_conversations_cache(self, user_id: UUID) -> None:
+        """Drop a user's cached conversations pages after a conversation write."""
+        if redis is None:
+            return
+
+        try:
+            await redis.delete(self._conversations_cache_key(user_id))
+        except Exception as e:
+            logger.warning("Conversations cache delete error: %s", e)
+
     async def _generate_title_from_message(self, message: str) -> str:
         """
         Generate conversation title from first message.
@@ -556,6 +627,7 @@ class OliveService:
             The assistant's response text.
 
         Raises:
+            RateLimitError: If the API rate limit was hit.
             GroqAPIError: If API call fails.
         """
         try:
@@ -573,6 +645,8 @@ class OliveService:
 
             return completion.choices[0].message.content
 
+        except GroqRateLimitError as e:
+            raise RateLimitError(f"Groq API rate limit: {str(e)}")
         except Exception as e:
             raise GroqAPIError(f"Groq API error: {str(e)}")
 
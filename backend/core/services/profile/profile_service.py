@@ -4,10 +4,17 @@ Profile service layer.
 Handles all profile operations including get, update, search, and statistics.
 """
 
+import asyncio
+import hashlib
+import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import orjson
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+
 from backend.core.models.profile import (
     ProfileListResponse,
     ProfileSearchRequest,
@@ -15,7 +22,16 @@ from backend.core.models.profile import (
     ProfileUpdate,
     PublicProfileResponse,
 )
-from backend.db import supabase
+from backend.db import get_async_supabase_client, redis, supabase
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached search page stays valid; profile edits show up within this
+SEARCH_CACHE_TTL = 30
+
+# Batch validator for search results (one call instead of a model per row); the
+# public model drops email and phone from the service rows
+_public_profile_list_adapter = TypeAdapter(List[PublicProfileResponse])
 
 
 class ProfileNotFoundError(Exception):
@@ -55,8 +71,9 @@ class ProfileService:
             Exception: For other database errors.
         """
         try:
-            response = (
-                supabase.table("profiles")
+            response = await (
+                get_async_supabase_client()
+                .table("profiles")
                 .select("*, universities(id, name, domain, state)")
                 .eq("id", str(profile_id))
                 .execute()
@@ -94,8 +111,9 @@ class ProfileService:
             Exception: For other database errors.
         """
         try:
-            response = (
-                supabase.table("profiles")
+            response = await (
+                get_async_supabase_client()
+                .table("profiles")
                 .select("*, universities(id, name, domain, state)")
                 .eq("id", str(user_id))
                 .execute()
@@ -134,8 +152,12 @@ class ProfileService:
         """
         try:
             # Check if profile exists
-            existing_profile = (
-                supabase.table("profiles").select("id").eq("id", str(user_id)).execute()
+            existing_profile = await (
+                get_async_supabase_client()
+                .table("profiles")
+                .select("id")
+                .eq("id", str(user_id))
+                .execute()
             )
 
             if not existing_profile.data:
@@ -151,8 +173,12 @@ class ProfileService:
                 raise ValidationError("No valid fields provided for update")
 
             # Update profile
-            response = (
-                supabase.table("profiles").update(update_payload).eq("id", str(user_id)).execute()
+            response = await (
+                get_async_supabase_client()
+                .table("profiles")
+                .update(update_payload)
+                .eq("id", str(user_id))
+                .execute()
             )
 
             if not response.data:
@@ -186,10 +212,15 @@ class ProfileService:
         """
         try:
             # Build query
-            query = supabase.table("profiles").select(
-                "id, full_name, bio, interests, profile_picture_url, "
-                "graduation_year, major, university_id, university_email, "
-                "is_verified, created_at, universities(id, name, domain, state)"
+            query = (
+                get_async_supabase_client()
+                .table("profiles")
+                .select(
+                    "id, full_name, bio, interests, profile_picture_url, "
+                    "graduation_year, major, university_id, university_email, "
+                    "is_verified, created_at, universities(id, name, domain, state)",
+                    count="exact",
+                )
             )
 
             # Apply search query (search in name)
@@ -214,48 +245,83 @@ class ProfileService:
             if viewer_id:
                 query = query.neq("id", str(viewer_id))
 
-            # Get total count
-            count_query = query
-            count_response = count_query.execute()
-            total_count = len(count_response.data) if count_response.data else 0
-
-            # Apply pagination
+            # Apply ordering (id breaks ties so pages are stable) and pagination;
+            # the total comes back with the page (indexes: migrations 003, 014)
             offset = (search_request.page - 1) * search_request.page_size
-            query = query.range(offset, offset + search_request.page_size - 1)
-
-            # Execute query
-            profiles_response = query.execute()
-
-            if not profiles_response.data:
-                return ProfileListResponse(
-                    profiles=[],
-                    total=0,
-                    page=search_request.page,
-                    page_size=search_request.page_size,
-                    has_more=False,
-                ).model_dump()
-
-            # Format profiles as public profiles
-            formatted_profiles = []
-            for profile_data in profiles_response.data:
-                formatted_profile = self._format_profile_response(
-                    profile_data, is_own_profile=False
-                )
-                formatted_profiles.append(formatted_profile)
+            query = (
+                query.order("full_name")
+                .order("id")
+                .range(offset, offset + search_request.page_size - 1)
+            )
+
+            profiles_response = await query.execute()
+            total_count = profiles_response.count or 0
+
+            # Format profiles as public profiles; search_profiles_json validates them
+            formatted_profiles = [
+                self._format_profile_response(profile_data, is_own_profile=False)
+                for profile_data in profiles_response.data or []
+            ]
 
             has_more = (search_request.page * search_request.page_size) < total_count
 
-            return ProfileListResponse(
-                profiles=[PublicProfileResponse(**profile) for profile in formatted_profiles],
-                total=total_count,
-                page=search_request.page,
-                page_size=search_request.page_size,
-                has_more=has_more,
-            ).model_dump()
+            return {
+                "profiles": formatted_profiles,
+                "total": total_count,
+                "page": search_request.page,
+                "page_size": search_request.page_size,
+                "has_more": has_more,
+            }
 
         except Exception as e:
             raise Exception(f"Error searching profiles: {e}")
 
+    async def search_profiles_json(
+        self, search_request: ProfileSearchRequest, viewer_id: Optional[UUID] = None
+    ) -> Tuple[bytes, bool]:
+        """
+        Search profiles, serialized as ProfileListResponse JSON and cached in Redis.
+
+        Results are cached for SEARCH_CACHE_TTL seconds by the search criteria
+        and viewer. Without Redis (or on a Redis error) the search always runs.
+
+        See search_profiles for the arguments.
+
+        Returns:
+            Tuple of (JSON body, whether it was served from the cache)
+        """
+        cache_key = None
+        if redis is not None:
+            try:
+                digest = hashlib.blake2b(
+                    orjson.dumps([search_request.model_dump(mode="json"), str(viewer_id)]),
+                    digest_size=16,
+                ).hexdigest()
+                cache_key = f"profile:search:v1:{digest}"
+                cached = await redis.get(cache_key)
+                if cached is not None:
+                    return cached, True
+            except Exception as e:
+                logger.warning("Profile search cache read error: %s", e)
+
+        result = await self.search_profiles(search_request=search_request, viewer_id=viewer_id)
+        profile_list = ProfileListResponse.model_construct(
+            profiles=_public_profile_list_adapter.validate_python(result["profiles"]),
+            total=result["total"],
+            page=result["page"],
+            page_size=result["page_size"],
+            has_more=result["has_more"],
+        )
+        body = profile_list.model_dump_json().encode()
+
+        if cache_key is not None:
+            try:
+                await redis.setex(cache_key, SEARCH_CACHE_TTL, body)
+            except Exception as e:
+                logger.warning("Profile search cache write error: %s", e)
+
+        return body, False
+
     async def get_profile_stats(self, user_id: UUID) -> Dict[str, Any]:
         """
         Get statistics for a user profile.
@@ -271,54 +337,45 @@ class ProfileService:
             Exception: For other database errors.
         """
         try:
-            # Check if profile exists and get joined_date
-            profile_response = (
-                supabase.table("profiles").select("created_at").eq("id", str(user_id)).execute()
-            )
-
-            if not profile_response.data:
-                raise ProfileNotFoundError(f"Profile with ID {user_id} not found")
-
-            joined_date = datetime.fromisoformat(profile_response.data[0]["created_at"])
-
-            # Get posts count
-            posts_response = (
-                supabase.table("posts")
-                .select("id", count="exact")
+            # The profile and the four counts are independent; run them together.
+            # Counts are read with HEAD requests, so no rows come back
+            client = get_async_supabase_client()
+            (
+                profile_response,
+                posts_response,
+                listings_response,
+                conv1_response,
+                conv2_response,
+            ) = await asyncio.gather(
+                client.table("profiles").select("created_at").eq("id", str(user_id)).execute(),
+                client.table("posts")
+                .select("id", count="exact", head=True)
                 .eq("user_id", str(user_id))
-                .execute()
-            )
-            posts_count = posts_response.count if posts_response.count else 0
-
-            # Get listings count (active only)
-            listings_response = (
-                supabase.table("housing_listings")
-                .select("id", count="exact")
+                .execute(),
+                # Active listings only
+                client.table("housing_listings")
+                .select("id", count="exact", head=True)
                 .eq("user_id", str(user_id))
                 .eq("is_active", True)
-                .execute()
-            )
-            listings_count = listings_response.count if listings_response.count else 0
-
-            # Get conversations count
-            # User can be either participant_1 or participant_2
-            conv1_response = (
-                supabase.table("conversations")
-                .select("id", count="exact")
+                .execute(),
+                # User can be either participant_1 or participant_2
+                client.table("conversations")
+                .select("id", count="exact", head=True)
                 .eq("participant_1_id", str(user_id))
-                .execute()
-            )
-
-            conv2_response = (
-                supabase.table("conversations")
-                .select("id", count="exact")
+                .execute(),
+                client.table("conversations")
+                .select("id", count="exact", head=True)
                 .eq("participant_2_id", str(user_id))
-                .execute()
+                .execute(),
             )
 
-            connections_count = (conv1_response.count if conv1_response.count else 0) + (
-                conv2_response.count if conv2_response.count else 0
-            )
+            if not profile_response.data:
+                raise ProfileNotFoundError(f"Profile with ID {user_id} not found")
+
+            joined_date = datetime.fromisoformat(profile_response.data[0]["created_at"])
+            posts_count = posts_response.count or 0
+            listings_count = listings_response.count or 0
+            connections_count = (conv1_response.count or 0) + (conv2_response.count or 0)
 
             return ProfileStatsResponse(
                 posts_count=posts_count,
@@ -355,17 +412,20 @@ class ProfileService:
             storage_path = f"{user_id}/{file_path}"
 
             # Upload file to Supabase Storage
-            _ = supabase.storage.from_("profile-pictures").upload(
-                path=storage_path, file=file_bytes, file_options={"content-type": content_type}
+            await run_in_threadpool(
+                supabase.storage.from_("profile-pictures").upload,
+                path=storage_path,
+                file=file_bytes,
+                file_options={"content-type": content_type},
             )
 
             # Get public URL
             public_url = supabase.storage.from_("profile-pictures").get_public_url(storage_path)
 
             # Update profile with new picture URL
-            supabase.table("profiles").update({"profile_picture_url": public_url}).eq(
-                "id", str(user_id)
-            ).execute()
+            await get_async_supabase_client().table("profiles").update(
+                {"profile_picture_url": public_url}
+            ).eq("id", str(user_id)).execute()
 
             return public_url
 
@@ -387,8 +447,9 @@ class ProfileService:
         """
         try:
             # Get current profile picture URL
-            profile_response = (
-                supabase.table("profiles")
+            profile_response = await (
+                get_async_supabase_client()
+                .table("profiles")
                 .select("profile_picture_url")
                 .eq("id", str(user_id))
                 .execute()
@@ -407,15 +468,17 @@ class ProfileService:
 
                 # Delete all files for this user (in case there are multiple)
                 try:
-                    supabase.storage.from_("profile-pictures").remove([storage_path])
+                    await run_in_threadpool(
+                        supabase.storage.from_("profile-pictures").remove, [storage_path]
+                    )
                 except Exception:
                     # Ignore storage deletion errors (file might not exist)
                     pass
 
             # Update profile to remove picture URL
-            supabase.table("profiles").update({"profile_picture_url": None}).eq(
-                "id", str(user_id)
-            ).execute()
+            await get_async_supabase_client().table("profiles").update(
+                {"profile_picture_url": None}
+            ).eq("id", str(user_id)).execute()
 
             return True
 
@@ -440,8 +503,9 @@ class ProfileService:
             Exception: For database errors.
         """
         try:
-            response = (
-                supabase.table("profiles")
+            response = await (
+                get_async_supabase_client()
+                .table("profiles")
                 .select(
                     "id, full_name, bio, interests, profile_picture_url, "
                     "graduation_year, major, university_id, university_email, "
@@ -4,10 +4,33 @@ Utility functions package for Uniboe backend.
 Exports encryption and other utility functions.
 """
 
-from backend.core.utils.encryption import decrypt_message, encrypt_message, generate_encryption_key
+from backend.core.utils.blind_index import blind_index, tokenize
+from backend.core.utils.encryption import (
+    decrypt_message,
+    decrypt_messages,
+    encrypt_message,
+    generate_encryption_key,
+)
+from backend.core.utils.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+)
+from backend.core.utils.uploads import open_upload_stream, sniff_image_type, upload_size
 
 __all__ = [
     "encrypt_message",
     "decrypt_message",
+    "decrypt_messages",
     "generate_encryption_key",
+    "blind_index",
+    "tokenize",
+    "InvalidCursorError",
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_filter",
+    "open_upload_stream",
+    "sniff_image_type",
+    "upload_size",
 ]
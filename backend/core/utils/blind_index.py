@@ -0,0 +1,65 @@
+"""
+Blind index for searching encrypted chat messages.
+
+Message content is stored encrypted, so the database cannot match it
+directly. At write time each distinct word of the plaintext is lowercased and
+hashed with a keyed HMAC; the hashes are stored alongside the ciphertext and
+GIN-indexed. A search hashes the query words the same way and asks the
+database for rows containing all of them, without decrypting anything.
+"""
+
+import hashlib
+import hmac
+import re
+from functools import lru_cache
+from typing import List
+
+from backend.config import settings
+
+# Words are runs of letters/digits; punctuation and whitespace separate them
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@lru_cache(maxsize=1)
+def _blind_index_key() -> bytes:
+    """Derive the blind-index HMAC key from SECRET_KEY (separate from the encryption key)."""
+    return hmac.new(
+        settings.SECRET_KEY.encode(), b"uniboe_chat_blind_index", hashlib.sha256
+    ).digest()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into distinct lowercase words, preserving first-seen order.
+
+    Args:
+        text: Plain text to tokenize.
+
+    Returns:
+        List[str]: Unique lowercase tokens.
+    """
+    return list(dict.fromkeys(token.lower() for token in _TOKEN_RE.findall(text)))
+
+
+def blind_index(text: str) -> List[str]:
+    """
+    Compute the blind-index hashes for every word in a text.
+
+    Args:
+        text: Plain text (message content or search query).
+
+    Returns:
+        List[str]: Hex HMAC-SHA256 digests (truncated to 128 bits), one per unique word.
+
+    Example:
+        >>> blind_index("See you at 5!") == blind_index("see YOU at 5")
+        True
+    """
+    key = _blind_index_key()
+    return [
+        hmac.new(key, token.encode("utf-8"), hashlib.sha256).hexdigest()[:32]
+        for token in tokenize(text)
+    ]
+
+
+__all__ = ["tokenize", "blind_index"]
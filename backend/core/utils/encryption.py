@@ -5,7 +5,8 @@ Uses Fernet symmetric encryption to encrypt/decrypt messages at rest.
 """
 
 import base64
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.backends import default_backend
@@ -15,12 +16,14 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from backend.config import settings
 
 
+@lru_cache(maxsize=32)
 def _get_fernet_key(password: Optional[str] = None) -> bytes:
     """
     Derive a Fernet key from a password using PBKDF2.
 
     Uses PBKDF2 with SHA256 to derive a 32-byte key from the password.
     If no password is provided, uses the SECRET_KEY from settings.
+    Derivation runs 100k iterations, so results are cached per password.
 
     Args:
         password: Password to derive key from (uses SECRET_KEY if None).
@@ -51,6 +54,12 @@ def _get_fernet_key(password: Optional[str] = None) -> bytes:
     return key
 
 
+@lru_cache(maxsize=32)
+def _get_fernet(key: Optional[str] = None) -> Fernet:
+    """Return a reusable Fernet instance for the given key (SECRET_KEY if None)."""
+    return Fernet(_get_fernet_key(key))
+
+
 def encrypt_message(content: str, key: Optional[str] = None) -> str:
     """
     Encrypt a message using Fernet symmetric encryption.
@@ -86,8 +95,7 @@ def encrypt_message(content: str, key: Optional[str] = None) -> str:
         raise ValueError("Cannot encrypt empty content")
 
     try:
-        fernet_key = _get_fernet_key(key)
-        f = Fernet(fernet_key)
+        f = _get_fernet(key)
         encrypted_bytes = f.encrypt(content.encode("utf-8"))
         return encrypted_bytes.decode("utf-8")
     except ValueError:
@@ -128,8 +136,7 @@ def decrypt_message(encrypted_content: str, key: Optional[str] = None) -> str:
         raise ValueError("Cannot decrypt empty content")
 
     try:
-        fernet_key = _get_fernet_key(key)
-        f = Fernet(fernet_key)
+        f = _get_fernet(key)
         decrypted_bytes = f.decrypt(encrypted_content.encode("utf-8"))
         return decrypted_bytes.decode("utf-8")
     except ValueError:
@@ -138,6 +145,38 @@ def decrypt_message(encrypted_content: str, key: Optional[str] = None) -> str:
         raise Exception(f"Decryption failed: {str(e)}")
 
 
+def decrypt_messages(
+    encrypted_contents: List[str], key: Optional[str] = None
+) -> List[Optional[str]]:
+    """
+    Decrypt a batch of messages encrypted with Fernet.
+
+    Resolves the key once and decrypts every item in a tight loop. This is
+    CPU-bound, so async callers should run it in a worker thread rather than
+    on the event loop.
+
+    Args:
+        encrypted_contents: Base64 encoded encrypted messages.
+        key: Optional encryption key. If None, uses SECRET_KEY from settings.
+
+    Returns:
+        List[Optional[str]]: Decrypted messages in input order, with None for
+        any item that is empty or fails to decrypt.
+
+    Example:
+        >>> decrypt_messages([encrypt_message("Hi"), "corrupted"])
+        ['Hi', None]
+    """
+    f = _get_fernet(key)
+    decrypted: List[Optional[str]] = []
+    for encrypted_content in encrypted_contents:
+        try:
+            decrypted.append(f.decrypt(encrypted_content.encode("utf-8")).decode("utf-8"))
+        except Exception:
+            decrypted.append(None)
+    return decrypted
+
+
 def generate_encryption_key() -> str:
     """
     Generate a new random Fernet encryption key.
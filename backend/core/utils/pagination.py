@@ -0,0 +1,78 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque base64url-encoded JSON payloads holding the sort key
+(`ts`) and tie-breaking ID (`id`) of the last row on a page. The next page
+selects rows strictly after that pair, so each page costs O(page_size)
+regardless of depth.
+"""
+
+import base64
+import json
+from typing import Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(ts: str, row_id: str) -> str:
+    """
+    Encode a (timestamp, id) pair into an opaque cursor.
+
+    Args:
+        ts: Sort-key timestamp of the last row (as returned by the database).
+        row_id: ID of the last row.
+
+    Returns:
+        str: base64url cursor without padding.
+    """
+    payload = json.dumps({"ts": ts, "id": row_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: Opaque cursor string.
+
+    Returns:
+        Tuple[str, str]: The (timestamp, id) pair.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        ts, row_id = payload["ts"], payload["id"]
+    except Exception as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+    if not isinstance(ts, str) or not isinstance(row_id, str):
+        raise InvalidCursorError("Invalid pagination cursor")
+
+    return ts, row_id
+
+
+def keyset_filter(column: str, ts: str, row_id: str) -> str:
+    """
+    Build a PostgREST `or` filter selecting rows after (ts, id) in DESC order.
+
+    Equivalent to `(column, id) < (ts, id)`; values are quoted because
+    timestamps contain reserved characters.
+
+    Args:
+        column: Timestamp column the results are ordered by.
+        ts: Timestamp of the last row on the previous page.
+        row_id: ID of the last row on the previous page.
+
+    Returns:
+        str: Filter string for `.or_()`.
+    """
+    return f'{column}.lt."{ts}",and({column}.eq."{ts}",id.lt."{row_id}")'
+
+
+__all__ = ["InvalidCursorError", "encode_cursor", "decode_cursor", "keyset_filter"]
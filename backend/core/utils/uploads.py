@@ -0,0 +1,73 @@
+"""
+Upload streaming helpers.
+
+Starlette spools large uploads to a temporary file. These helpers hand that
+file to storage3 without reading it into memory.
+"""
+
+import os
+from io import FileIO
+from typing import BinaryIO, Optional
+
+# Leading bytes that identify each image format; WebP is a RIFF container
+# whose format tag sits at offset 8
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_JPEG_SIGNATURE = b"\xff\xd8\xff"
+_RIFF_SIGNATURE = b"RIFF"
+_WEBP_TAG = b"WEBP"
+
+
+def upload_size(file: BinaryIO) -> int:
+    """
+    Return the size of an uploaded file in bytes without reading it.
+
+    Args:
+        file: The uploaded file object (UploadFile.file)
+
+    Returns:
+        int: File size in bytes
+    """
+    return file.seek(0, os.SEEK_END)
+
+
+def sniff_image_type(file: BinaryIO) -> Optional[str]:
+    """
+    Identify a JPEG, PNG or WebP upload from its first bytes.
+
+    The client-supplied content type cannot be trusted; the file header can.
+    Only 12 bytes are read, and the file is rewound afterwards.
+
+    Args:
+        file: The uploaded file object (UploadFile.file)
+
+    Returns:
+        Optional[str]: The image MIME type, or None if the header matches none
+    """
+    file.seek(0)
+    header = file.read(12)
+    file.seek(0)
+
+    if header.startswith(_JPEG_SIGNATURE):
+        return "image/jpeg"
+    if header.startswith(_PNG_SIGNATURE):
+        return "image/png"
+    if header.startswith(_RIFF_SIGNATURE) and header[8:12] == _WEBP_TAG:
+        return "image/webp"
+    return None
+
+
+def open_upload_stream(file: BinaryIO) -> FileIO:
+    """
+    Reopen an uploaded file as a FileIO positioned at its start.
+
+    Handing storage3 a FileIO over the same descriptor lets httpx stream it
+    from disk in chunks instead of holding the whole file in memory.
+
+    Args:
+        file: The uploaded file object (UploadFile.file)
+
+    Returns:
+        FileIO: A new read-only stream the caller must close
+    """
+    file.seek(0)
+    return FileIO(os.dup(file.fileno()), "rb")
@@ -4,6 +4,23 @@ Database package for Uniboe backend.
 Contains database client initialization, migrations, and seed data.
 """
 
-from backend.db.supabase_client import get_supabase_client, supabase
+from backend.db.redis_client import get_redis_client, redis
+from backend.db.supabase_client import (
+    get_async_supabase_client,
+    get_supabase_client,
+    get_supabase_read_client,
+    init_async_supabase_client,
+    supabase,
+    supabase_read,
+)
 
-__all__ = ["supabase", "get_supabase_client"]
+__all__ = [
+    "supabase",
+    "supabase_read",
+    "get_supabase_client",
+    "get_supabase_read_client",
+    "init_async_supabase_client",
+    "get_async_supabase_client",
+    "redis",
+    "get_redis_client",
+]
@@ -0,0 +1,78 @@
+"""
+Backfill the messages blind index.
+
+Messages stored before migration 005 have NULL content_tokens and cannot be
+found by search. Their content is encrypted with the application key, so the
+tokens have to be computed here rather than in SQL.
+
+Run once after deploying migration 005, with the production environment loaded:
+
+    python -m backend.db.backfill_blind_index
+
+The script is idempotent; it only touches rows whose content_tokens is NULL.
+Rows that fail to decrypt get an empty token list so they stop matching the
+backfill without ever matching a search.
+"""
+
+import logging
+
+from backend.core.utils import blind_index, decrypt_messages
+from backend.db.supabase_client import supabase
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched and decrypted per round trip
+BATCH_SIZE = 500
+
+
+def backfill_blind_index(batch_size: int = BATCH_SIZE) -> int:
+    """
+    Compute content_tokens for every message that does not have them yet.
+
+    Rows are walked in id order so a row that fails to update is not fetched
+    again in the same run.
+
+    Args:
+        batch_size: Number of messages fetched per query.
+
+    Returns:
+        int: Number of messages updated.
+    """
+    updated = 0
+    last_id = None
+
+    while True:
+        query = (
+            supabase.table("messages")
+            .select("id, content_encrypted")
+            .is_("content_tokens", "null")
+            .order("id")
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            query = query.gt("id", last_id)
+
+        rows = query.execute().data or []
+        if not rows:
+            return updated
+
+        contents = decrypt_messages([row["content_encrypted"] for row in rows])
+
+        for row, content in zip(rows, contents):
+            tokens = blind_index(content) if content is not None else []
+            try:
+                supabase.table("messages").update(
+                    {"content_tokens": tokens}, returning="minimal"
+                ).eq("id", row["id"]).execute()
+                updated += 1
+            except Exception as e:
+                logger.warning("Failed to backfill message %s: %s", row["id"], e)
+
+        last_id = rows[-1]["id"]
+        logger.info("Backfilled %d messages", updated)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    total = backfill_blind_index()
+    logger.info("Done: %d messages backfilled", total)
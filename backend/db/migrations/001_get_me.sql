@@ -0,0 +1,18 @@
+-- Returns the profile of the user identified by the request JWT.
+--
+-- PostgREST verifies the bearer token and exposes its subject via auth.uid(),
+-- so a single RPC call both authenticates the caller and returns their profile
+-- (used by the auth dependencies when SUPABASE_JWT_SECRET is not configured).
+
+CREATE OR REPLACE FUNCTION public.get_me()
+RETURNS SETOF public.profiles
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT * FROM public.profiles WHERE id = auth.uid();
+$$;
+
+REVOKE ALL ON FUNCTION public.get_me() FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.get_me() TO authenticated;
@@ -0,0 +1,19 @@
+-- Covering index for the per-request auth profile lookup.
+--
+-- The auth dependencies select these columns by id on every authenticated
+-- request; including them lets Postgres answer with an index-only scan
+-- instead of visiting the table heap.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS profiles_auth_covering
+    ON public.profiles (id)
+    INCLUDE (
+        email,
+        full_name,
+        university_id,
+        university_email,
+        profile_picture_url,
+        is_verified,
+        created_at
+    );
@@ -0,0 +1,16 @@
+-- Indexes for the chat user search (GET /api/chat/users/search).
+--
+-- The search filters profiles with `full_name ILIKE '%q%'` and embeds the
+-- university through profiles.university_id. A trigram GIN index lets Postgres
+-- answer the infix ILIKE (for queries of 3+ characters) without scanning every
+-- profile, and the university_id index serves the foreign-key join.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS profiles_full_name_trgm_idx
+    ON public.profiles USING gin (full_name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS profiles_university_id_idx
+    ON public.profiles (university_id);
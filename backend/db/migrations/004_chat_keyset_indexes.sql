@@ -0,0 +1,17 @@
+-- Indexes backing keyset (cursor) pagination of chat lists.
+--
+-- Conversations are listed per participant ordered by (last_message_at, id)
+-- and messages per conversation ordered by (created_at, id). Matching
+-- composite indexes let each page start at the cursor with an index range
+-- scan instead of sorting and skipping earlier rows.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS conversations_p1_keyset_idx
+    ON public.conversations (participant_1_id, last_message_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS conversations_p2_keyset_idx
+    ON public.conversations (participant_2_id, last_message_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS messages_conversation_keyset_idx
+    ON public.messages (conversation_id, created_at DESC, id DESC);
@@ -0,0 +1,18 @@
+-- Blind index for searching encrypted messages.
+--
+-- messages.content_encrypted cannot be searched in SQL. content_tokens holds
+-- keyed HMAC digests of each lowercase word in the plaintext (written by the
+-- API on send); a GIN index serves `content_tokens @> ARRAY[...]` lookups so a
+-- search touches only matching rows and decrypts nothing it doesn't return.
+--
+-- Search matches whole words only, through content_tokens. Rows written before
+-- this migration have NULL content_tokens and cannot be found until they are
+-- backfilled; running `python -m backend.db.backfill_blind_index` after this
+-- migration is a required deploy step.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+ALTER TABLE public.messages ADD COLUMN IF NOT EXISTS content_tokens text[];
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS messages_content_tokens_gin_idx
+    ON public.messages USING gin (content_tokens);
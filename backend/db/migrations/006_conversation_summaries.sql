@@ -0,0 +1,60 @@
+-- Batched last-message previews and unread counts for the conversation list.
+--
+-- The list endpoint used to issue two queries per conversation (latest message,
+-- unread count). These functions answer both for a whole page of conversations
+-- in one call each, so the API runs three queries regardless of page size.
+--
+-- conversation_last_messages returns messages rows, so PostgREST can still
+-- embed the sender profile. Each conversation is one probe of
+-- messages_conversation_keyset_idx (004) through the LATERAL ... LIMIT 1.
+--
+-- Both are called with the service role only; they take arbitrary IDs and
+-- must not be exposed to anon/authenticated clients.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE OR REPLACE FUNCTION public.conversation_last_messages(conversation_ids uuid[])
+RETURNS SETOF public.messages
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT m.*
+    FROM unnest(conversation_ids) AS c(id)
+    CROSS JOIN LATERAL (
+        SELECT *
+        FROM public.messages
+        WHERE conversation_id = c.id
+        ORDER BY created_at DESC, id DESC
+        LIMIT 1
+    ) AS m;
+$$;
+
+CREATE OR REPLACE FUNCTION public.conversation_unread_counts(
+    conversation_ids uuid[],
+    reader_id uuid
+)
+RETURNS TABLE (conversation_id uuid, unread_count bigint)
+LANGUAGE sql
+STABLE
+SET search_path = public
+AS $$
+    SELECT m.conversation_id, count(*)
+    FROM public.messages AS m
+    WHERE m.conversation_id = ANY (conversation_ids)
+      AND NOT m.is_read
+      AND m.sender_id <> reader_id
+    GROUP BY m.conversation_id;
+$$;
+
+REVOKE ALL ON FUNCTION public.conversation_last_messages(uuid[])
+    FROM PUBLIC, anon, authenticated;
+REVOKE ALL ON FUNCTION public.conversation_unread_counts(uuid[], uuid)
+    FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.conversation_last_messages(uuid[]) TO service_role;
+GRANT EXECUTE ON FUNCTION public.conversation_unread_counts(uuid[], uuid) TO service_role;
+
+-- Unread messages are a small, hot subset; count them without touching read rows
+CREATE INDEX CONCURRENTLY IF NOT EXISTS messages_unread_idx
+    ON public.messages (conversation_id, sender_id)
+    WHERE NOT is_read;
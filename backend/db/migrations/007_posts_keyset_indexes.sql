@@ -0,0 +1,13 @@
+-- Indexes backing keyset (cursor) pagination of the feed.
+--
+-- The global feed and per-user post lists are ordered by (created_at, id).
+-- Matching composite indexes let each page start at the cursor with an index
+-- range scan instead of scanning and discarding OFFSET rows.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS posts_keyset_idx
+    ON public.posts (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS posts_user_keyset_idx
+    ON public.posts (user_id, created_at DESC, id DESC);
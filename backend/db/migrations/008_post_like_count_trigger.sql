@@ -0,0 +1,38 @@
+-- Keep posts.like_count in step with post_likes inside the database.
+--
+-- The API used to read like_count, add or subtract one, and write it back
+-- after every like/unlike. Concurrent likes lost updates, and each toggle cost
+-- two extra round trips. Row triggers apply the change atomically in the same
+-- transaction as the post_likes write, so feed reads keep using the column
+-- they already fetch.
+--
+-- The final UPDATE is a one-time backfill that corrects any drift left by the
+-- old read-modify-write path; it is safe to re-run.
+
+CREATE OR REPLACE FUNCTION public.post_likes_count_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE public.posts SET like_count = like_count + 1 WHERE id = NEW.post_id;
+    ELSE
+        UPDATE public.posts SET like_count = GREATEST(like_count - 1, 0) WHERE id = OLD.post_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS post_likes_count_insert ON public.post_likes;
+CREATE TRIGGER post_likes_count_insert
+    AFTER INSERT ON public.post_likes
+    FOR EACH ROW EXECUTE FUNCTION public.post_likes_count_trigger();
+
+DROP TRIGGER IF EXISTS post_likes_count_delete ON public.post_likes;
+CREATE TRIGGER post_likes_count_delete
+    AFTER DELETE ON public.post_likes
+    FOR EACH ROW EXECUTE FUNCTION public.post_likes_count_trigger();
+
+UPDATE public.posts AS p
+SET like_count = (SELECT count(*) FROM public.post_likes AS l WHERE l.post_id = p.id);
@@ -0,0 +1,20 @@
+-- One like per user per post.
+--
+-- Queued likes are written in bulk with INSERT ... ON CONFLICT (post_id,
+-- user_id) DO NOTHING, which needs a unique index on exactly those columns.
+-- It also makes the like endpoint's idempotency hold under concurrent
+-- requests instead of relying on a read-then-insert check.
+--
+-- Duplicates left by that race are removed first; the like_count trigger
+-- (008) decrements the affected posts as they are deleted.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+DELETE FROM public.post_likes AS a
+USING public.post_likes AS b
+WHERE a.post_id = b.post_id
+  AND a.user_id = b.user_id
+  AND (a.created_at, a.id) > (b.created_at, b.id);
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS post_likes_post_user_key
+    ON public.post_likes (post_id, user_id);
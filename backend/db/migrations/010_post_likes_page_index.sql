@@ -0,0 +1,12 @@
+-- Index backing the paginated likes list of a post.
+--
+-- get_user_posts is already served by posts_user_keyset_idx (007), a
+-- (user_id, created_at DESC, id DESC) range scan with no sort. The likes list
+-- has the same shape on post_likes: filter by post_id, newest first, LIMIT.
+-- Without a matching index Postgres fetches and sorts every like of the post
+-- before applying the limit, which is worst on exactly the popular posts.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS post_likes_post_created_idx
+    ON public.post_likes (post_id, created_at DESC);
@@ -0,0 +1,27 @@
+-- Apply batched housing listing view counts in one statement.
+--
+-- get_listing used to write view_count = <value it read> + 1 on every view:
+-- a write on the read path that also lost concurrent views. The API now
+-- counts views in memory and flushes them every few seconds through this
+-- function, one call per flush, adding each listing's delta atomically.
+--
+-- Called with the service role only; it takes arbitrary IDs and must not be
+-- exposed to anon/authenticated clients.
+
+CREATE OR REPLACE FUNCTION public.increment_listing_views(
+    listing_ids uuid[],
+    deltas integer[]
+)
+RETURNS void
+LANGUAGE sql
+SET search_path = public
+AS $$
+    UPDATE public.housing_listings AS l
+    SET view_count = l.view_count + v.delta
+    FROM unnest(listing_ids, deltas) AS v(id, delta)
+    WHERE l.id = v.id;
+$$;
+
+REVOKE ALL ON FUNCTION public.increment_listing_views(uuid[], integer[])
+    FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.increment_listing_views(uuid[], integer[]) TO service_role;
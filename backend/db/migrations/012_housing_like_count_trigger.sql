@@ -0,0 +1,41 @@
+-- Keep housing_listings.like_count in step with housing_likes inside the
+-- database.
+--
+-- Like 008 for posts: the API used to read like_count, add or subtract one,
+-- and write it back after every like/unlike, which lost concurrent updates.
+-- Row triggers apply the change atomically with the housing_likes write, so
+-- the likes endpoint can report like_count as its total instead of counting.
+--
+-- The UPDATE is a one-time backfill that corrects any drift left by the old
+-- read-modify-write path; it is safe to re-run. The index for the per-listing
+-- likes page is built concurrently in 015, outside this file's transaction.
+
+CREATE OR REPLACE FUNCTION public.housing_likes_count_trigger()
+RETURNS trigger
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE public.housing_listings SET like_count = like_count + 1 WHERE id = NEW.listing_id;
+    ELSE
+        UPDATE public.housing_listings
+        SET like_count = GREATEST(like_count - 1, 0)
+        WHERE id = OLD.listing_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS housing_likes_count_insert ON public.housing_likes;
+CREATE TRIGGER housing_likes_count_insert
+    AFTER INSERT ON public.housing_likes
+    FOR EACH ROW EXECUTE FUNCTION public.housing_likes_count_trigger();
+
+DROP TRIGGER IF EXISTS housing_likes_count_delete ON public.housing_likes;
+CREATE TRIGGER housing_likes_count_delete
+    AFTER DELETE ON public.housing_likes
+    FOR EACH ROW EXECUTE FUNCTION public.housing_likes_count_trigger();
+
+UPDATE public.housing_listings AS h
+SET like_count = (SELECT count(*) FROM public.housing_likes AS l WHERE l.listing_id = h.id);
@@ -0,0 +1,23 @@
+-- Index the housing location search (GET /api/housing/search).
+--
+-- The search matched the query as a substring of city, state or address, but
+-- did it in Python over every active listing. A generated column holds the
+-- three fields lowercased in one string so the API can push the match down as
+-- a single `location_search ILIKE '%q%'`, and a trigram GIN index answers that
+-- infix ILIKE (for queries of 3+ characters) without a sequential scan, as in
+-- 003 for profile names. Trigrams keep the substring semantics that a
+-- tsvector word match would lose ("bost" still finds "Boston").
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE public.housing_listings
+    ADD COLUMN IF NOT EXISTS location_search text
+    GENERATED ALWAYS AS (
+        lower(coalesce(city, '') || ' ' || coalesce(state, '') || ' ' || coalesce(address, ''))
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS housing_listings_location_search_trgm_idx
+    ON public.housing_listings USING gin (location_search gin_trgm_ops)
+    WHERE is_active;
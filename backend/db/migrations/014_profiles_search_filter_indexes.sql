@@ -0,0 +1,18 @@
+-- Indexes for the profile search filters (POST /api/profile/search).
+--
+-- 003 covers the name ILIKE with a trigram index. The other filters had no
+-- index: the interests filter is an array overlap (`interests && ...`), which
+-- a GIN index on the array answers, and university and graduation year are
+-- equality filters that are often combined, which the composite btree serves
+-- (and on its own for university_id, through its prefix).
+--
+-- The search now gets its total with count=exact on the same filtered query,
+-- so the count benefits from these indexes too.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS profiles_interests_gin_idx
+    ON public.profiles USING gin (interests);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS profiles_university_graduation_idx
+    ON public.profiles (university_id, graduation_year);
@@ -0,0 +1,10 @@
+-- Index backing the paginated likes list of a housing listing.
+--
+-- Same shape as 010 for posts: filter by listing_id, newest first, LIMIT,
+-- read as an embedded, ranged resource. Kept apart from the like_count
+-- triggers in 012 so that file can run in a single transaction.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply this file on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS housing_likes_listing_created_idx
+    ON public.housing_likes (listing_id, created_at DESC);
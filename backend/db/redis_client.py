@@ -0,0 +1,41 @@
+"""
+Redis client initialization and configuration.
+
+This module provides an optional async Redis client used as a shared cache.
+When REDIS_URL is not configured the client is None and callers skip caching.
+"""
+
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from backend.config import settings
+
+
+def get_redis_client() -> Optional[Redis]:
+    """
+    Create and return an async Redis client instance.
+
+    The connection is established lazily on first command, so creating the
+    client never blocks application startup.
+
+    Returns:
+        Optional[Redis]: Configured Redis client, or None if REDIS_URL is not set
+
+    Raises:
+        Exception: If Redis client initialization fails
+    """
+    if not settings.REDIS_URL:
+        return None
+
+    try:
+        return Redis.from_url(settings.REDIS_URL)
+    except Exception as e:
+        raise Exception(f"Failed to initialize Redis client: {str(e)}") from e
+
+
+# Global Redis client instance (None when caching is disabled)
+redis: Optional[Redis] = get_redis_client()
+
+
+__all__ = ["redis", "get_redis_client"]
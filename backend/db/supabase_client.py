@@ -2,10 +2,15 @@
 Supabase client initialization and configuration.
 
 This module provides a configured Supabase client instance
-that can be imported and used throughout the application.
+that can be imported and used throughout the application, a client for
+read-only queries that targets the read replica when one is configured, and
+an async client for non-blocking access from request handlers.
 """
 
-from supabase import Client, create_client
+from typing import Optional
+
+import httpx
+from supabase import AsyncClient, AsyncClientOptions, Client, acreate_client, create_client
 
 from backend.config import settings
 
@@ -38,4 +43,93 @@ def get_supabase_client() -> Client:
 supabase: Client = get_supabase_client()
 
 
-__all__ = ["supabase", "get_supabase_client"]
+def get_supabase_read_client() -> Client:
+    """
+    Create the Supabase client for read-only queries.
+
+    Targets SUPABASE_READ_REPLICA_URL so heavy reads stay off the primary.
+    Replicas lag slightly behind, so callers must read their own recent
+    writes from `supabase`.
+
+    Returns:
+        Client: Read replica client, or the primary client if no replica is set
+
+    Raises:
+        Exception: If Supabase client initialization fails
+    """
+    if not settings.SUPABASE_READ_REPLICA_URL:
+        return supabase
+
+    try:
+        return create_client(
+            supabase_url=settings.SUPABASE_READ_REPLICA_URL,
+            supabase_key=settings.SUPABASE_SERVICE_ROLE_KEY,
+        )
+    except Exception as e:
+        raise Exception(f"Failed to initialize Supabase read client: {str(e)}") from e
+
+
+# Global read-only client (the primary client when no replica is configured)
+supabase_read: Client = get_supabase_read_client()
+
+# Global async Supabase client instance
+# Created on application startup because client creation must be awaited
+_async_supabase: Optional[AsyncClient] = None
+
+
+async def init_async_supabase_client(
+    http_client: Optional[httpx.AsyncClient] = None,
+) -> AsyncClient:
+    """
+    Create the global async Supabase client.
+
+    Must be awaited once on application startup before handlers use
+    get_async_supabase_client().
+
+    Args:
+        http_client: Shared HTTP client whose connection pool the Supabase
+            client should reuse. The caller owns and closes it.
+
+    Returns:
+        AsyncClient: Configured async Supabase client instance
+
+    Raises:
+        Exception: If Supabase client initialization fails
+    """
+    global _async_supabase
+    try:
+        _async_supabase = await acreate_client(
+            supabase_url=settings.SUPABASE_URL,
+            supabase_key=settings.SUPABASE_SERVICE_ROLE_KEY,
+            options=AsyncClientOptions(httpx_client=http_client),
+        )
+        return _async_supabase
+    except Exception as e:
+        raise Exception(f"Failed to initialize async Supabase client: {str(e)}") from e
+
+
+def get_async_supabase_client() -> AsyncClient:
+    """
+    Get the global async Supabase client.
+
+    Use this client from async code so database I/O does not block the event loop.
+
+    Returns:
+        AsyncClient: The global async client instance
+
+    Raises:
+        RuntimeError: If called before init_async_supabase_client()
+    """
+    if _async_supabase is None:
+        raise RuntimeError("Async Supabase client is not initialized")
+    return _async_supabase
+
+
+__all__ = [
+    "supabase",
+    "supabase_read",
+    "get_supabase_client",
+    "get_supabase_read_client",
+    "init_async_supabase_client",
+    "get_async_supabase_client",
+]
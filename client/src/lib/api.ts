@@ -145,6 +145,7 @@ export const endpoints = {
 
   // Chat/Messages
   chat: {
+    bootstrap: '/api/chat/bootstrap',
     conversations: '/api/chat/conversations',
     messages: (conversationId: string) => `/api/chat/conversations/${conversationId}/messages`,
     send: (conversationId: string) => `/api/chat/conversations/${conversationId}/messages`,